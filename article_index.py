@@ -0,0 +1,109 @@
+import json
+import threading
+import time
+
+from sqlite_db import LazyConnection
+
+# 매물 변경 여부 판단에 쓰는 목록 API 필드
+FINGERPRINT_FIELDS = ('articleConfirmYmd', 'priceChangeState', 'isPriceModification', 'dealOrWarrantPrc')
+
+NEW = 'new'
+CHANGED = 'changed'
+UNCHANGED = 'unchanged'
+
+
+def article_key(article):
+    return str(article.get('articleNo') or article.get('articleNumber'))
+
+
+def article_fingerprint(article):
+    return json.dumps([article.get(field) for field in FINGERPRINT_FIELDS], ensure_ascii=False, default=str)
+
+
+# 매물 테이블 (scope 별 판매중 매물 조회용 인덱스)
+ARTICLES_SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS articles ('
+    ' article_no TEXT PRIMARY KEY,'
+    ' scope TEXT,'
+    ' fingerprint TEXT,'
+    ' detail TEXT,'
+    ' last_seen REAL,'
+    ' active INTEGER)',
+    'CREATE INDEX IF NOT EXISTS articles_scope ON articles (scope, active)',
+]
+
+
+# 이전 수집 결과를 articleNo 기준으로 저장해, 새로 생기거나 바뀐 매물만 상세 조회하도록 하는 인덱스
+class ArticleIndex:
+    def __init__(self, path='.cache/article_index.sqlite'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = LazyConnection(path, ARTICLES_SCHEMA)
+
+    # 목록 결과를 인덱스와 비교해 {articleNo: 'new'|'changed'|'unchanged'} 와 삭제된 매물 번호 목록을 반환
+    def diff(self, scope, articles):
+        with self._lock:
+            known = dict(self._db.conn.execute(
+                'SELECT article_no, fingerprint FROM articles WHERE scope = ? AND active = 1', (scope,)
+            ).fetchall())
+
+        status = {}
+        for article in articles:
+            key = article_key(article)
+            if key not in known:
+                # 다른 지역에서 수집된 적 있는 매물일 수 있으므로 scope와 무관하게 한 번 더 확인
+                previous = self._previous(key)
+                if previous is None or not previous[1]:
+                    # 처음 보는 매물, 또는 삭제로 기록되었다가 다시 올라온 매물 (상세 조회 후 update 에서 다시 active)
+                    status[key] = NEW
+                else:
+                    status[key] = UNCHANGED if previous[0] == article_fingerprint(article) else CHANGED
+            elif known[key] == article_fingerprint(article):
+                status[key] = UNCHANGED
+            else:
+                status[key] = CHANGED
+
+        delisted = [key for key in known if key not in status]
+        return status, delisted
+
+    # scope 에서 현재 판매중으로 기록된 매물 번호 (목록을 페이지별로 diff 할 때 삭제 매물 계산용)
+    def active_keys(self, scope):
+        with self._lock:
+            return {row[0] for row in self._db.conn.execute(
+                'SELECT article_no FROM articles WHERE scope = ? AND active = 1', (scope,)
+            )}
+
+    # (fingerprint, active), 기록이 없으면 None
+    def _previous(self, key):
+        with self._lock:
+            return self._db.conn.execute('SELECT fingerprint, active FROM articles WHERE article_no = ?', (key,)).fetchone()
+
+    def get_detail(self, key):
+        with self._lock:
+            row = self._db.conn.execute('SELECT detail FROM articles WHERE article_no = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def update(self, scope, article, detail=None):
+        key = article_key(article)
+        detail_json = json.dumps(detail, ensure_ascii=False, default=str) if detail is not None else None
+        with self._lock:
+            if detail_json is None:
+                # 상세 조회를 건너뛴 매물은 기존 상세 정보를 유지
+                self._db.conn.execute(
+                    'INSERT INTO articles (article_no, scope, fingerprint, detail, last_seen, active) VALUES (?, ?, ?, NULL, ?, 1) '
+                    'ON CONFLICT(article_no) DO UPDATE SET scope = excluded.scope, fingerprint = excluded.fingerprint, '
+                    'last_seen = excluded.last_seen, active = 1',
+                    (key, scope, article_fingerprint(article), time.time()),
+                )
+            else:
+                self._db.conn.execute(
+                    'INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, 1)',
+                    (key, scope, article_fingerprint(article), detail_json, time.time()),
+                )
+
+    def mark_delisted(self, keys):
+        with self._lock:
+            self._db.conn.executemany('UPDATE articles SET active = 0 WHERE article_no = ?', [(key,) for key in keys])
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,158 @@
+import contextvars
+import json
+import os
+import queue
+import shutil
+import threading
+
+from region_index import load_region_index, DONG
+
+DONE = 'done'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+
+# 읍/면/동 단위 코드 (시군구 자체 '...00000' 와 리 코드 제외)
+def is_dong_code(code):
+    return code.endswith('00') and not code.endswith('00000')
+
+
+# 시도/시군구 cortarNo 에 속한 모든 읍면동 (시군구 자체를 나타내는 '...00000' 코드와 리 코드는 제외)
+# 리(끝 두 자리가 00 이 아닌 코드)는 상위 읍/면과 이름이 같고, 읍/면 코드로 조회하면 리 매물까지 함께 나온다.
+# 읍면동 cortarNo 를 넘기면 해당 읍면동 하나만 반환
+def dong_targets(cortar_no, json_path='district.json'):
+    region_index = load_region_index(json_path)
+    cortar_no = str(cortar_no)
+    if cortar_no[5:].strip('0'):
+        dong = region_index.get(cortar_no)
+        return [{'code': dong.code, 'name': dong.name}] if dong else []
+
+    region_code = cortar_no[:2] if cortar_no[2:] == '0' * (len(cortar_no) - 2) else cortar_no[:5]
+
+    return [
+        {'code': dong.code, 'name': dong.name}
+        for dong in region_index.descendants(region_code, level=DONG)
+        if is_dong_code(dong.code)
+    ]
+
+
+# 읍면동 단위 수집 결과를 디스크에 남겨, 중단된 배치를 이어서 수집할 수 있게 하는 체크포인트
+class BatchCheckpoint:
+    def __init__(self, directory):
+        self.directory = directory
+        self.state_path = os.path.join(directory, 'state.json')
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+        else:
+            self.state = {'done': {}, 'failed': {}}
+
+    def is_done(self, dong_code):
+        return dong_code in self.state['done']
+
+    # rows 는 list 또는 순회할 때 row 를 만드는 iterable (ComplexListings 등) - 한 row 씩 파일에 쓴다
+    def save_result(self, dong_code, rows):
+        count = 0
+        with open(os.path.join(self.directory, f'{dong_code}.json'), 'w', encoding='utf-8') as f:
+            f.write('[')
+            for row in rows:
+                if count:
+                    f.write(',')
+                json.dump(row, f, ensure_ascii=False, default=str)
+                count += 1
+            f.write(']')
+        with self._lock:
+            self.state['done'][dong_code] = count
+            self.state['failed'].pop(dong_code, None)
+            self._write_state()
+
+    def save_failure(self, dong_code, error):
+        with self._lock:
+            self.state['failed'][dong_code] = str(error)
+            self._write_state()
+
+    def load_result(self, dong_code):
+        with open(os.path.join(self.directory, f'{dong_code}.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    # 완료된 읍면동 결과를 입력 순서대로 한 읍면동씩 읽어 row 단위로 반환 (전체를 메모리에 올리지 않음)
+    def iter_results(self, dongs):
+        for dong in dongs:
+            if self.is_done(dong['code']):
+                yield from self.load_result(dong['code'])
+
+    def _write_state(self):
+        # 쓰는 도중 중단되어도 state.json 이 깨지지 않도록 임시 파일 후 교체
+        temp_path = self.state_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        os.replace(temp_path, self.state_path)
+
+    def reset(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory, exist_ok=True)
+        self.state = {'done': {}, 'failed': {}}
+
+
+# 여러 읍면동을 작업 큐에 넣고 정해진 동시성 안에서 수집
+#
+# collect_dong(dong) 은 worker 스레드에서 호출되고 해당 동의 row 목록을 반환한다 (반환된 row 는 바로 체크포인트 파일로 저장).
+# on_progress(dong, status, finished, total) 는 run() 을 호출한 스레드에서 호출되므로 UI 갱신에 사용할 수 있다.
+class BatchCollector:
+    def __init__(self, collect_dong, checkpoint, max_concurrency=2, on_progress=None):
+        self.collect_dong = collect_dong
+        self.checkpoint = checkpoint
+        self.max_concurrency = max_concurrency
+        self.on_progress = on_progress
+
+    def run(self, dongs):
+        work_queue = queue.Queue()
+        events = queue.Queue()
+        total = len(dongs)
+        finished = 0
+
+        for dong in dongs:
+            if self.checkpoint.is_done(dong['code']):
+                finished += 1
+                self._progress(dong, SKIPPED, finished, total)
+            else:
+                work_queue.put(dong)
+
+        def worker():
+            while True:
+                try:
+                    dong = work_queue.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    rows = self.collect_dong(dong)
+                    self.checkpoint.save_result(dong['code'], rows)
+                    events.put((dong, DONE))
+                except Exception as e:
+                    self.checkpoint.save_failure(dong['code'], e)
+                    events.put((dong, FAILED))
+
+        pending = work_queue.qsize()
+        # worker 는 run() 을 호출한 쪽의 컨텍스트 (작업별 통계/요청 속도) 를 이어받는다
+        workers = [threading.Thread(target=contextvars.copy_context().run, args=(worker,), daemon=True)
+                   for _ in range(min(self.max_concurrency, pending))]
+        for thread in workers:
+            thread.start()
+
+        for _ in range(pending):
+            dong, status = events.get()
+            finished += 1
+            self._progress(dong, status, finished, total)
+
+        for thread in workers:
+            thread.join()
+
+        # 결과는 체크포인트에만 저장하고, checkpoint.iter_results(dongs) 로 읽는다
+        return self.checkpoint
+
+    def _progress(self, dong, status, finished, total):
+        if self.on_progress:
+            self.on_progress(dong, status, finished, total)
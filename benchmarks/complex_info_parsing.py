@@ -0,0 +1,42 @@
+import sys
+import time
+
+from complex_info import lxml_html, parse_complex_info, parse_complex_info_bs4
+
+
+# 단지 정보 페이지 하나를 html.parser / lxml 로 파싱한 시간 비교 (같은 결과인지 함께 확인)
+def benchmark_complex_info(content, terms, repeat=20):
+    timings = {}
+    results = {}
+    parsers = [('html.parser', parse_complex_info_bs4)]
+    if lxml_html is not None:
+        parsers.append(('lxml', parse_complex_info))
+
+    for name, parser in parsers:
+        elapsed = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results[name] = parser(content, terms)
+            elapsed.append(time.perf_counter() - start)
+        timings[name] = min(elapsed)
+
+    line = f"page: {len(content):,} bytes, html.parser: {timings['html.parser'] * 1000:.2f}ms"
+    if 'lxml' in timings:
+        line += (f", lxml: {timings['lxml'] * 1000:.2f}ms, speedup: {timings['html.parser'] / timings['lxml']:.1f}x, "
+                 f"same output: {results['lxml'] == results['html.parser']}")
+    print(line)
+    return timings
+
+
+if __name__ == '__main__':
+    # 사용법: python -m benchmarks.complex_info_parsing <단지번호 또는 저장한 HTML 파일> [반복 횟수]
+    from naver_land import APT_DETAIL_TERMS, client
+
+    target = sys.argv[1]
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    if target.isdigit():
+        page = client.get(f'https://fin.land.naver.com/complexes/{target}?tab=complex-info').content
+    else:
+        with open(target, 'rb') as f:
+            page = f.read()
+    benchmark_complex_info(page, APT_DETAIL_TERMS, repeat)
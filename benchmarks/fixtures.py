@@ -0,0 +1,214 @@
+import json
+import os
+import sys
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+NEW_LAND = 'new.land.naver.com'
+FIN_LAND = 'fin.land.naver.com'
+
+# 녹화/생성 대상 엔드포인트
+REGION_LIST_URL = 'https://new.land.naver.com/api/regions/list?cortarNo={}'
+COMPLEX_LIST_URL = 'https://new.land.naver.com/api/regions/complexes?cortarNo={}&realEstateType=A1&order=&page={}'
+COMPLEX_INFO_URL = 'https://fin.land.naver.com/complexes/{}?tab=complex-info'
+FRONT_API_URL = 'https://fin.land.naver.com/front-api/v1/complex/article/list?complexNumber={}&userChannelType=PC&page={}'
+VL_LIST_URL = 'https://new.land.naver.com/api/articles?cortarNo={}&realEstateType=VL&tradeType=A1&priceType=RETAIL&page={}'
+VL_DETAIL_URL = 'https://new.land.naver.com/api/articles/{}'
+
+JSON_TYPE = 'application/json; charset=utf-8'
+HTML_TYPE = 'text/html; charset=utf-8'
+
+
+# 호스트 + 경로 + 정렬된 쿼리 (쿼리 순서가 달라도 같은 응답을 찾도록)
+def fixture_key(url):
+    parsed = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return f'{parsed.netloc}{parsed.path}?{query}'
+
+
+# URL 별 응답 (status, content-type, body) 모음
+class FixtureSet:
+    def __init__(self):
+        self.responses = {}
+        # 벤치마크 시나리오: {'name', 'dong_code', 'dong_name', 'property_type'} 목록
+        self.scenarios = []
+
+    def __len__(self):
+        return len(self.responses)
+
+    def add(self, url, body, status=200, content_type=JSON_TYPE):
+        if not isinstance(body, bytes):
+            body = json.dumps(body, ensure_ascii=False).encode('utf-8') if not isinstance(body, str) else body.encode('utf-8')
+        self.responses[fixture_key(url)] = (status, content_type, body)
+
+    def lookup(self, url):
+        return self.responses.get(fixture_key(url))
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        index = {}
+        for number, (key, (status, content_type, body)) in enumerate(sorted(self.responses.items())):
+            file_name = f'{number:05d}' + ('.html' if content_type.startswith('text/html') else '.json')
+            with open(os.path.join(directory, file_name), 'wb') as f:
+                f.write(body)
+            index[key] = {'status': status, 'content_type': content_type, 'file': file_name}
+        with open(os.path.join(directory, 'index.json'), 'w', encoding='utf-8') as f:
+            json.dump({'responses': index, 'scenarios': self.scenarios}, f, ensure_ascii=False, indent=1)
+
+    @classmethod
+    def load(cls, directory):
+        fixtures = cls()
+        with open(os.path.join(directory, 'index.json'), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        for key, entry in index['responses'].items():
+            with open(os.path.join(directory, entry['file']), 'rb') as f:
+                fixtures.responses[key] = (entry['status'], entry['content_type'], f.read())
+        fixtures.scenarios = index.get('scenarios', [])
+        return fixtures
+
+
+def _complex_info_html(complex_no, name, padding):
+    terms = {
+        '공급면적': '112.4㎡', '전용면적': '84.97㎡', '해당면적 세대수': '240세대', '현관구조': '계단식', '방/욕실': '3/2개',
+        '위치': '101동', '사용승인일': '2005.06.30', '세대수': '1,200세대', '난방': '개별난방, 도시가스', '주차': '1,500대(세대당 1.25대)',
+        '전기차 충전시설': '지하 10대', '용적률/건폐율': '250%/18%', '관리사무소 전화': '02-000-0000', '건설사': '샘플건설',
+    }
+    items = ''.join(
+        f'<li class="DataList_item__T1hMR"><div class="DataList_term__Tks7l">{term}</div>'
+        f'<div class="DataList_definition__d9KY1">{definition}</div></li>'
+        for term, definition in terms.items()
+    )
+    # 실제 페이지처럼 스크립트/마크업이 대부분을 차지하도록 채움
+    script = '<script>self.__next_f.push([1,"' + 'x' * padding + '"])</script>'
+    return (f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{name}</title>{script}</head><body>'
+            f'<div class="ComplexSummary_summary__x1"><span class="ComplexSummary_name__vX3IN">{name}</span></div>'
+            f'<ul class="DataList_list__a1">{items}</ul></body></html>')
+
+
+def _front_article(complex_no, name, number, duplicates):
+    article = {
+        'articleNumber': str(number), 'complexName': name, 'dongName': f'{101 + number % 12}동', 'tradeType': 'A1',
+        'spaceInfo': {'exclusiveSpace': 84.97, 'supplySpace': 112.4, 'nameType': 'A'},
+        'articleDetail': {'floorInfo': f'{number % 25 + 1}/25', 'articleFeatureDescription': '남향, 올수리', 'direction': 'SS',
+                          'articleNumber': str(number)},
+        'priceInfo': {'dealPrice': 1_2000_0000 + (number % 500) * 100_0000}, 'brokerageName': '샘플공인중개사',
+        'articleMediaDto': {'imageUrl': f'https://landthumb-phinf.pstatic.net/{complex_no}/{number}.jpg'},
+    }
+    duplicated = None
+    if duplicates:
+        duplicated = {'articleInfoList': [
+            dict(article, brokerInfo={'brokerageName': f'중개사{i}'},
+                 articleDetail=dict(article['articleDetail'], articleNumber=str(number * 10 + i)))
+            for i in range(duplicates)
+        ]}
+    return {'representativeArticleInfo': article, 'duplicatedArticlesInfo': duplicated}
+
+
+# 읍면동 하나에 대한 가상 응답 생성 (APT 단지 complexes 개 × 단지당 매물 articles 개, VL 매물 vl_articles 개)
+def add_synthetic_dong(fixtures, dong_code, dong_name, complexes, articles, vl_articles, page_size=20, padding=150_000):
+    complex_list = []
+    for index in range(complexes):
+        complex_no = str(int(dong_code[-5:]) * 1000 + index)
+        name = f'{dong_name}샘플{index + 1}단지'
+        complex_list.append({'complexNo': complex_no, 'complexName': name, 'buildYear': 1990 + index % 30,
+                             'totalHouseholdCount': 300 + index * 10, 'areaSize': 84, 'price': None, 'address': dong_name, 'floor': 25})
+        fixtures.add(COMPLEX_INFO_URL.format(complex_no), _complex_info_html(complex_no, name, padding), content_type=HTML_TYPE)
+
+        items = [_front_article(complex_no, name, int(complex_no) * 10_000 + n, duplicates=2 if n % 5 == 0 else 0) for n in range(articles)]
+        pages = [items[i:i + page_size] for i in range(0, len(items), page_size)] or [[]]
+        for page, page_items in enumerate(pages):
+            fixtures.add(FRONT_API_URL.format(complex_no, page),
+                         {'isSuccess': True, 'result': {'hasNextPage': page < len(pages) - 1, 'list': page_items}})
+    fixtures.add(COMPLEX_LIST_URL.format(dong_code, 1), {'complexList': complex_list, 'isMoreData': False})
+
+    vl_list = []
+    for index in range(vl_articles):
+        article_no = str(int(dong_code[-5:]) * 100_000 + index)
+        price = f'{2 + index % 5}억 {index % 10 * 1000:,}' if index % 10 else f'{2 + index % 5}억'
+        vl_list.append({'articleNo': article_no, 'articleName': f'{dong_name} 빌라{index}', 'tradeTypeCode': 'A1', 'tradeTypeName': '매매',
+                        'floorInfo': f'{index % 5 + 1}/5', 'dealOrWarrantPrc': price, 'area1': 59.5, 'area2': 45.2, 'direction': '남향',
+                        'articleConfirmYmd': '20250101', 'realtorName': '샘플공인중개사',
+                        'latitude': round(37.5 + index * 0.0001, 6), 'longitude': 127.0})
+        fixtures.add(VL_DETAIL_URL.format(article_no), {
+            'articleDetail': {'articleNo': article_no, 'articleName': f'{dong_name} 빌라{index}', 'cortarNo': dong_code,
+                              'buildingTypeName': '다세대', 'realestateTypeName': '빌라', 'tradeTypeName': '매매',
+                              'roomCount': '2', 'bathroomCount': '1', 'detailDescription': '샘플 설명 ' * 20, 'tagList': ['역세권']},
+            'articleAddition': {'dealOrWarrantPrc': price},
+        })
+    # 빌라 목록은 실제 API 처럼 page=1 부터 나눠서 응답
+    vl_pages = [vl_list[i:i + page_size] for i in range(0, len(vl_list), page_size)] or [[]]
+    for page, page_items in enumerate(vl_pages, start=1):
+        fixtures.add(VL_LIST_URL.format(dong_code, page), {'articleList': page_items, 'isMoreData': page < len(vl_pages)})
+
+
+# 작은/중간/큰 읍면동 시나리오 (이름, 단지 수, 단지당 매물 수, VL 매물 수)
+DEFAULT_SIZES = [('small', 3, 10, 10), ('medium', 10, 40, 50), ('large', 30, 80, 200)]
+
+
+def synthetic_fixtures(sizes=DEFAULT_SIZES, padding=150_000):
+    fixtures = FixtureSet()
+    for number, (name, complexes, articles, vl_articles) in enumerate(sizes):
+        dong_code = f'99999{number + 1:03d}00'
+        dong_name = f'벤치{name}동'
+        add_synthetic_dong(fixtures, dong_code, dong_name, complexes, articles, vl_articles, padding=padding)
+        for property_type in ('APT', 'VL'):
+            fixtures.scenarios.append({'name': f'{name}-{property_type}', 'dong_code': dong_code, 'dong_name': dong_name,
+                                       'property_type': property_type})
+    return fixtures
+
+
+# 실제 네이버 응답을 녹화 (읍면동 하나의 APT/VL 수집에 쓰이는 모든 요청)
+def record_dong(fixtures, client, dong_code, dong_name, max_complexes=None, max_vl_articles=None):
+    def record(url, referer=None):
+        response = client.get(url, referer=referer)
+        fixtures.add(url, response.content, status=response.status_code,
+                     content_type=response.headers.get('content-type', JSON_TYPE))
+        return response
+
+    def record_list(url, referer, list_key):
+        items, page = [], 1
+        while True:
+            data = record(url.format(dong_code, page), referer=referer).json()
+            items.extend(data.get(list_key) or [])
+            if not data.get('isMoreData'):
+                return items
+            page += 1
+
+    complex_list = record_list(COMPLEX_LIST_URL, 'https://new.land.naver.com/complexes', 'complexList')
+    for complex_info in complex_list[:max_complexes]:
+        complex_no = complex_info['complexNo']
+        record(COMPLEX_INFO_URL.format(complex_no))
+        page = 0
+        while True:
+            result = record(FRONT_API_URL.format(complex_no, page)).json().get('result') or {}
+            if not result.get('hasNextPage'):
+                break
+            page += 1
+
+    vl_list = record_list(VL_LIST_URL, 'https://new.land.naver.com/houses?a=VL&b=A1&e=RETAIL', 'articleList')
+    for article in vl_list[:max_vl_articles]:
+        record(VL_DETAIL_URL.format(article['articleNo']),
+               referer=f"https://new.land.naver.com/houses?a=VL&e=RETAIL&articleNo={article['articleNo']}")
+
+    for property_type in ('APT', 'VL'):
+        fixtures.scenarios.append({'name': f'{dong_code}-{property_type}', 'dong_code': dong_code, 'dong_name': dong_name,
+                                   'property_type': property_type})
+
+
+if __name__ == '__main__':
+    # 사용법: python -m benchmarks.fixtures <저장 디렉토리> <읍면동 cortarNo>... (실제 네이버 응답 녹화)
+    #        python -m benchmarks.fixtures <저장 디렉토리> --synthetic       (가상 응답 생성)
+    from naver_client import NaverClient
+    from region_index import load_region_index
+
+    directory, targets = sys.argv[1], sys.argv[2:]
+    if targets == ['--synthetic']:
+        fixture_set = synthetic_fixtures()
+    else:
+        fixture_set = FixtureSet()
+        naver = NaverClient()
+        region_index = load_region_index('district.json')
+        for target in targets:
+            region = region_index.get(target)
+            record_dong(fixture_set, naver, target, region.name if region else target)
+    fixture_set.save(directory)
+    print(f'{len(fixture_set)}개 응답 저장: {directory}')
@@ -0,0 +1,99 @@
+import time
+import tracemalloc
+
+from front_api import ARTICLE_URL, DIRECTION_NAMES, ComplexArticles
+from prices import format_amount
+
+
+# 기존 방식 (매물마다 temp dict 갱신 후 단지 정보와 병합, 벤치마크 비교용)
+def flatten_front_api_legacy(front_lists, detail_dict):
+    article_listing = []
+    temp_article_listing = {}
+    for front_list in front_lists:
+        for f_l in front_list:
+            article_info = f_l.get('representativeArticleInfo')
+            duplicate_article_info = f_l.get('duplicatedArticlesInfo')
+            article_name = article_info.get('complexName') + ' ' + article_info.get('dongName')
+            exclusive_space_info = str(article_info.get('spaceInfo').get('exclusiveSpace')) + article_info.get('spaceInfo').get('nameType')
+            supply_space_info = str(article_info.get('spaceInfo').get('supplySpace')) + article_info.get('spaceInfo').get('nameType')
+
+            if article_info.get('tradeType') == 'A1':
+                temp_article_listing['매물명'] = article_name
+                temp_article_listing['거래방식'] = '매매'
+                temp_article_listing['층수'] = article_info.get('articleDetail').get('floorInfo') + '층'
+                temp_article_listing['면적'] = exclusive_space_info + '㎡' + '(' + supply_space_info + ')'
+                temp_article_listing['코멘트'] = article_info.get('articleDetail').get('articleFeatureDescription')
+                temp_article_listing['방향'] = DIRECTION_NAMES.get(article_info.get('articleDetail').get('direction'))
+                temp_article_listing['exclusiveSpace'] = article_info.get('spaceInfo').get('exclusiveSpace')
+                temp_article_listing['supplySpace'] = article_info.get('spaceInfo').get('supplySpace')
+                temp_article_listing['floorInfo'] = article_info.get('articleDetail').get('floorInfo')
+
+                if duplicate_article_info:
+                    for a_i in duplicate_article_info.get('articleInfoList'):
+                        price_info = a_i.get('priceInfo').get('dealPrice')
+                        temp_article_listing['매매가'] = format_amount(price_info)
+                        temp_article_listing['dealPrice'] = price_info
+                        temp_article_listing['articleNumber'] = a_i.get('articleDetail').get('articleNumber')
+                        temp_article_listing['매물link'] = ARTICLE_URL + a_i.get('articleDetail').get('articleNumber')
+                        temp_article_listing['중개업체'] = a_i.get('brokerInfo').get('brokerageName')
+                        temp_article_listing['이미지'] = a_i.get('articleMediaDto').get('imageUrl')
+                        article_listing.append({**detail_dict, **temp_article_listing})
+                else:
+                    price_info = article_info.get('priceInfo').get('dealPrice')
+                    temp_article_listing['매매가'] = format_amount(price_info)
+                    temp_article_listing['dealPrice'] = price_info
+                    temp_article_listing['articleNumber'] = article_info.get('articleNumber')
+                    temp_article_listing['매물link'] = ARTICLE_URL + article_info.get('articleNumber')
+                    temp_article_listing['중개업체'] = article_info.get('brokerageName')
+                    temp_article_listing['이미지'] = article_info.get('articleMediaDto').get('imageUrl')
+                    article_listing.append({**detail_dict, **temp_article_listing})
+    return article_listing
+
+
+def _sample_page(count, page_size=20):
+    def article(n):
+        return {
+            'articleNumber': str(2500000000 + n), 'complexName': '샘플아파트', 'dongName': f'{100 + n % 20}동', 'tradeType': 'A1',
+            'spaceInfo': {'exclusiveSpace': 84.97, 'supplySpace': 112.4, 'nameType': 'A'},
+            'articleDetail': {'floorInfo': f'{n % 25 + 1}/25', 'articleFeatureDescription': '남향 올수리', 'direction': 'SS',
+                              'articleNumber': str(2500000000 + n)},
+            'priceInfo': {'dealPrice': 1_2300_0000 + n * 10_000}, 'brokerageName': '샘플부동산', 'articleMediaDto': {'imageUrl': 'https://img/sample.jpg'},
+        }
+
+    items = [{'representativeArticleInfo': article(n), 'duplicatedArticlesInfo': None} for n in range(count)]
+    return [items[i:i + page_size] for i in range(0, count, page_size)]
+
+
+def _measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def benchmark_flatten(count=10000):
+    pages = _sample_page(count)
+    detail_dict = {'complexNo': '100', 'complexName': '샘플아파트', **{f'term{i}': f'value{i}' for i in range(14)}}
+
+    def flatten():
+        complex_articles = ComplexArticles(detail_dict)
+        for page in pages:
+            complex_articles.add_page(page)
+        return complex_articles
+
+    legacy, legacy_time, legacy_peak = _measure(lambda: flatten_front_api_legacy(pages, detail_dict))
+    records, record_time, record_peak = _measure(flatten)
+    rows, rows_time, _ = _measure(lambda: list(records.iter_rows()))
+    # 매매가 문자열은 출력 단계에서 만들므로 비교에서 제외
+    legacy = [{key: value for key, value in row.items() if key != '매매가'} for row in legacy]
+
+    print(f"articles: {count:,}, legacy: {legacy_time * 1000:.1f}ms / {legacy_peak / 2 ** 20:.1f}MB, "
+          f"records: {record_time * 1000:.1f}ms / {record_peak / 2 ** 20:.1f}MB "
+          f"(+ rows at export: {rows_time * 1000:.1f}ms), same output: {legacy == rows}")
+
+
+if __name__ == '__main__':
+    benchmark_flatten()
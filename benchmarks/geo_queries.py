@@ -0,0 +1,43 @@
+import time
+
+import numpy as np
+
+from geo_index import GeoIndex, haversine_m
+
+
+# 격자 인덱스 반경/영역 조회 vs 전체 스캔 (같은 결과인지 함께 확인)
+def benchmark_geo(count=300_000, queries=1_000, radius_m=500):
+    rng = np.random.default_rng(0)
+    # 서울 정도 크기의 영역
+    latitudes = rng.uniform(37.42, 37.70, count)
+    longitudes = rng.uniform(126.76, 127.18, count)
+    centers = np.column_stack([rng.uniform(37.45, 37.67, queries), rng.uniform(126.80, 127.14, queries)])
+
+    start = time.perf_counter()
+    index = GeoIndex(latitudes, longitudes)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [index.within(latitude, longitude, radius_m) for latitude, longitude in centers]
+    radius_time = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    boxes = [index.in_bbox(latitude - 0.005, longitude - 0.006, latitude + 0.005, longitude + 0.006) for latitude, longitude in centers]
+    bbox_time = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    same = True
+    for (latitude, longitude), positions, box in zip(centers[:50], results, boxes):
+        distances = haversine_m(latitude, longitude, latitudes, longitudes)
+        same &= set(np.flatnonzero(distances <= radius_m)) == set(positions)
+        same &= np.array_equal(np.flatnonzero((latitudes >= latitude - 0.005) & (latitudes <= latitude + 0.005)
+                                              & (longitudes >= longitude - 0.006) & (longitudes <= longitude + 0.006)), box)
+    scan_time = (time.perf_counter() - start) / 50
+
+    print(f"points: {count:,}, build: {build_time * 1000:.1f}ms, radius {radius_m}m: {radius_time * 1000:.3f}ms "
+          f"(avg {np.mean([len(r) for r in results]):.0f} rows), bbox: {bbox_time * 1000:.3f}ms, full scan: {scan_time * 1000:.1f}ms, "
+          f"same output: {bool(same)}")
+
+
+if __name__ == '__main__':
+    benchmark_geo()
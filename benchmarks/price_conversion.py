@@ -0,0 +1,30 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from prices import format_amount, format_prices, parse_price, parse_prices
+
+
+# 금액 파싱/포맷: 한 건씩 처리 vs 벡터 처리 (같은 결과인지 함께 확인)
+def benchmark_prices(count=200_000):
+    rng = np.random.default_rng(0)
+    amounts = pd.Series(rng.integers(1, 300, count) * 1000_0000 + rng.integers(0, 10, count) * 100_0000)
+    texts = format_prices(amounts).str.replace('만', '', regex=False)
+
+    start = time.perf_counter()
+    formatted = [format_amount(amount) for amount in amounts.tolist()]
+    parsed = [parse_price(text) for text in texts.tolist()]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vector_formatted = format_prices(amounts)
+    vector_parsed = parse_prices(texts)
+    vector_time = time.perf_counter() - start
+
+    print(f"prices: {count:,}, per-row: {scalar_time * 1000:.1f}ms, vectorized: {vector_time * 1000:.1f}ms, "
+          f"same output: {formatted == vector_formatted.tolist() and parsed == vector_parsed.tolist()}")
+
+
+if __name__ == '__main__':
+    benchmark_prices()
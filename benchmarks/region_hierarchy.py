@@ -0,0 +1,80 @@
+import json
+import sys
+import time
+
+import pandas as pd
+
+from public_reader import build_region_hierarchy
+
+
+# public_reader.build_region_hierarchy 이전의 groupby + iterrows 방식 (결과/속도 비교용)
+def build_region_hierarchy_legacy(df):
+    result = []
+
+    # 시도 기준 그룹화
+    sido_grouped = df.groupby(['시도코드', '시도명'])
+    for (sido_code, sido_name), sido_df in sido_grouped:
+        sigungu_list = []
+
+        # 시군구 기준 그룹화
+        sigungu_grouped = sido_df.groupby(['시군구코드', '시군구명'])
+        for (sigungu_code, sigungu_name), sigungu_df in sigungu_grouped:
+            eup_myeon_dong_list = []
+
+            # 읍면동 추가
+            for _, row in sigungu_df.iterrows():
+                eup_myeon_dong_list.append({
+                    "code": row['법정동코드'],
+                    "name": row['읍면동명']
+                })
+
+            sigungu_list.append({
+                "sigungu_code": sigungu_code,
+                "sigungu_name": sigungu_name,
+                "eup_myeon_dong": eup_myeon_dong_list
+            })
+
+        result.append({
+            "si_do_code": sido_code,
+            "si_do_name": sido_name,
+            "sigungu": sigungu_list
+        })
+
+    return result
+
+
+
+
+def benchmark_region_hierarchy(df, repeat=3):
+    timings = {}
+    for name, builder in (('legacy', build_region_hierarchy_legacy), ('vectorized', build_region_hierarchy)):
+        elapsed = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = builder(df)
+            elapsed.append(time.perf_counter() - start)
+        timings[name] = min(elapsed)
+        timings[f'{name}_result'] = result
+
+    same = json.dumps(timings.pop('legacy_result'), ensure_ascii=False) == json.dumps(timings.pop('vectorized_result'), ensure_ascii=False)
+    print(f"rows: {len(df)}, legacy: {timings['legacy']:.3f}s, vectorized: {timings['vectorized']:.3f}s, "
+          f"speedup: {timings['legacy'] / timings['vectorized']:.1f}x, same output: {same}")
+    return timings
+
+
+# district.json 을 공공데이터 법정동 코드 표(pdr.code_bdong) 와 같은 컬럼의 DataFrame 으로 펼친다 (네트워크 불필요)
+def district_frame(json_path='district.json', seed=0):
+    with open(json_path, 'r', encoding='utf-8') as f:
+        districts = json.load(f)
+    rows = [
+        {'시도코드': si_do['si_do_code'], '시도명': si_do['si_do_name'], '시군구코드': sigungu['sigungu_code'],
+         '시군구명': sigungu['sigungu_name'], '법정동코드': dong['code'], '읍면동명': dong['name']}
+        for si_do in districts for sigungu in si_do['sigungu'] for dong in sigungu['eup_myeon_dong']
+    ]
+    # 원본 표처럼 정렬되지 않은 순서로 섞는다
+    return pd.DataFrame(rows).sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+if __name__ == '__main__':
+    # 사용법: python -m benchmarks.region_hierarchy [district.json]
+    benchmark_region_hierarchy(district_frame(*sys.argv[1:2]))
@@ -0,0 +1,207 @@
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import naver_land
+from benchmarks.fixtures import DEFAULT_SIZES, FixtureSet, synthetic_fixtures
+from benchmarks.stub_server import StubServer
+from metrics import LATENCY_BUCKETS_MS
+from progress_sink import QuietSink
+
+# 저장소에 함께 두는 기준 결과 (python -m benchmarks.run_benchmark --update-baseline 으로 갱신)
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+# 값이 다르면 요청/결과 건수가 달라지므로 기준 결과와 같아야 비교하는 옵션
+COUNT_OPTIONS = ['fixtures', 'error_rate', 'throttle_rate']
+# 시간까지 비교할 때 (--tolerance) 추가로 같아야 하는 옵션
+BASELINE_OPTIONS = COUNT_OPTIONS + ['latency_ms', 'jitter_ms', 'workers', 'rps', 'memory']
+
+
+# 히스토그램 구간으로 추정한 백분위 응답 시간 (해당 구간의 상한, ms)
+def histogram_percentile(endpoints, percentile):
+    buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    for endpoint in endpoints.values():
+        for index, label in enumerate([f'<={bucket}ms' for bucket in LATENCY_BUCKETS_MS] + [f'>{LATENCY_BUCKETS_MS[-1]}ms']):
+            buckets[index] += endpoint['histogram'].get(label, 0)
+    total = sum(buckets)
+    if not total:
+        return None
+    seen = 0
+    for index, count in enumerate(buckets):
+        seen += count
+        if seen >= total * percentile:
+            return LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else float('inf')
+
+
+# 수집 결과가 차지하는 메모리 (KB) - listings 를 놓기 전후의 tracemalloc 차이
+def retained_kb(release):
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    release()
+    gc.collect()
+    return round((before - tracemalloc.get_traced_memory()[0]) / 1024, 1)
+
+
+# 시나리오 하나 실행 (수집 → DataFrame → 파일 저장) 후 처리량/응답 시간 요약
+#
+# memory=True 이면 collect_dong_listings 가 돌려준 결과를 그대로 들고 있을 때와 row dict 로 모두 펼쳤을 때의 메모리를 함께 잰다.
+def run_scenario(scenario, server, max_workers, export_dir, memory=False):
+    naver_land.metrics.reset()
+    start_requests = server.stats['requests']
+    start = time.perf_counter()
+
+    listings, _ = naver_land.collect_dong_listings(scenario['dong_code'], scenario['dong_name'], scenario['property_type'],
+                                                   sink=QuietSink(), max_workers=max_workers)
+    collected = time.perf_counter()
+    memory_kb = {}
+    # row dict 목록이 아닌 결과 (APT 의 ComplexListings) 만 펼쳐서 비교
+    if memory and not isinstance(listings, list):
+        rows = [list(listings)]
+        memory_kb['rows_kb'] = retained_kb(rows.clear)
+    naver_land.build_result_dataframe(scenario['property_type'], listings, '벤치시', '벤치구', scenario['dong_name'])
+    naver_land.export_listings(listings, scenario['property_type'], os.path.join(export_dir, scenario['name']), '벤치시', '벤치구',
+                               scenario['dong_name'])
+    finished = time.perf_counter()
+
+    listing_count = len(listings)
+    if memory:
+        kept = [listings]
+        del listings
+        memory_kb['retained_kb'] = retained_kb(kept.clear)
+        memory_kb.setdefault('rows_kb', memory_kb['retained_kb'])
+
+    summary = naver_land.metrics.summary()
+    requests = server.stats['requests'] - start_requests
+    return {
+        'scenario': scenario['name'],
+        'listings': listing_count,
+        'requests': requests,
+        'collect_s': round(collected - start, 3),
+        'total_s': round(finished - start, 3),
+        'listings_per_s': round(listing_count / (collected - start), 1) if listing_count else 0.0,
+        'requests_per_s': round(requests / (collected - start), 1),
+        'p50_ms': histogram_percentile(summary['endpoints'], 0.5),
+        'p95_ms': histogram_percentile(summary['endpoints'], 0.95),
+        'stages': {name: stage['total_s'] for name, stage in summary['stages'].items()},
+        **memory_kb,
+    }
+
+
+# 시나리오별로 가장 빠른 실행 (--repeat 로 여러 번 돌린 경우 잡음 줄이기)
+def best_results(results):
+    best = {}
+    for result in results:
+        if result['scenario'] not in best or result['collect_s'] < best[result['scenario']]['collect_s']:
+            best[result['scenario']] = result
+    return best
+
+
+# 기준 결과보다 나빠진 시나리오 설명 목록
+#
+# 같은 응답으로 요청 수가 늘었거나 결과 건수가 달라지면 실패로 본다.
+# 수집 시간은 실행 환경마다 달라서 기본으로는 출력만 하고, tolerance 를 주면 기준보다 그 비율을 넘게 늘었을 때 실패로 본다.
+def compare_baseline(results, baseline, tolerance=None):
+    expected = best_results(baseline['results'])
+    regressions = []
+    for name, result in best_results(results).items():
+        base = expected.get(name)
+        if base is None:
+            continue
+        change = result['collect_s'] / base['collect_s'] - 1 if base['collect_s'] else 0.0
+        print(f"{name:>14}: 수집 {result['collect_s']:.3f}s (기준 {base['collect_s']:.3f}s, {change:+.0%})")
+        if tolerance is not None and change > tolerance:
+            regressions.append(f"{name}: 수집 {result['collect_s']:.3f}s > 기준 {base['collect_s']:.3f}s (허용 +{tolerance:.0%})")
+        if result['requests'] > base['requests']:
+            regressions.append(f"{name}: 요청 {result['requests']}건 > 기준 {base['requests']}건")
+        if result['listings'] != base['listings']:
+            regressions.append(f"{name}: 결과 {result['listings']}건 != 기준 {base['listings']}건")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='녹화/가상 응답을 로컬 stub 서버로 재생하는 수집 벤치마크 (네트워크 불필요)')
+    parser.add_argument('--fixtures', help='python -m benchmarks.fixtures 로 저장한 디렉토리 (없으면 가상 응답 생성)')
+    parser.add_argument('--scenario', action='append', help='실행할 시나리오 이름 (여러 번 지정 가능, 기본: 전체)')
+    parser.add_argument('--latency-ms', type=float, default=30.0, help='응답 지연 (ms)')
+    parser.add_argument('--jitter-ms', type=float, default=10.0, help='응답 지연 편차 (ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='500 응답 비율')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='429 응답 비율')
+    parser.add_argument('--workers', type=int, default=4, help='동시에 수집할 단지 수')
+    parser.add_argument('--rps', type=float, default=50.0, help='호스트별 시작 초당 요청 수')
+    parser.add_argument('--repeat', type=int, default=1, help='시나리오별 반복 횟수')
+    parser.add_argument('--memory', action='store_true', help='수집 결과 메모리 측정 (tracemalloc 으로 실행되어 시간은 느려짐)')
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='비교할 기준 결과 (--json 출력 형식, 기본: benchmarks/baseline.json)')
+    parser.add_argument('--tolerance', type=float,
+                        help='수집 시간도 비교할 때 기준보다 느려도 통과로 보는 비율 (예: 0.25, 기본: 요청/결과 건수만 비교)')
+    parser.add_argument('--update-baseline', action='store_true', help='이번 결과를 기준 결과로 저장')
+    args = parser.parse_args(argv)
+
+    fixtures = FixtureSet.load(args.fixtures) if args.fixtures else synthetic_fixtures(DEFAULT_SIZES)
+    scenarios = [scenario for scenario in fixtures.scenarios if not args.scenario or scenario['name'] in args.scenario]
+
+    client = naver_land.client
+    saved = client.cache, client.host_overrides, naver_land.rate_limiter.requests_per_second, naver_land.rate_limiter.max_rate
+    results = []
+    with StubServer(fixtures, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                    throttle_rate=args.throttle_rate) as server, tempfile.TemporaryDirectory() as export_dir:
+        # 캐시를 끄고 stub 서버로 요청
+        client.cache = None
+        client.host_overrides = server.host_overrides()
+        naver_land.rate_limiter.requests_per_second = args.rps
+        naver_land.rate_limiter.max_rate = max(args.rps, naver_land.rate_limiter.max_rate)
+        if args.memory:
+            tracemalloc.start()
+        try:
+            for scenario in scenarios:
+                for _ in range(args.repeat):
+                    result = run_scenario(scenario, server, args.workers, export_dir, memory=args.memory)
+                    results.append(result)
+                    print(f"{result['scenario']:>14}: {result['listings']:>6}건 {result['requests']:>5}요청 "
+                          f"수집 {result['collect_s']:>7.3f}s (전체 {result['total_s']:.3f}s) "
+                          f"{result['listings_per_s']:>8.1f}건/s {result['requests_per_s']:>7.1f}요청/s "
+                          f"p50≤{result['p50_ms']}ms p95≤{result['p95_ms']}ms")
+                    if args.memory:
+                        print(f"{'':>14}  결과 보관 {result['retained_kb']:,.1f}KB (row dict 로 펼치면 {result['rows_kb']:,.1f}KB)")
+        finally:
+            tracemalloc.stop()
+            client.cache, client.host_overrides, naver_land.rate_limiter.requests_per_second, naver_land.rate_limiter.max_rate = saved
+
+    print(f"server: {server.stats}")
+    options = {name: getattr(args, name) for name in BASELINE_OPTIONS}
+    for path in [args.json] + ([args.baseline] if args.update_baseline else []):
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'options': options, 'server': server.stats, 'results': results}, f, ensure_ascii=False, indent=2)
+    if args.update_baseline:
+        print(f"기준 결과를 저장했습니다: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"기준 결과가 없어 비교하지 않습니다: {args.baseline}")
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    compared = BASELINE_OPTIONS if args.tolerance is not None else COUNT_OPTIONS
+    different = [name for name in compared if baseline.get('options', {}).get(name) != options[name]]
+    if different:
+        print(f"기준 결과와 옵션이 달라 비교하지 않습니다: {', '.join(different)}")
+        return 0
+
+    regressions = compare_baseline(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        return 1
+    if args.tolerance is not None:
+        print(f"기준 결과 대비 통과 (요청/결과 건수, 수집 시간 허용 +{args.tolerance:.0%})")
+    else:
+        print("기준 결과 대비 통과 (요청/결과 건수)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
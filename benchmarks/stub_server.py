@@ -0,0 +1,99 @@
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.fixtures import FIN_LAND, NEW_LAND
+
+NOT_FOUND = (404, 'application/json; charset=utf-8', b'{}')
+
+
+# 녹화/생성한 응답을 돌려주는 로컬 HTTP 서버 (지연, 오류, 요청 제한 주입)
+#
+# 요청 경로는 /<원래 호스트>/<원래 경로> 형태이며, NaverClient(host_overrides=server.host_overrides()) 로 연결한다.
+# latency_ms ± jitter_ms 만큼 응답을 지연하고, error_rate 비율로 500, throttle_rate 비율로 429 를 돌려준다.
+class StubServer:
+    def __init__(self, fixtures, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, throttle_rate=0.0, seed=0,
+                 host='127.0.0.1', port=0):
+        self.fixtures = fixtures
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'not_found': 0, 'errors': 0, 'throttled': 0, 'bytes': 0}
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # 헤더/본문을 따로 보내므로 Nagle 로 인한 지연(40ms 내외)이 측정에 섞이지 않도록 끈다
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                status, content_type, body = server.respond(self.path)
+                self.send_response(status)
+                self.send_header('content-type', content_type)
+                self.send_header('content-length', str(len(body)))
+                if status == 429:
+                    self.send_header('retry-after', '0')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def host_overrides(self):
+        return {host: f'{self.base_url}/{host}' for host in (NEW_LAND, FIN_LAND)}
+
+    def respond(self, path):
+        with self._lock:
+            self.stats['requests'] += 1
+            delay = max(0.0, self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+            draw = self._random.random()
+
+        if delay:
+            time.sleep(delay)
+
+        if draw < self.throttle_rate:
+            self._count('throttled')
+            return 429, 'application/json; charset=utf-8', b'{"message": "too many requests"}'
+        if draw < self.throttle_rate + self.error_rate:
+            self._count('errors')
+            return 500, 'application/json; charset=utf-8', b'{"message": "injected error"}'
+
+        response = self.fixtures.lookup('https://' + path.lstrip('/'))
+        if response is None:
+            self._count('not_found')
+            return NOT_FOUND
+        self._count('bytes', len(response[2]))
+        return response
+
+    def _count(self, name, value=1):
+        with self._lock:
+            self.stats[name] += value
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,82 @@
+from bs4 import BeautifulSoup
+
+# lxml 이 설치된 경우 컴파일된 XPath 로 파싱 (없으면 BeautifulSoup html.parser 사용)
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    etree = None
+    lxml_html = None
+
+# 클래스명 뒤의 해시(__vX3IN 등)는 배포마다 바뀔 수 있어 접두어로만 찾는다
+NAME_CLASS = 'ComplexSummary_name__'
+ITEM_CLASS = 'DataList_item__'
+TERM_CLASS = 'DataList_term__'
+DEFINITION_CLASS = 'DataList_definition__'
+
+if etree is not None:
+    # 네이버 페이지는 utf-8 (meta charset 이 없으면 lxml 이 latin-1 로 추측하므로 지정)
+    _UTF8_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+    _NAME_XPATH = etree.XPath(f"//span[contains(@class, '{NAME_CLASS}')]")
+    _ITEM_XPATH = etree.XPath(f"//li[contains(@class, '{ITEM_CLASS}')]")
+    _TERM_XPATH = etree.XPath(f"string(.//div[contains(@class, '{TERM_CLASS}')])")
+    _DEFINITION_XPATH = etree.XPath(f"string(.//div[contains(@class, '{DEFINITION_CLASS}')])")
+
+
+# 단지 정보 페이지 구조가 바뀌어 필요한 항목을 찾지 못한 경우
+class ComplexInfoParseError(ValueError):
+    pass
+
+
+def _check(name, items, source):
+    if not name:
+        raise ComplexInfoParseError(f'{source}: 단지명({NAME_CLASS}*)을 찾지 못했습니다. 페이지 구조가 바뀌었는지 확인하세요.')
+    if not items:
+        raise ComplexInfoParseError(f'{source}: 단지 정보 항목({ITEM_CLASS}*)을 찾지 못했습니다. 페이지 구조가 바뀌었는지 확인하세요.')
+
+
+# 항목은 있는데 요청한 항목명이 하나도 없으면 항목명/값 클래스가 바뀐 것으로 본다
+def _check_details(details, terms, source):
+    if terms and not details:
+        raise ComplexInfoParseError(f'{source}: 요청한 단지 정보 항목({TERM_CLASS}*, {DEFINITION_CLASS}*)을 하나도 찾지 못했습니다. '
+                                    f'페이지 구조가 바뀌었는지 확인하세요.')
+
+
+# 단지 정보 HTML 에서 (단지명, {항목: 값}) 추출 (terms 에 있는 항목만)
+def parse_complex_info(content, terms, source='complex-info'):
+    if lxml_html is None:
+        return parse_complex_info_bs4(content, terms, source)
+
+    root = lxml_html.fromstring(content, parser=_UTF8_PARSER) if isinstance(content, bytes) else lxml_html.fromstring(content)
+    name_tags = _NAME_XPATH(root)
+    name = name_tags[0].text_content().strip() if name_tags else ''
+    items = _ITEM_XPATH(root)
+    _check(name, items, source)
+
+    terms = set(terms)
+    details = {}
+    for item in items:
+        term = _TERM_XPATH(item).strip()
+        if term in terms:
+            details[term] = _DEFINITION_XPATH(item).strip()
+    _check_details(details, terms, source)
+    return name, details
+
+
+# BeautifulSoup(html.parser) 로 추출 (lxml 이 없을 때)
+def parse_complex_info_bs4(content, terms, source='complex-info'):
+    soup = BeautifulSoup(content, 'html.parser')
+    name_tag = soup.find('span', class_=lambda value: value and NAME_CLASS in value)
+    name = name_tag.text.strip() if name_tag else ''
+    items = soup.find_all('li', class_=lambda value: value and ITEM_CLASS in value)
+    _check(name, items, source)
+
+    details = {}
+    for item in items:
+        term_tag = item.find('div', class_=lambda value: value and TERM_CLASS in value)
+        definition_tag = item.find('div', class_=lambda value: value and DEFINITION_CLASS in value)
+        term = term_tag.text.strip() if term_tag else ''
+        if term in terms:
+            details[term] = definition_tag.text.strip() if definition_tag else ''
+    _check_details(details, terms, source)
+    return name, details
@@ -0,0 +1,122 @@
+import hashlib
+import math
+import threading
+
+# 이 이상의 키가 예상되면 정확한 seen-set 대신 Bloom filter 사용 (키당 약 2.4바이트, 오탐률 error_rate)
+BLOOM_MIN_CAPACITY = 2_000_000
+
+# 시/도 전체 수집 시 Bloom filter 크기를 정하기 위한 읍면동당 예상 매물 수
+ESTIMATED_LISTINGS_PER_DONG = 3_000
+
+
+def _key_bytes(key):
+    if isinstance(key, tuple):
+        return '\x1f'.join('' if part is None else str(part) for part in key).encode('utf-8')
+    return str(key).encode('utf-8')
+
+
+# 키를 64bit 정수로 변환 (숫자 매물 번호는 그대로, 나머지는 blake2b 8바이트)
+def key_hash(key):
+    if isinstance(key, int):
+        return key
+    if isinstance(key, str) and key.isascii() and key.isdigit():
+        return int(key)
+    return int.from_bytes(hashlib.blake2b(_key_bytes(key), digest_size=8).digest(), 'little')
+
+
+# 문자열/튜플 대신 64bit 해시만 저장하는 정확한 seen-set
+class SeenSet:
+    def __init__(self):
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._seen)
+
+    # 처음 보는 키이면 True
+    def add(self, key):
+        value = key_hash(key)
+        with self._lock:
+            if value in self._seen:
+                return False
+            self._seen.add(value)
+            return True
+
+    def discard(self, key):
+        with self._lock:
+            self._seen.discard(key_hash(key))
+
+
+# 아주 큰 수집용 Bloom filter (이미 본 키를 놓치지는 않지만, error_rate 확률로 새 키를 본 것으로 판단할 수 있다)
+class BloomFilter:
+    def __init__(self, capacity, error_rate=1e-4):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(_key_bytes(key), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    # 처음 보는 키이면 True (비트를 하나라도 새로 켰을 때)
+    def add(self, key):
+        positions = self._positions(key)
+        added = False
+        with self._lock:
+            bits = self._bits
+            for position in positions:
+                mask = 1 << (position & 7)
+                if not bits[position >> 3] & mask:
+                    bits[position >> 3] |= mask
+                    added = True
+            if added:
+                self._count += 1
+        return added
+
+
+# 매물 중복 제거 (매물 번호 또는 (단지, 동, 층, 면적, 가격) 이 이미 나온 매물은 버린다)
+#
+# 여러 중개업체가 올린 같은 매물(duplicatedArticlesInfo)과, 인접 읍면동 목록에 함께 나오는 매물을
+# 상세 조회/저장 전에 걸러낸다. 읍면동 여러 곳을 동시에 수집할 때 하나를 공유한다 (thread-safe).
+class ListingDeduplicator:
+    def __init__(self, capacity=None, error_rate=1e-4):
+        if capacity and capacity >= BLOOM_MIN_CAPACITY:
+            self.articles = BloomFilter(capacity, error_rate)
+            self.properties = BloomFilter(capacity, error_rate)
+        else:
+            self.articles = SeenSet()
+            self.properties = SeenSet()
+        self.complexes = SeenSet()
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    # 읍면동 수 기준으로 seen-set 종류/크기 결정
+    @classmethod
+    def for_dongs(cls, dong_count, error_rate=1e-4):
+        return cls(dong_count * ESTIMATED_LISTINGS_PER_DONG, error_rate)
+
+    # 다른 읍면동 목록에서 이미 수집했거나 수집 중인 단지이면 False (처음 보는 단지는 수집 중으로 표시)
+    def first_complex(self, complex_no):
+        return self.complexes.add(complex_no)
+
+    # 상세 정보를 받지 못한 단지의 표시를 지워, 뒤에 같은 단지가 나오는 읍면동에서 다시 수집하게 한다
+    def release_complex(self, complex_no):
+        self.complexes.discard(complex_no)
+
+    # 처음 나온 매물이면 True (property_key 가 None 이면 매물 번호로만 판단)
+    def first_listing(self, article_number, property_key):
+        # 두 키 모두 기록해야 다음 중복을 어느 쪽으로든 찾을 수 있다
+        new_article = self.articles.add(article_number)
+        new_property = property_key is None or self.properties.add(property_key)
+        if new_article and new_property:
+            return True
+        with self._lock:
+            self.dropped += 1
+        return False
@@ -1,39 +1,58 @@
 import json
-import os
+
+from region_index import load_region_index, SIDO
 
 
 class DistrictConverter:
     def __init__(self):
-        self.districts = self.__read_district_file()
+        # district.rgn 스냅샷이 있으면 json 파싱 없이 바로 로드
+        self.region_index = load_region_index('district.json')
+        self.districts = None
     
     def __read_district_file(self):
         json_file_path = 'district.json'
 
-        with open(json_file_path, 'r') as f:
+        with open(json_file_path, 'r', encoding='utf-8') as f:
             return json.loads(f.read())
 
     def get_data(self):
+        if self.districts is None:
+            self.districts = self.__read_district_file()
         return self.districts
 
     def get_si_do_name(self, si_do):
-        for district in self.districts:
-            if si_do in district['si_do_name']:
-                return district['si_do_name']
+        si_do_list = self.region_index.search(si_do, level=SIDO)
+        if si_do_list:
+            return si_do_list[0].name
 
+    # 이름이 포함된 첫 시/도의 시군구 목록 (이름과 달리 코드가 아니라 목록을 반환하는 기존 동작 유지)
     def get_si_do_code(self, si_do_name):
-        for district in self.districts:
-            if si_do_name in district['si_do_name']:
-                return district['sigungu']
+        si_do_code = self.find_si_do_code(si_do_name)
+        if si_do_code is not None:
+            return self.get_sigungu(si_do_code)
 
-    def get_sigungu_list(self, si_do_code, sigungu_name):
-        sigungu_list = []
-        sigungu_data = self.get_sigungu(si_do_code)
-        for sigungu in sigungu_data:
-            if sigungu_name in sigungu['sigungu_name']:
-                sigungu_list.append(sigungu)
+    def find_si_do_code(self, si_do_name):
+        si_do_list = self.region_index.search(si_do_name, level=SIDO)
+        if si_do_list:
+            return si_do_list[0].code
 
-        return sigungu_list
+    def get_sigungu(self, si_do_code):
+        return [self.__sigungu_dict(sigungu) for sigungu in self.region_index.children(si_do_code)]
+
+    def get_sigungu_list(self, si_do_code, sigungu_name):
+        return [
+            self.__sigungu_dict(sigungu)
+            for sigungu in self.region_index.children(si_do_code)
+            if sigungu_name in sigungu.name
+        ]
+
+    def __sigungu_dict(self, sigungu):
+        return {
+            'sigungu_code': sigungu.code,
+            'sigungu_name': sigungu.name,
+            'eup_myeon_dong': [{'code': dong.code, 'name': dong.name} for dong in self.region_index.children(sigungu.code)],
+        }
 
 if __name__ == '__main__':
     c = DistrictConverter()
-    print(c.get_data())
\ No newline at end of file
+    print(c.get_data())
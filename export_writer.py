@@ -0,0 +1,120 @@
+import csv
+import json
+import os
+
+import xlsxwriter
+
+# pyarrow 가 설치된 경우에만 parquet 출력 지원
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+FORMATS = ('csv', 'xlsx', 'parquet')
+
+
+def _cell(value):
+    # 리스트/딕셔너리(tagList 등)는 JSON 문자열로, NaN 은 빈 값으로 저장
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+# 수집한 row 를 바로 파일에 쓰는 exporter (CSV, XLSX constant_memory, Parquet row group)
+#
+# 전체 결과를 DataFrame/BytesIO 로 메모리에 들고 있지 않으므로, 수집 규모와 관계없이
+# 메모리 사용량은 parquet 배치 크기 정도로 유지된다.
+class StreamingExporter:
+    def __init__(self, path_prefix, columns, formats=FORMATS, batch_size=5000):
+        directory = os.path.dirname(path_prefix)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.columns = list(columns)
+        self.batch_size = batch_size
+        self.paths = {}
+        self.row_count = 0
+
+        self._csv_file = None
+        self._csv_writer = None
+        self._workbook = None
+        self._worksheet = None
+        self._parquet_writer = None
+        self._parquet_batch = []
+
+        if 'csv' in formats:
+            self.paths['csv'] = f'{path_prefix}.csv'
+            self._csv_file = open(self.paths['csv'], 'w', encoding='utf-8', newline='')
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(self.columns)
+
+        if 'xlsx' in formats:
+            self.paths['xlsx'] = f'{path_prefix}.xlsx'
+            # constant_memory: 행 단위로 바로 디스크에 flush (행 순서대로만 쓸 수 있음)
+            self._workbook = xlsxwriter.Workbook(self.paths['xlsx'], {'constant_memory': True, 'strings_to_urls': False, 'strings_to_formulas': False})
+            self._worksheet = self._workbook.add_worksheet()
+            self._worksheet.write_row(0, 0, self.columns)
+
+        if 'parquet' in formats:
+            if pa is None:
+                raise ImportError('parquet 출력에는 pyarrow 가 필요합니다.')
+            self.paths['parquet'] = f'{path_prefix}.parquet'
+            self._parquet_schema = pa.schema([(column, pa.string()) for column in self.columns])
+            self._parquet_writer = pq.ParquetWriter(self.paths['parquet'], self._parquet_schema)
+
+    def write_row(self, row):
+        self._write_values([_cell(row.get(column)) for column in self.columns])
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.write_row(row)
+
+    # DataFrame 한 묶음 쓰기 (self.columns 에 없는 컬럼은 무시, 없는 컬럼은 빈 값)
+    def write_frame(self, frame):
+        frame = frame.reindex(columns=self.columns).astype(object)
+        frame = frame.where(frame.notna(), None)
+        for values in frame.itertuples(index=False, name=None):
+            self._write_values([_cell(value) for value in values])
+
+    def _write_values(self, values):
+        self.row_count += 1
+
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(values)
+        if self._worksheet is not None:
+            self._worksheet.write_row(self.row_count, 0, values)
+        if self._parquet_writer is not None:
+            self._parquet_batch.append(values)
+            if len(self._parquet_batch) >= self.batch_size:
+                self._flush_parquet()
+
+    def _flush_parquet(self):
+        if not self._parquet_batch:
+            return
+        # 수집 값의 타입이 섞여 있어 문자열로 통일해서 저장
+        columns = list(zip(*self._parquet_batch))
+        arrays = [pa.array([None if value is None else str(value) for value in column], pa.string()) for column in columns]
+        self._parquet_writer.write_table(pa.Table.from_arrays(arrays, schema=self._parquet_schema))
+        self._parquet_batch = []
+
+    def close(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+        if self._parquet_writer is not None:
+            self._flush_parquet()
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import math
+
+import pandas as pd
+
+from prices import parse_prices
+
+# 수집할 수 있는 네이버 거래 유형 코드
+# (전세 B1 / 월세 B2 는 보증금/월세 가격을 따로 저장하거나 거르지 않으므로 매매만 수집한다)
+TRADE_TYPES = {'A1': '매매'}
+
+# 목록 API 가격 조건 상한 (네이버 웹과 같은 값, 만원)
+_PRICE_PARAM_MAX = 900000000
+
+
+def _in_range(values, low, high):
+    values = pd.to_numeric(values, errors='coerce')
+    # 조건이 있는데 값을 알 수 없으면 제외
+    mask = pd.Series(True, index=values.index)
+    if low is not None:
+        mask &= values.ge(low).fillna(False).astype(bool)
+    if high is not None:
+        mask &= values.le(high).fillna(False).astype(bool)
+    return mask
+
+
+def _value_in_range(value, low, high):
+    if low is None and high is None:
+        return True
+    if value is None or value != value:
+        return False
+    return (low is None or value >= low) and (high is None or value <= high)
+
+
+# 수집 범위를 좁히는 조건 (None 은 제한 없음, 가격은 원, 면적은 전용면적 ㎡)
+#
+# 목록 API 가 받는 조건은 쿼리로 보내고 (VL 매물 목록: 거래 유형/가격/최소 면적), 나머지는 목록과 매물 단계에서 바로 걸러
+# 조건에 맞지 않는 단지/매물은 상세 조회까지 가지 않는다. APT 단지 목록은 쿼리 조건을 받지 않으므로 목록의
+# buildYear/totalHouseholdCount 로 거르고, 매물(가격/면적/거래 유형)은 front-api 페이지를 펼칠 때 거른다.
+# 사용승인년도/세대수 조건은 단지 정보가 있는 APT 에만 적용된다.
+class FilterSpec:
+    FIELDS = ('price_min', 'price_max', 'area_min', 'area_max', 'build_year_min', 'build_year_max', 'households_min',
+              'households_max', 'trade_types')
+
+    def __init__(self, price_min=None, price_max=None, area_min=None, area_max=None, build_year_min=None, build_year_max=None,
+                 households_min=None, households_max=None, trade_types=('A1',)):
+        trade_types = tuple(trade_types)
+        unknown = set(trade_types) - set(TRADE_TYPES)
+        if not trade_types or unknown:
+            raise ValueError(f"거래 유형은 {', '.join(TRADE_TYPES)} 중에서 선택해야 합니다: {', '.join(sorted(unknown)) or '(없음)'}")
+        self.price_min = price_min
+        self.price_max = price_max
+        self.area_min = area_min
+        self.area_max = area_max
+        self.build_year_min = build_year_min
+        self.build_year_max = build_year_max
+        self.households_min = households_min
+        self.households_max = households_max
+        self.trade_types = trade_types
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __eq__(self, other):
+        return isinstance(other, FilterSpec) and self.as_dict() == other.as_dict()
+
+    def __hash__(self):
+        return hash(tuple(self.as_dict().values()))
+
+    def __repr__(self):
+        conditions = ', '.join(f'{field}={value!r}' for field, value in self.as_dict().items() if value is not None)
+        return f'FilterSpec({conditions})'
+
+    # 기본 조건 (매매 전체) 이면 True
+    @property
+    def is_default(self):
+        return self == FilterSpec()
+
+    # 체크포인트 구분용 짧은 key (기본 조건이면 '')
+    def key(self):
+        if self.is_default:
+            return ''
+        return hashlib.sha1(json.dumps(self.as_dict(), sort_keys=True).encode('utf-8')).hexdigest()[:8]
+
+    # VL 매물 목록 API 쿼리 (가격은 만원 단위)
+    # 면적 조건은 서버 기준 면적(공급/전용)이 확실하지 않아 하한만 보내고, 상한은 목록에서 전용면적으로 거른다.
+    def vl_query(self):
+        query = {'tradeType': ':'.join(self.trade_types)}
+        if self.price_min is not None or self.price_max is not None:
+            query['priceMin'] = 0 if self.price_min is None else math.floor(self.price_min / 10_000)
+            query['priceMax'] = _PRICE_PARAM_MAX if self.price_max is None else math.ceil(self.price_max / 10_000)
+        if self.area_min is not None:
+            query['areaMin'] = math.floor(self.area_min)
+        return query
+
+    # 단지 목록 DataFrame 중 조건에 맞는 행
+    def complex_mask(self, complexes):
+        return (_in_range(complexes['buildYear'], self.build_year_min, self.build_year_max)
+                & _in_range(complexes['totalHouseholdCount'], self.households_min, self.households_max))
+
+    # VL 매물 목록 DataFrame 중 조건에 맞는 행 (서버 조건을 적용하지 않는 경우를 대비해 다시 확인)
+    def vl_mask(self, articles):
+        return (articles['tradeTypeCode'].isin(self.trade_types).fillna(False).astype(bool)
+                & _in_range(parse_prices(articles['dealOrWarrantPrc']), self.price_min, self.price_max)
+                & _in_range(articles['area2'], self.area_min, self.area_max))
+
+    # front-api 매물 하나가 조건에 맞으면 True
+    def accepts_article(self, trade_type, price, exclusive_area):
+        return (trade_type in self.trade_types
+                and _value_in_range(price, self.price_min, self.price_max)
+                and _value_in_range(exclusive_area, self.area_min, self.area_max))
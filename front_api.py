@@ -0,0 +1,153 @@
+from filters import TRADE_TYPES
+
+DIRECTION_NAMES = {
+    'WW': '서향',
+    'EE': '동향',
+    'ES': '남동향',
+    'EN': '북동향',
+    'NN': '북향',
+    'WS': '남서향',
+    'SS': '남향',
+    'WN': '북서향'
+}
+
+ARTICLE_URL = 'https://fin.land.naver.com/articles/'
+
+
+# front-api 매물 하나 (원본 값만 저장하고, 출력용 문자열은 iter_rows 에서 만든다)
+class ArticleRecord:
+    __slots__ = ('article_number', 'trade_type', 'article_name', 'floor_info', 'exclusive_space', 'supply_space', 'name_type',
+                 'comment', 'direction', 'deal_price', 'broker', 'image_url')
+
+    def __init__(self, article_number, trade_type, article_name, floor_info, exclusive_space, supply_space, name_type,
+                 comment, direction, deal_price, broker, image_url):
+        self.article_number = article_number
+        self.trade_type = trade_type
+        self.article_name = article_name
+        self.floor_info = floor_info
+        self.exclusive_space = exclusive_space
+        self.supply_space = supply_space
+        self.name_type = name_type
+        self.comment = comment
+        self.direction = direction
+        self.deal_price = deal_price
+        self.broker = broker
+        self.image_url = image_url
+
+
+# 단지 하나의 매물 목록 (단지 정보는 한 번만 저장하고 row 로 바꿀 때 합친다)
+class ComplexArticles:
+    __slots__ = ('complex_info', 'records', 'dropped', 'filtered')
+
+    def __init__(self, complex_info):
+        self.complex_info = complex_info
+        self.records = []
+        # 중복으로 제외한 매물 수, 조건(FilterSpec)에 맞지 않아 제외한 매물 수
+        self.dropped = 0
+        self.filtered = 0
+
+    def __len__(self):
+        return len(self.records)
+
+    def __bool__(self):
+        return bool(self.records)
+
+    # front-api 결과 페이지의 list 를 매물 record 로 변환 (기본은 매매 매물만, 중복 매물은 중개업체별로 하나씩)
+    # filters(FilterSpec) 가 있으면 거래 유형/가격/전용면적 조건에 맞는 매물만 남기고,
+    # dedup(ListingDeduplicator) 이 있으면 이미 나온 매물 번호 / (단지, 동, 층, 면적, 가격) 은 제외
+    def add_page(self, front_list, dedup=None, filters=None):
+        records = self.records
+        complex_no = self.complex_info.get('complexNo')
+        trade_types = filters.trade_types if filters is not None else ('A1',)
+        for item in front_list:
+            article_info = item.get('representativeArticleInfo')
+            trade_type = article_info.get('tradeType')
+            if trade_type not in trade_types:
+                if filters is not None:
+                    self.filtered += 1
+                continue
+
+            space_info = article_info.get('spaceInfo')
+            article_detail = article_info.get('articleDetail')
+            shared = (
+                article_info.get('complexName') + ' ' + article_info.get('dongName'),
+                article_detail.get('floorInfo'),
+                space_info.get('exclusiveSpace'),
+                space_info.get('supplySpace'),
+                space_info.get('nameType'),
+                article_detail.get('articleFeatureDescription'),
+                DIRECTION_NAMES.get(article_detail.get('direction')),
+            )
+
+            duplicate_article_info = item.get('duplicatedArticlesInfo')
+            if duplicate_article_info:
+                candidates = [
+                    (duplicate.get('articleDetail').get('articleNumber'), duplicate.get('priceInfo').get('dealPrice'),
+                     duplicate.get('brokerInfo').get('brokerageName'), duplicate.get('articleMediaDto').get('imageUrl'))
+                    for duplicate in duplicate_article_info.get('articleInfoList')
+                ]
+            else:
+                candidates = [
+                    (article_info.get('articleNumber'), article_info.get('priceInfo').get('dealPrice'),
+                     article_info.get('brokerageName'), article_info.get('articleMediaDto').get('imageUrl'))
+                ]
+
+            for article_number, deal_price, broker, image_url in candidates:
+                if filters is not None and not filters.accepts_article(trade_type, deal_price, shared[2]):
+                    self.filtered += 1
+                    continue
+                if dedup is not None and not dedup.first_listing(
+                        article_number, (complex_no, shared[0], shared[1], shared[2], deal_price)):
+                    self.dropped += 1
+                    continue
+                records.append(ArticleRecord(article_number, trade_type, *shared, deal_price, broker, image_url))
+
+    # 출력/체크포인트용 row (단지 정보 + 매물 정보 + extra) 를 하나씩 반환
+    # 매매가는 숫자(dealPrice)로만 두고, 표시용 문자열은 출력할 때 prices.format_prices 로 한 번에 만든다
+    def iter_rows(self, **extra):
+        complex_info = self.complex_info
+        for record in self.records:
+            name_type = record.name_type
+            yield {
+                **complex_info,
+                '매물명': record.article_name,
+                '거래방식': TRADE_TYPES.get(record.trade_type),
+                '층수': f'{record.floor_info}층' if record.floor_info else None,
+                '면적': f'{record.exclusive_space}{name_type}㎡({record.supply_space}{name_type})',
+                '코멘트': record.comment,
+                '방향': record.direction,
+                'exclusiveSpace': record.exclusive_space,
+                'supplySpace': record.supply_space,
+                'floorInfo': record.floor_info,
+                'dealPrice': record.deal_price,
+                'articleNumber': record.article_number,
+                '매물link': ARTICLE_URL + record.article_number,
+                '중개업체': record.broker,
+                '이미지': record.image_url,
+                **extra,
+            }
+
+
+# 읍면동 하나의 단지별 매물 (ComplexArticles 를 그대로 들고 있다가, 순회할 때 row 를 하나씩 만든다)
+#
+# 수집 결과를 row dict 로 미리 펼치면 매물마다 단지 정보가 복사되므로, 파일 저장/체크포인트 단계에서만 row 를 만든다.
+class ComplexListings:
+    __slots__ = ('complexes',)
+
+    def __init__(self):
+        # (ComplexArticles, row 에 붙일 extra) 목록
+        self.complexes = []
+
+    def add(self, complex_articles, **extra):
+        if complex_articles is not None and len(complex_articles):
+            self.complexes.append((complex_articles, extra))
+
+    def __len__(self):
+        return sum(len(complex_articles) for complex_articles, _ in self.complexes)
+
+    def __bool__(self):
+        return bool(self.complexes)
+
+    def __iter__(self):
+        for complex_articles, extra in self.complexes:
+            yield from complex_articles.iter_rows(**extra)
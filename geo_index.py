@@ -0,0 +1,137 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+EARTH_RADIUS_M = 6_371_008.8
+
+
+# 위경도 배열 사이 거리 (m, haversine)
+def haversine_m(latitude, longitude, latitudes, longitudes):
+    lat1, lat2 = np.radians(latitude), np.radians(latitudes)
+    dlat = lat2 - lat1
+    dlng = np.radians(longitudes) - np.radians(longitude)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+# 지도 타일 (zoom, x, y) 의 (남, 서, 북, 동) 경계 (웹 메르카토르, 네이버/OSM 지도와 같은 타일 번호)
+def tile_bounds(zoom, x, y):
+    n = 2 ** zoom
+
+    def latitude(tile_y):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+    return latitude(y + 1), x / n * 360 - 180, latitude(y), (x + 1) / n * 360 - 180
+
+
+def _tile_x(longitude, zoom):
+    return min(2 ** zoom - 1, max(0, int((longitude + 180) / 360 * 2 ** zoom)))
+
+
+def _tile_y(latitude, zoom):
+    lat = math.radians(latitude)
+    return min(2 ** zoom - 1, max(0, int((1 - math.asinh(math.tan(lat)) / math.pi) / 2 * 2 ** zoom)))
+
+
+# (남, 서, 북, 동) 영역을 덮는 지도 타일 목록 [(zoom, x, y), ...]
+def tiles_for_bbox(south, west, north, east, zoom):
+    return [(zoom, x, y)
+            for x in range(_tile_x(west, zoom), _tile_x(east, zoom) + 1)
+            for y in range(_tile_y(north, zoom), _tile_y(south, zoom) + 1)]
+
+
+# 위경도 좌표의 격자 인덱스 (반경/영역 내 매물 조회)
+#
+# 좌표를 기준 위도의 등장방형(equirectangular) 평면으로 투영해 cell_m 크기 격자로 나누고, (열, 행) 순서의 cell 번호로
+# 정렬해 둔다. 같은 열의 연속된 cell 은 배열에서도 연속 구간이므로, 조회 영역에 걸친 열마다 searchsorted 한 번으로
+# 후보 구간을 찾고 후보만 정확한 거리/경계로 거른다. 좌표가 없는 행은 인덱스에 넣지 않는다.
+class GeoIndex:
+    def __init__(self, latitudes, longitudes, cell_m=250.0, frame=None):
+        latitudes = np.asarray(latitudes, dtype='float64')
+        longitudes = np.asarray(longitudes, dtype='float64')
+        rows = np.flatnonzero(np.isfinite(latitudes) & np.isfinite(longitudes))
+
+        self.cell_m = cell_m
+        # 조회 결과는 원래 배열(frame) 의 위치
+        self.frame = frame
+        self.reference_cos = math.cos(math.radians(float(np.median(latitudes[rows])))) if len(rows) else 1.0
+
+        cells_x, cells_y = self._cells(latitudes[rows], longitudes[rows])
+        self._x_min = int(cells_x.min()) if len(rows) else 0
+        self._y_min = int(cells_y.min()) if len(rows) else 0
+        self._rows_per_column = int(cells_y.max()) - self._y_min + 1 if len(rows) else 1
+        keys = self._keys(cells_x, cells_y)
+
+        order = np.argsort(keys, kind='stable')
+        self.keys = keys[order]
+        self.rows = rows[order]
+        self.latitudes = latitudes[self.rows]
+        self.longitudes = longitudes[self.rows]
+
+    @classmethod
+    def from_frame(cls, frame, latitude='latitude', longitude='longitude', cell_m=250.0):
+        return cls(pd.to_numeric(frame[latitude], errors='coerce'), pd.to_numeric(frame[longitude], errors='coerce'),
+                   cell_m=cell_m, frame=frame)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _project(self, latitudes, longitudes):
+        x = np.radians(longitudes) * EARTH_RADIUS_M * self.reference_cos
+        y = np.radians(latitudes) * EARTH_RADIUS_M
+        return x, y
+
+    def _cells(self, latitudes, longitudes):
+        x, y = self._project(latitudes, longitudes)
+        return np.floor(x / self.cell_m).astype('int64'), np.floor(y / self.cell_m).astype('int64')
+
+    def _keys(self, cells_x, cells_y):
+        return (cells_x - self._x_min) * self._rows_per_column + (cells_y - self._y_min)
+
+    # 투영 좌표 (x0~x1, y0~y1) 사각형에 걸친 cell 의 인덱스 위치
+    def _candidates(self, x0, x1, y0, y1):
+        cell_x0, cell_x1 = math.floor(x0 / self.cell_m) - self._x_min, math.floor(x1 / self.cell_m) - self._x_min
+        cell_y0, cell_y1 = math.floor(y0 / self.cell_m) - self._y_min, math.floor(y1 / self.cell_m) - self._y_min
+        column_count = len(self.keys) and int(self.keys[-1]) // self._rows_per_column + 1
+        cell_x0, cell_x1 = max(cell_x0, 0), min(cell_x1, column_count - 1)
+        cell_y0, cell_y1 = max(cell_y0, 0), min(cell_y1, self._rows_per_column - 1)
+        if cell_x0 > cell_x1 or cell_y0 > cell_y1:
+            return np.empty(0, dtype='int64')
+
+        columns = np.arange(cell_x0, cell_x1 + 1, dtype='int64') * self._rows_per_column
+        starts = np.searchsorted(self.keys, columns + cell_y0, side='left')
+        ends = np.searchsorted(self.keys, columns + cell_y1, side='right')
+        return np.concatenate([np.arange(start, end) for start, end in zip(starts, ends) if end > start] or [np.empty(0, dtype='int64')])
+
+    # 중심에서 radius_m 이내의 위치 (가까운 순), with_distance=True 이면 (위치, 거리 m)
+    def within(self, latitude, longitude, radius_m, with_distance=False):
+        # 기준 위도와 다른 위도에서는 경도 1도의 거리가 달라지므로, 원이 닿는 가장 높은 위도 기준으로 x 범위를 넓힌다
+        edge_latitude = min(89.0, abs(latitude) + math.degrees(radius_m / EARTH_RADIUS_M))
+        radius_x = radius_m * self.reference_cos / math.cos(math.radians(edge_latitude))
+        x, y = self._project(latitude, longitude)
+        candidates = self._candidates(x - radius_x, x + radius_x, y - radius_m, y + radius_m)
+
+        distances = haversine_m(latitude, longitude, self.latitudes[candidates], self.longitudes[candidates])
+        inside = distances <= radius_m
+        candidates, distances = candidates[inside], distances[inside]
+        order = np.argsort(distances, kind='stable')
+        positions = self.rows[candidates[order]]
+        return (positions, distances[order]) if with_distance else positions
+
+    # (남, 서, 북, 동) 경계 안의 위치 (원래 순서)
+    def in_bbox(self, south, west, north, east):
+        x0, y0 = self._project(south, west)
+        x1, y1 = self._project(north, east)
+        candidates = self._candidates(x0, x1, y0, y1)
+        latitudes, longitudes = self.latitudes[candidates], self.longitudes[candidates]
+        inside = (latitudes >= south) & (latitudes <= north) & (longitudes >= west) & (longitudes <= east)
+        return np.sort(self.rows[candidates[inside]])
+
+    # frame 에서 반경 안의 행 (distance_m 컬럼 추가, 가까운 순)
+    def frame_within(self, latitude, longitude, radius_m):
+        positions, distances = self.within(latitude, longitude, radius_m, with_distance=True)
+        return self.frame.iloc[positions].assign(distance_m=distances)
+
+    def frame_in_bbox(self, south, west, north, east):
+        return self.frame.iloc[self.in_bbox(south, west, north, east)]
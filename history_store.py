@@ -0,0 +1,183 @@
+import os
+import uuid
+from datetime import datetime
+
+from geo_index import GeoIndex
+from prices import parse_prices
+
+# pyarrow 가 설치된 경우에만 이력 저장 지원
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:
+    pa = None
+    ds = None
+
+# 수집일/매물종류/시군구 단위로 나눠 저장 (hive 파티션: property_type=APT/collected_date=2025-01-01/sigungu_code=11680)
+PARTITION_COLUMNS = ['property_type', 'collected_date', 'sigungu_code']
+
+
+def history_schema():
+    return pa.schema([
+        ('property_type', pa.string()),
+        ('collected_date', pa.string()),
+        ('sigungu_code', pa.string()),
+        ('collected_at', pa.timestamp('s')),
+        ('article_no', pa.string()),
+        ('complex_no', pa.string()),
+        ('article_name', pa.string()),
+        ('trade_type', pa.string()),
+        ('deal_price', pa.int64()),
+        ('exclusive_area', pa.float64()),
+        ('supply_area', pa.float64()),
+        ('floor', pa.int16()),
+        ('total_floor', pa.int16()),
+        ('floor_label', pa.string()),
+        ('direction', pa.string()),
+        ('broker', pa.string()),
+        ('dong_code', pa.string()),
+        ('dong_name', pa.string()),
+        ('si_do_name', pa.string()),
+        ('sigungu_name', pa.string()),
+        ('latitude', pa.float64()),
+        ('longitude', pa.float64()),
+    ])
+
+
+def parse_area(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_floor_part(value):
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    # 지하층 (B1 → -1)
+    if value[:1] in ('B', 'b') and value[1:].isdigit():
+        return -int(value[1:])
+    return None
+
+
+# '5/15' → (5, 15), '고/20' → (None, 20)
+def parse_floor(value):
+    if not value:
+        return None, None
+    floor, _, total_floor = str(value).replace('층', '').partition('/')
+    return _parse_floor_part(floor), _parse_floor_part(total_floor) if total_floor else None
+
+
+# 수집한 APT/VL 매물 하나를 이력 스키마 row 로 변환 (deal_price 는 원본 값, 저장할 때 묶음 단위로 숫자로 바꾼다)
+def history_row(property_type, listing, city_name, sigungu_name, collected_at):
+    dong_code = str(listing.get('dong_code') or listing.get('cortarNo') or '')
+    floor_label = listing.get('floorInfo')
+    floor, total_floor = parse_floor(floor_label)
+
+    if property_type == 'APT':
+        article_no = listing.get('articleNumber')
+        deal_price = listing.get('dealPrice')
+        exclusive_area, supply_area = parse_area(listing.get('exclusiveSpace')), parse_area(listing.get('supplySpace'))
+        article_name, trade_type = listing.get('매물명'), listing.get('거래방식')
+        direction, broker = listing.get('방향'), listing.get('중개업체')
+    else:
+        article_no = listing.get('articleNo')
+        deal_price = listing.get('dealOrWarrantPrc')
+        exclusive_area, supply_area = parse_area(listing.get('area2')), parse_area(listing.get('area1'))
+        article_name, trade_type = listing.get('articleName'), listing.get('tradeTypeName')
+        direction, broker = listing.get('direction'), listing.get('realtorName')
+
+    return {
+        'property_type': property_type,
+        'collected_date': collected_at.strftime('%Y-%m-%d'),
+        'sigungu_code': dong_code[:5],
+        'collected_at': collected_at,
+        'article_no': None if article_no is None else str(article_no),
+        'complex_no': None if listing.get('complexNo') is None else str(listing.get('complexNo')),
+        'article_name': article_name,
+        'trade_type': trade_type,
+        'deal_price': deal_price,
+        'exclusive_area': exclusive_area,
+        'supply_area': supply_area,
+        'floor': floor,
+        'total_floor': total_floor,
+        'floor_label': None if floor_label is None else str(floor_label),
+        'direction': direction,
+        'broker': broker,
+        'dong_code': dong_code or None,
+        'dong_name': listing.get('dong_name') or listing.get('sectionName'),
+        'si_do_name': city_name,
+        'sigungu_name': sigungu_name,
+        # 좌표는 VL 목록에만 있다 (geo_index.GeoIndex.from_frame 으로 반경/영역 조회)
+        'latitude': parse_area(listing.get('latitude')),
+        'longitude': parse_area(listing.get('longitude')),
+    }
+
+
+# 수집 결과를 날짜/지역으로 파티션된 Parquet 데이터셋에 누적 저장하는 이력 저장소
+#
+# 가격/면적/층은 숫자 컬럼으로 저장하므로, 재수집 없이 filters 로 필요한 파티션만 읽어
+# 단지/읍면동별 가격 추이를 조회할 수 있다.
+class ListingHistoryStore:
+    def __init__(self, root=os.path.join('.cache', 'history'), batch_size=50000):
+        self.root = root
+        self.batch_size = batch_size
+
+    def append(self, property_type, listings, city_name, sigungu_name, collected_at=None):
+        if pa is None:
+            raise ImportError('이력 저장에는 pyarrow 가 필요합니다.')
+        collected_at = (collected_at or datetime.now()).replace(microsecond=0)
+
+        count = 0
+        batch = []
+        for listing in listings:
+            batch.append(history_row(property_type, listing, city_name, sigungu_name, collected_at))
+            if len(batch) >= self.batch_size:
+                count += self._write(batch)
+                batch = []
+        if batch:
+            count += self._write(batch)
+        return count
+
+    def _write(self, rows):
+        schema = history_schema()
+        # APT 는 원 단위 숫자, VL 은 '3억 5,000' 같은 만원 단위 문자열
+        deal_prices = parse_prices([row.pop('deal_price') for row in rows])
+        table = pa.Table.from_pylist(rows, schema=schema)
+        table = table.set_column(schema.get_field_index('deal_price'), schema.field('deal_price'), pa.array(deal_prices, pa.int64()))
+        ds.write_dataset(
+            table, self.root, format='parquet',
+            partitioning=ds.partitioning(pa.schema([history_schema().field(name) for name in PARTITION_COLUMNS]), flavor='hive'),
+            # 같은 파티션에 여러 번 저장해도 기존 파일을 덮어쓰지 않도록 실행마다 다른 파일명 사용
+            basename_template=f'part-{uuid.uuid4().hex}-{{i}}.parquet',
+            existing_data_behavior='overwrite_or_ignore',
+        )
+        return len(rows)
+
+    def dataset(self):
+        if ds is None:
+            raise ImportError('이력 조회에는 pyarrow 가 필요합니다.')
+        return ds.dataset(self.root, format='parquet', schema=history_schema(), partitioning='hive')
+
+    # filters 예: (ds.field('sigungu_code') == '11680') & (ds.field('collected_date') >= '2025-01-01')
+    def read(self, filters=None, columns=None):
+        if not os.path.isdir(self.root):
+            return history_schema().empty_table().to_pandas()
+        return self.dataset().to_table(filter=filters, columns=columns).to_pandas()
+
+    # 저장된 매물 좌표의 격자 인덱스 (index.frame_within(위도, 경도, 반경 m), index.frame_in_bbox(남, 서, 북, 동) 로 조회)
+    def geo_index(self, filters=None, columns=None, cell_m=250.0):
+        if columns is not None:
+            columns = list(dict.fromkeys([*columns, 'latitude', 'longitude']))
+        return GeoIndex.from_frame(self.read(filters, columns), cell_m=cell_m)
+
+    # 단지(complex_no) 또는 읍면동(dong_code)별 월간 가격 추이 (매매가 중앙값, ㎡당 가격 중앙값, 매물 수)
+    def price_trend(self, by='complex_no', filters=None, freq='M'):
+        df = self.read(filters, columns=[by, 'collected_at', 'deal_price', 'exclusive_area'])
+        df = df.dropna(subset=[by, 'deal_price'])
+        df['period'] = df['collected_at'].dt.to_period(freq)
+        df['price_per_area'] = df['deal_price'] / df['exclusive_area']
+        return (df.groupby([by, 'period'])
+                  .agg(deal_price=('deal_price', 'median'), price_per_area=('price_per_area', 'median'), listings=('deal_price', 'size'))
+                  .reset_index())
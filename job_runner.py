@@ -0,0 +1,159 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from progress_sink import ProgressSink
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+# 작업별로 보관하는 경고/오류 메시지 수
+MAX_MESSAGES = 200
+
+
+# 같은 key 의 작업이 다른 옵션으로 진행 중일 때
+class JobConflictError(RuntimeError):
+    def __init__(self, job):
+        super().__init__(f'{job.key}: 다른 옵션으로 진행 중인 작업이 있습니다.')
+        self.job = job
+
+
+# 백그라운드 수집 작업 하나 (상태/진행률/메시지는 sink 를 통해 worker 스레드에서 갱신)
+class Job:
+    def __init__(self, key, options):
+        self.key = key
+        self.options = options
+        self.state = QUEUED
+        self.status = '대기중입니다.'
+        self.finished = 0
+        self.total = 0
+        self.messages = []
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        # 같은 작업을 요청한 횟수 (처음 요청 포함)
+        self.requests = 1
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        return self.state in (QUEUED, RUNNING)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'key': self.key,
+                'state': self.state,
+                'status': self.status,
+                'finished': self.finished,
+                'total': self.total,
+                'messages': list(self.messages),
+                'requests': self.requests,
+                'submitted_at': self.submitted_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+            }
+
+    def _update(self, **values):
+        with self._lock:
+            for name, value in values.items():
+                setattr(self, name, value)
+
+    def _message(self, level, message):
+        with self._lock:
+            self.messages.append((level, message))
+            del self.messages[:-MAX_MESSAGES]
+
+
+# 진행 상황을 Job 에 기록하는 sink (UI 는 job.snapshot() 을 주기적으로 읽어 표시)
+class JobSink(ProgressSink):
+    def __init__(self, job, show_status=True):
+        self.job = job
+        self.show_status = show_status
+
+    def without_status(self):
+        return JobSink(self.job, show_status=False)
+
+    def status(self, message):
+        if self.show_status:
+            self.job._update(status=message)
+
+    def warning(self, message):
+        super().warning(message)
+        self.job._message('warning', message)
+
+    def error(self, message):
+        super().error(message)
+        self.job._message('error', message)
+
+    def progress(self, finished, total):
+        self.job._update(finished=finished, total=total)
+
+
+# (지역 코드, 매물 종류) 를 key 로 하는 공용 작업 목록
+#
+# 같은 key 의 작업이 같은 옵션으로 진행 중이면 새로 시작하지 않고 그 작업을 돌려주고, 옵션이 다르면 JobConflictError.
+# 끝난 작업은 ttl 초 동안 같은 옵션의 요청에 결과를 재사용한다. 실패한 작업과 force=True 요청은 새로 실행한다.
+# max_workers 개까지 동시에 실행하고 나머지는 요청 순서대로 기다린다 (queue_position 으로 대기 순서 안내).
+# 작업마다 요청 속도를 따로 조절하므로, 동시에 실행하는 작업 수만큼 호스트별 요청이 늘어난다.
+class JobRegistry:
+    def __init__(self, max_workers=2, ttl=3600):
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='collect-job')
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._jobs.get(key)
+
+    def jobs(self):
+        with self._lock:
+            return list(self._jobs.values())
+
+    # func(sink=JobSink, **options) 를 백그라운드에서 실행하고 Job 을 반환
+    def submit(self, key, func, options=None, force=False):
+        options = dict(options or {})
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                if job.active:
+                    if job.options != options:
+                        raise JobConflictError(job)
+                    job.requests += 1
+                    return job
+                if not force and job.state == DONE and job.options == options and time.time() - job.finished_at < self.ttl:
+                    job.requests += 1
+                    return job
+
+            job = self._jobs[key] = Job(key, options)
+            self._executor.submit(self._run, job, func)
+            return job
+
+    # 대기 중인 작업의 대기 순서 (1부터, 대기 중이 아니면 None)
+    def queue_position(self, job):
+        with self._lock:
+            if job.state != QUEUED:
+                return None
+            return 1 + sum(1 for other in self._jobs.values() if other.state == QUEUED and other.submitted_at < job.submitted_at)
+
+    def _run(self, job, func):
+        job._update(state=RUNNING, status='수집중입니다.', started_at=time.time())
+        try:
+            result = func(sink=JobSink(job), **job.options)
+        except Exception as e:
+            job._update(state=FAILED, error=e, status=f'수집 실패: {e}', finished_at=time.time())
+        else:
+            job._update(state=DONE, result=result, status='수집 완료', finished_at=time.time())
+
+    # 오래된 완료/실패 작업 정리 (결과 DataFrame 등을 메모리에서 내린다)
+    def prune(self):
+        now = time.time()
+        with self._lock:
+            for key, job in list(self._jobs.items()):
+                if not job.active and now - job.finished_at >= self.ttl:
+                    del self._jobs[key]
@@ -0,0 +1,169 @@
+import contextvars
+import functools
+import json
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+# 응답 시간 히스토그램 구간 (ms, 마지막 구간은 그 이상)
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+
+# URL 을 엔드포인트 이름으로 변환 (숫자 경로는 {id} 로 묶는다)
+# https://fin.land.naver.com/complexes/1234?tab=complex-info → fin.land.naver.com/complexes/{id}
+def endpoint_name(url):
+    parsed = urlparse(url)
+    return parsed.netloc + _ID_SEGMENT.sub('/{id}', parsed.path)
+
+
+class StageTimer:
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'total_s': round(self.total, 3),
+            'avg_ms': round(self.total / self.count * 1000, 1) if self.count else None,
+            'max_ms': round(self.max * 1000, 1),
+        }
+
+
+class EndpointStats:
+    __slots__ = ('requests', 'cache_hits', 'bytes', 'errors', 'latency', 'buckets')
+
+    def __init__(self):
+        self.requests = 0
+        self.cache_hits = 0
+        self.bytes = 0
+        self.errors = 0
+        self.latency = StageTimer()
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def as_dict(self):
+        labels = [f'<={bucket}ms' for bucket in LATENCY_BUCKETS_MS] + [f'>{LATENCY_BUCKETS_MS[-1]}ms']
+        return {
+            'requests': self.requests,
+            'cache_hits': self.cache_hits,
+            'bytes': self.bytes,
+            'errors': self.errors,
+            'latency': self.latency.as_dict(),
+            'histogram': {label: count for label, count in zip(labels, self.buckets) if count},
+        }
+
+
+# 수집 실행 한 번의 단계별 소요 시간, 카운터, 엔드포인트별 응답 시간 히스토그램
+#
+# 단계 시간은 스레드별 경과 시간의 합이므로, 병렬 수집에서는 전체 실행 시간보다 클 수 있다.
+# (어느 단계가 병목인지 비교하는 용도)
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._scoped = contextvars.ContextVar(f'metrics_scope_{id(self)}', default=None)
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self._start = time.perf_counter()
+            self.stages = {}
+            self.counters = {}
+            self.endpoints = {}
+
+    # with 블록 안에서 (그 컨텍스트를 이어받은 worker 스레드 포함) 기록한 값을 scoped 에도 함께 남긴다 (작업별 통계)
+    @contextmanager
+    def scoped(self, scoped):
+        token = self._scoped.set(scoped)
+        try:
+            yield scoped
+        finally:
+            self._scoped.reset(token)
+
+    # 현재 컨텍스트의 작업별 Metrics (없으면 자신)
+    def current(self):
+        return self._scoped.get() or self
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage(name, time.perf_counter() - start)
+
+    def add_stage(self, name, elapsed):
+        with self._lock:
+            timer = self.stages.get(name)
+            if timer is None:
+                timer = self.stages[name] = StageTimer()
+            timer.add(elapsed)
+        scoped = self._scoped.get()
+        if scoped is not None:
+            scoped.add_stage(name, elapsed)
+
+    # 함수 전체를 stage 로 측정하는 decorator
+    def timed(self, name):
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        scoped = self._scoped.get()
+        if scoped is not None:
+            scoped.count(name, value)
+
+    def observe_request(self, url, elapsed=None, size=0, status=None, from_cache=False, error=None):
+        name = endpoint_name(url)
+        with self._lock:
+            endpoint = self.endpoints.get(name)
+            if endpoint is None:
+                endpoint = self.endpoints[name] = EndpointStats()
+            endpoint.requests += 1
+            endpoint.bytes += size
+            if from_cache:
+                endpoint.cache_hits += 1
+            if error is not None or (status is not None and status >= 400):
+                endpoint.errors += 1
+            if elapsed is not None and not from_cache:
+                endpoint.latency.add(elapsed)
+                endpoint.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed * 1000)] += 1
+        scoped = self._scoped.get()
+        if scoped is not None:
+            scoped.observe_request(url, elapsed=elapsed, size=size, status=status, from_cache=from_cache, error=error)
+
+    def summary(self):
+        with self._lock:
+            return {
+                'started_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started_at)),
+                'elapsed_s': round(time.perf_counter() - self._start, 3),
+                'stages': {name: timer.as_dict() for name, timer in sorted(self.stages.items(), key=lambda item: -item[1].total)},
+                'counters': dict(self.counters),
+                'endpoints': {name: endpoint.as_dict() for name, endpoint in sorted(self.endpoints.items())},
+            }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.summary(), ensure_ascii=False, indent=indent)
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_json())
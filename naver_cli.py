@@ -0,0 +1,174 @@
+import argparse
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import naver_land
+from export_writer import FORMATS
+from filters import TRADE_TYPES, FilterSpec
+from naver_land import TILE_ZOOM, collect_area, collect_dong_listings, collect_region, export_listings, record_history
+from progress_sink import ProgressSink, QuietSink
+from region_index import load_region_index
+
+
+# 워커 프로세스에서 읍면동 하나를 수집
+def collect_dong_in_process(dong, property_type, max_workers, requests_per_second, max_requests_per_second, incremental, vl_details,
+                            dedup, filters):
+    naver_land.rate_limiter.requests_per_second = requests_per_second
+    naver_land.rate_limiter.max_rate = max_requests_per_second
+    listings, _ = collect_dong_listings(dong['code'], dong['name'], property_type, sink=QuietSink(),
+                                        max_workers=max_workers, incremental=incremental, vl_details=vl_details, dedup=dedup,
+                                        filters=filters)
+    return listings
+
+
+# cortarNo 로 시/도, 군/구 이름 조회 (출력 파일명용)
+def region_names(cortar_no):
+    region_index = load_region_index('district.json')
+    cortar_no = str(cortar_no)
+    si_do = region_index.get(cortar_no[:2])
+    sigungu = region_index.get(cortar_no[:5]) if cortar_no[2:5].strip('0') else None
+    return (si_do.name if si_do else cortar_no[:2]), (sigungu.name if sigungu else '전체')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='네이버 부동산 매물 수집 (Streamlit 없이 실행)')
+    parser.add_argument('region', nargs='?', help='수집할 시/도, 군/구 또는 읍/면/동 cortarNo (예: 1168000000)')
+    parser.add_argument('--bbox', help='지역 대신 이 영역을 덮는 지도 타일만 수집 (VL, 남,서,북,동 위경도 예: 37.49,127.02,37.51,127.05)')
+    parser.add_argument('--zoom', type=int, default=TILE_ZOOM, help='--bbox 수집에 사용할 지도 타일 zoom')
+    parser.add_argument('--type', dest='property_type', choices=['APT', 'VL'], default='APT', help='매물 종류')
+    parser.add_argument('--out', default='output', help='결과 파일을 저장할 디렉토리')
+    parser.add_argument('--processes', type=int, default=1, help='읍/면/동을 나눠 수집할 워커 프로세스 수')
+    parser.add_argument('--concurrency', type=int, default=2, help='단일 프로세스에서 동시에 수집할 읍/면/동 수')
+    parser.add_argument('--workers', type=int, default=4, help='읍/면/동마다 동시에 수집할 단지 (VL: 상세 조회) 수')
+    parser.add_argument('--vl-list-only', action='store_true', help='VL 상세 API 를 호출하지 않고 목록 정보만 저장')
+    parser.add_argument('--keep-duplicates', action='store_true',
+                        help='같은 매물번호 / 같은 단지·동·층·면적·가격의 중복 매물도 모두 저장')
+    parser.add_argument('--trade-types', default='A1',
+                        help=f"수집할 거래 유형 (쉼표로 구분, {', '.join(f'{code}={name}' for code, name in TRADE_TYPES.items())})")
+    parser.add_argument('--price-min', type=int, help='최소 가격 (만원)')
+    parser.add_argument('--price-max', type=int, help='최대 가격 (만원)')
+    parser.add_argument('--area-min', type=float, help='최소 전용면적 (㎡)')
+    parser.add_argument('--area-max', type=float, help='최대 전용면적 (㎡)')
+    parser.add_argument('--build-year-min', type=int, help='사용승인년도 하한 (APT)')
+    parser.add_argument('--build-year-max', type=int, help='사용승인년도 상한 (APT)')
+    parser.add_argument('--households-min', type=int, help='최소 세대수 (APT)')
+    parser.add_argument('--households-max', type=int, help='최대 세대수 (APT)')
+    parser.add_argument('--rps', type=float, default=5.0, help='전체 호스트별 시작 초당 요청 수 (응답에 따라 자동 조절)')
+    parser.add_argument('--max-rps', type=float, default=20.0, help='전체 호스트별 최대 초당 요청 수')
+    parser.add_argument('--incremental', action='store_true', help='이전 수집 이후 신규/변경 매물만 수집 (VL)')
+    parser.add_argument('--formats', default='csv,xlsx', help=f"저장할 파일 형식 (쉼표로 구분, {','.join(FORMATS)})")
+    parser.add_argument('--no-history', action='store_true', help='수집 결과를 Parquet 이력에 저장하지 않음')
+    parser.add_argument('--no-resume', action='store_true', help='체크포인트를 무시하고 처음부터 수집')
+    args = parser.parse_args(argv)
+
+    formats = [fmt.strip() for fmt in args.formats.split(',') if fmt.strip()]
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        parser.error(f"지원하지 않는 형식: {', '.join(sorted(unknown))}")
+
+    bbox = None
+    if args.bbox:
+        try:
+            bbox = tuple(float(value) for value in args.bbox.split(','))
+        except ValueError:
+            bbox = ()
+        if len(bbox) != 4:
+            parser.error('--bbox 는 남,서,북,동 위경도 4개를 쉼표로 구분해 입력합니다.')
+        if args.property_type != 'VL':
+            parser.error('--bbox 수집은 VL 만 지원합니다.')
+    elif not args.region:
+        parser.error('region 또는 --bbox 를 입력하세요.')
+
+    try:
+        filters = FilterSpec(
+            price_min=None if args.price_min is None else args.price_min * 1_0000,
+            price_max=None if args.price_max is None else args.price_max * 1_0000,
+            area_min=args.area_min, area_max=args.area_max,
+            build_year_min=args.build_year_min, build_year_max=args.build_year_max,
+            households_min=args.households_min, households_max=args.households_max,
+            trade_types=[code.strip() for code in args.trade_types.split(',') if code.strip()],
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    os.makedirs(args.out, exist_ok=True)
+
+    incremental = args.incremental and args.property_type == 'VL'
+    options = dict(
+        checkpoint_dir=os.path.join(args.out, 'checkpoints'),
+        max_workers=args.workers,
+        resume=not args.no_resume,
+        incremental=incremental,
+        vl_details=not args.vl_list_only,
+        dedup=not args.keep_duplicates,
+        filters=filters,
+        sink=ProgressSink(),
+    )
+
+    if bbox is not None:
+        # 타일 목록 API 는 증분 수집을 지원하지 않고, 현재 프로세스의 스레드에서 수집
+        options.pop('incremental')
+        naver_land.rate_limiter.requests_per_second = args.rps
+        naver_land.rate_limiter.max_rate = args.max_rps
+        try:
+            dongs, checkpoint = collect_area(bbox, zoom=args.zoom, max_concurrency=args.concurrency, worker_sink=QuietSink(), **options)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.processes > 1:
+        # rate limiter 는 프로세스마다 따로 있으므로 전체 속도를 프로세스 수로 나눈다
+        # (중복 제거 seen-set 도 공유할 수 없어 읍면동 안에서만 중복을 제거한다)
+        requests_per_second = args.rps / args.processes
+        max_requests_per_second = args.max_rps / args.processes
+        with ProcessPoolExecutor(max_workers=args.processes) as pool:
+            def collect_dong(dong):
+                return pool.submit(collect_dong_in_process, dong, args.property_type, args.workers,
+                                   requests_per_second, max_requests_per_second, incremental, options['vl_details'], options['dedup'],
+                                   filters).result()
+
+            dongs, checkpoint = collect_region(args.region, args.property_type, max_concurrency=args.processes,
+                                               collect_dong=collect_dong, **options)
+    else:
+        naver_land.rate_limiter.requests_per_second = args.rps
+        naver_land.rate_limiter.max_rate = args.max_rps
+        dongs, checkpoint = collect_region(args.region, args.property_type, max_concurrency=args.concurrency,
+                                           worker_sink=QuietSink(), **options)
+        # 호스트별 최종 속도와 요청 제한 횟수 (다음 실행의 --rps 를 정하는 데 참고)
+        for host, host_stats in naver_land.rate_limiter.stats().items():
+            logging.info(f'{host}: {host_stats}')
+
+    if checkpoint is None:
+        logging.info('No data to save.')
+        return
+
+    # 읍면동별 체크포인트에서 한 읍면동씩 읽어 바로 파일로 저장
+    if bbox is not None:
+        city_name, sigungu_name = '지도', args.bbox
+        file_prefix = os.path.join(args.out, f"bbox_{args.bbox.replace(',', '_')}_{args.property_type}")
+    else:
+        city_name, sigungu_name = region_names(args.region)
+        file_prefix = os.path.join(args.out, f'{city_name}_{sigungu_name}_{args.property_type}_{args.region}')
+    exporter = export_listings(checkpoint.iter_results(dongs), args.property_type, file_prefix, city_name, sigungu_name,
+                               incremental=incremental, formats=formats)
+    logging.info(f"{exporter.row_count}건 저장: {', '.join(exporter.paths.values())}")
+
+    if not args.no_history:
+        count = record_history(args.property_type, checkpoint.iter_results(dongs), city_name, sigungu_name, sink=options['sink'])
+        logging.info(f'{count}건 이력 저장: {naver_land.history_store.root}')
+
+    # 단계별 소요 시간/엔드포인트별 응답 시간 (--processes 사용 시 수집 단계는 워커 프로세스에서 측정되어 빠진다)
+    metrics_path = f'{file_prefix}_metrics.json'
+    naver_land.metrics.save(metrics_path)
+    logging.info(f'수집 통계 저장: {metrics_path}')
+
+    # 실패한 읍/면/동(타일)이 있으면 0 이 아닌 종료 코드로 알린다 (--no-resume 없이 다시 실행하면 실패한 곳만 수집)
+    failed = checkpoint.state['failed']
+    if failed:
+        logging.error(f"수집에 실패한 {len(failed)}곳: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,753 @@
+import asyncio
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+
+import pandas as pd
+
+from article_index import ArticleIndex, UNCHANGED, article_key
+from batch_collector import BatchCheckpoint, BatchCollector, dong_targets
+from complex_info import ComplexInfoParseError, parse_complex_info
+from dedup import ListingDeduplicator
+from export_writer import StreamingExporter
+from filters import FilterSpec
+from front_api import ComplexArticles, ComplexListings
+from geo_index import tile_bounds, tiles_for_bbox
+from history_store import ListingHistoryStore
+from metrics import Metrics
+from prices import format_prices, parse_prices
+from naver_client import NaverClient, ThrottledError
+from progress_sink import default_sink
+from rate_limiter import AdaptiveRateLimiter
+from region_index import load_region_index, SIDO, DONG
+from response_cache import ResponseCache
+
+# 단계별 소요 시간/요청 통계 (수집 실행마다 metrics.reset())
+metrics = Metrics()
+# 호스트별 요청 속도 제한 (병렬 수집 시 공용)
+rate_limiter = AdaptiveRateLimiter(requests_per_second=5.0)
+# 모든 fetcher가 공유하는 HTTP 클라이언트
+client = NaverClient(rate_limiter=rate_limiter, cache=ResponseCache(), metrics=metrics)
+# 이전 수집 결과 (증분 수집용)
+article_index = ArticleIndex()
+history_store = ListingHistoryStore()
+
+
+# 작업 하나의 수집 통계와 rate limiter (collect_scope 안에서 사용)
+class CollectScope:
+    def __init__(self, requests_per_second=None):
+        self.metrics = Metrics()
+        self.rate_limiter = AdaptiveRateLimiter(requests_per_second=requests_per_second or rate_limiter.requests_per_second,
+                                                min_rate=rate_limiter.min_rate, max_rate=rate_limiter.max_rate)
+
+
+# 여러 수집을 한 프로세스에서 동시에 실행할 때 수집별 통계/요청 속도를 나눈다
+#
+# with 블록 안 (그 안에서 시작한 worker 스레드 포함) 의 통계는 공용 metrics 와 scope.metrics 에 함께 기록되고,
+# 요청은 공용 rate_limiter 설정을 바꾸지 않고 requests_per_second 에서 시작하는 scope.rate_limiter 로 속도를 조절한다.
+@contextmanager
+def collect_scope(requests_per_second=None):
+    scope = CollectScope(requests_per_second)
+    with metrics.scoped(scope.metrics), rate_limiter.scoped(scope.rate_limiter):
+        yield scope
+
+
+# executor 에 현재 컨텍스트 (collect_scope) 를 이어받아 실행하도록 제출
+def submit_in_context(executor, func, *args):
+    return executor.submit(contextvars.copy_context().run, func, *args)
+
+
+# JSON 파일에서 법정동 코드 가져오기
+def get_dong_codes_for_city(city_name, sigungu_name=None, json_path='korea_region_data.json', sink=default_sink):
+    try:
+        region_index = load_region_index(json_path)
+    except FileNotFoundError:
+        sink.error(f"Error: The file at {json_path} was not found.")
+        return None, None
+
+    si_do = region_index.find_one(city_name, level=SIDO)
+    if si_do is None:
+        return None, None
+
+    if sigungu_name and sigungu_name != '전체':
+        sigungu = region_index.child(si_do.code, sigungu_name)
+        if sigungu is None:
+            return None, None
+        return [sigungu.code], [{'code': dong.code, 'name': dong.name} for dong in region_index.children(sigungu.code)]
+
+    sigungu_codes = [sigungu.code for sigungu in region_index.children(si_do.code)]
+    dong_codes = [{'code': dong.code, 'name': dong.name} for dong in region_index.descendants(si_do.code, level=DONG)]
+    return sigungu_codes, dong_codes
+
+# 페이지 단위 목록 API 를 순서대로 반환 (window 만큼 다음 페이지를 미리 요청)
+#
+# 다음 페이지가 있으면 현재 페이지를 반환하기 전에 다음 요청을 보내므로,
+# 호출한 쪽이 현재 페이지를 처리하는 동안 다음 페이지가 내려받아진다.
+# 첫 페이지는 혼자 요청하고 (한 페이지짜리 목록에 불필요한 요청을 보내지 않도록), 다음 페이지가 있다고 확인된 뒤부터
+# window 페이지 앞까지 미리 요청한다. 마지막 페이지 이후 요청은 버린다.
+def iter_pages(fetch_page, has_more, first_page=0, window=1):
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        pending = {first_page: submit_in_context(executor, fetch_page, first_page)}
+        next_page = first_page + 1
+        page = first_page
+        try:
+            while True:
+                result = pending.pop(page).result()
+                more = has_more(result)
+                if more:
+                    while next_page <= page + window:
+                        pending[next_page] = submit_in_context(executor, fetch_page, next_page)
+                        next_page += 1
+                yield result
+                if not more:
+                    break
+                page += 1
+        finally:
+            for future in pending.values():
+                future.cancel()
+
+
+# 목록 API 가 중간 페이지에서 실패해 전체 목록을 받지 못한 경우
+class IncompleteListError(RuntimeError):
+    pass
+
+
+# 목록 API 페이지들을 DataFrame 묶음으로 반환 (isMoreData 를 따라 다음 페이지 요청)
+def iter_list_batches(url, referer, list_key, columns, dong_code, stage, sink=default_sink):
+    def fetch_page(page):
+        with metrics.stage(stage):
+            return client.get(f'{url}&page={page}', referer=referer).json()
+
+    try:
+        for page, data in enumerate(iter_pages(fetch_page, lambda data: bool(data.get('isMoreData')), first_page=1), start=1):
+            if not isinstance(data.get(list_key), list):
+                if page == 1:
+                    sink.warning(f"No data found for {dong_code}.")
+                    return
+                raise ValueError(f'{list_key} missing on page {page}')
+            df = pd.DataFrame(data[list_key])
+            for col in columns:
+                if col not in df.columns:
+                    df[col] = None
+            yield df[columns]
+    except ThrottledError:
+        # 요청 제한은 빈 결과로 처리하지 않고 호출한 쪽(배치 체크포인트 등)에서 실패로 기록
+        raise
+    except Exception as e:
+        sink.error(f"Error fetching data for {dong_code}: {e}")
+        raise IncompleteListError(f'{dong_code}: {e}') from e
+
+
+VL_LIST_COLUMNS = ['articleNo', 'articleName', 'articleStatus', 'realEstateTypeCode', 'realEstateTypeName', 'articleRealEstateTypeCode', 'articleRealEstateTypeName', 'tradeTypeCode', 'tradeTypeName', 'verificationTypeCode', 'floorInfo', 'priceChangeState', 'isPriceModification', 'dealOrWarrantPrc', 'area1', 'area2', 'direction', 'articleConfirmYmd', 'representativeImgUrl', 'representativeImgTypeCode', 'representativeImgThumb', 'siteImageCount', 'articleFeatureDesc', 'tagList', 'buildingName', 'sameAddrCnt', 'sameAddrDirectCnt', 'sameAddrMaxPrc', 'sameAddrMinPrc', 'cpid', 'cpName', 'cpPcArticleUrl', 'cpPcArticleBridgeUrl', 'cpPcArticleLinkUseAtArticleTitleYn', 'cpPcArticleLinkUseAtCpNameYn', 'cpMobileArticleUrl', 'cpMobileArticleLinkUseAtArticleTitleYn', 'cpMobileArticleLinkUseAtCpNameYn', 'latitude', 'longitude', 'isLocationShow', 'realtorName', 'realtorId', 'tradeCheckedByOwner', 'isDirectTrade', 'isInterest', 'isComplex', 'detailAddress', 'detailAddressYn', 'virtualAddressYn', 'isVrExposed', 'elevatorCount']
+
+APT_LIST_COLUMNS = ['complexNo', 'complexName', 'buildYear', 'totalHouseholdCount', 'areaSize', 'price', 'address', 'floor']
+
+
+# 목록 묶음 중 조건에 맞는 행만 남김 (제외한 수는 metrics 의 counter 로 기록)
+def _filter_batches(batches, mask, counter):
+    for frame in batches:
+        selected = frame[mask(frame)]
+        metrics.count(counter, len(frame) - len(selected))
+        yield selected
+
+
+def _iter_vl_articles(location, label, sink, filters):
+    filters = filters or FilterSpec()
+    query = {**location, 'realEstateType': 'VL', **filters.vl_query(), 'priceType': 'RETAIL'}
+    batches = iter_list_batches(
+        'https://new.land.naver.com/api/articles?' + '&'.join(f'{name}={value}' for name, value in query.items()),
+        f"https://new.land.naver.com/houses?a=VL&b={query['tradeType']}&e=RETAIL",
+        'articleList', VL_LIST_COLUMNS, label, 'vl_list', sink,
+    )
+    if filters.is_default:
+        return batches
+    return _filter_batches(batches, filters.vl_mask, 'filtered_articles')
+
+
+# 빌라 매물 목록을 페이지별 DataFrame 으로 반환 (filters 의 거래 유형/가격/최소 면적은 목록 API 쿼리로 보낸다)
+def iter_vl_list(dong_code, sink=default_sink, filters=None):
+    return _iter_vl_articles({'cortarNo': dong_code}, dong_code, sink, filters)
+
+
+def tile_code(tile):
+    return '_'.join(str(part) for part in tile)
+
+
+# 지도 타일 (zoom, x, y) 영역의 빌라 매물 목록을 페이지별 DataFrame 으로 반환 (지도 화면과 같은 영역 조회)
+def iter_vl_tile(tile, sink=default_sink, filters=None):
+    south, west, north, east = tile_bounds(*tile)
+    location = {'zoom': tile[0], 'leftLon': round(west, 7), 'rightLon': round(east, 7), 'topLat': round(north, 7),
+                'bottomLat': round(south, 7)}
+    return _iter_vl_articles(location, tile_code(tile), sink, filters)
+
+
+# 아파트 단지 목록을 페이지별 DataFrame 으로 반환 (filters 의 사용승인년도/세대수 조건에 맞는 단지만)
+def iter_apt_list(dong_code, sink=default_sink, filters=None):
+    batches = iter_list_batches(
+        f'https://new.land.naver.com/api/regions/complexes?cortarNo={dong_code}&realEstateType=A1&order=',
+        "https://new.land.naver.com/complexes/102378?a=APT&b=A1&e=RETAIL",
+        'complexList', APT_LIST_COLUMNS, dong_code, 'apt_list', sink,
+    )
+    if filters is None or filters.is_default:
+        return batches
+    return _filter_batches(batches, filters.complex_mask, 'filtered_complexes')
+
+
+# 목록 묶음을 하나의 DataFrame 으로 (중간에 끊긴 목록은 IncompleteListError 그대로 전달)
+def _concat_batches(batches, columns):
+    frames = list(batches)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+
+
+# 빌라 매물 전체 목록 (모든 페이지, 중간 페이지를 못 받으면 IncompleteListError)
+def get_vl_list(dong_code, sink=default_sink, filters=None):
+    return _concat_batches(iter_vl_list(dong_code, sink=sink, filters=filters), VL_LIST_COLUMNS)
+
+
+# 아파트 코드 리스트 가져오기 (모든 페이지)
+def get_apt_list(dong_code, sink=default_sink, filters=None):
+    return _concat_batches(iter_apt_list(dong_code, sink=sink, filters=filters), APT_LIST_COLUMNS)
+
+
+def vl_link(vl_code):
+    return f'https://new.land.naver.com/houses?articleNo={vl_code}'
+
+
+# 출력 컬럼 중 목록 API 에서 바로 채울 수 있는 항목 (출력 컬럼: 목록 항목)
+VL_LIST_COLUMN_SOURCES = {
+    'articleNo': 'articleNo',
+    'articleName': 'articleName',
+    'dealOrWarrantPrc': 'dealOrWarrantPrc',
+    'tradeTypeName': 'tradeTypeName',
+    'realestateTypeName': 'realEstateTypeName',
+    'detailAddress': 'detailAddress',
+    'articleFeatureDescription': 'articleFeatureDesc',
+    'tagList': 'tagList',
+}
+
+
+# 이력 저장/위치 조회용으로 함께 남기는 목록 API 항목 (면적/층/방향/좌표 등)
+VL_LIST_FIELDS = ['area1', 'area2', 'floorInfo', 'direction', 'realtorName', 'tradeTypeName', 'latitude', 'longitude']
+
+
+# 목록 API 항목으로 만든 VL 매물 (상세 조회 결과가 있으면 그 값이 우선)
+def vl_listing_from_list(vl_info):
+    listing = {column: vl_info.get(source) for column, source in VL_LIST_COLUMN_SOURCES.items()}
+    listing['link'] = vl_link(vl_info['articleNo'])
+    for key in VL_LIST_FIELDS:
+        listing[key] = vl_info.get(key)
+    return listing
+
+
+@metrics.timed('vl_details')
+def get_vl_details(vl_code, sink=default_sink):
+    try:
+        details_url = f'https://new.land.naver.com/api/articles/{vl_code}'
+        # 기본 정보 가져오기
+        r_details = client.get(details_url, referer=f'https://new.land.naver.com/houses?a=VL&e=RETAIL&articleNo={vl_code}')
+
+        payload = r_details.json()
+        vl_detail = payload.get('articleDetail')
+        vl_detail['link'] = vl_link(vl_code)
+        vl_detail['dealOrWarrantPrc'] = payload.get('articleAddition').get('dealOrWarrantPrc')
+        return vl_detail
+
+    except ThrottledError:
+        raise
+    except Exception as e:
+        sink.error(f"Error fetching details for {vl_code}: {e}")
+        return []
+
+
+# front-api 매물 페이지를 순서대로 반환하면서 다음 페이지를 미리 요청
+# (응답에 전체 페이지 수가 없어, prefetch 를 늘리면 단지마다 마지막 페이지 이후 prefetch - 1 건의 요청이 버려진다)
+def iter_front_api_pages(apt_code, prefetch=1):
+    front_api_url = 'https://fin.land.naver.com/front-api/v1/complex/article/list?complexNumber={}&userChannelType=PC&page={}'
+
+    def fetch_page(page):
+        r_front_article = client.get(front_api_url.format(apt_code, page))
+        return r_front_article.json().get('result')
+
+    return iter_pages(fetch_page, lambda front_result: front_result.get('hasNextPage'), window=prefetch)
+
+
+# 단지 정보 페이지에서 수집하는 항목
+APT_DETAIL_TERMS = ['공급면적', '전용면적', '해당면적 세대수', '현관구조', '방/욕실', '위치', '사용승인일', '세대수', '난방', '주차', '전기차 충전시설', '용적률/건폐율', '관리사무소 전화', '건설사']
+
+
+# 아파트 코드로 상세 정보 가져오기 (단지 정보 + 매물 record, row 는 iter_rows 로 만든다, 실패 시 None)
+@metrics.timed('apt_details')
+def get_apt_details(apt_code, sink=default_sink, dedup=None, filters=None):
+    details_url = f'https://fin.land.naver.com/complexes/{apt_code}?tab=complex-info'
+
+    try:
+        # 기본 정보 가져오기
+        r_details = client.get(details_url)
+        # 페이지 구조가 바뀌어 단지명/항목을 찾지 못하면 ComplexInfoParseError 로 실패
+        with metrics.stage('complex_info.parse'):
+            apt_name, details = parse_complex_info(r_details.content, APT_DETAIL_TERMS, source=details_url)
+        complex_articles = ComplexArticles({'complexNo': apt_code, 'complexName': apt_name, **details})
+
+        # 매물 front-api
+        for front_result in iter_front_api_pages(apt_code):
+            with metrics.stage('front_api.flatten'):
+                complex_articles.add_page(front_result.get('list'), dedup=dedup, filters=filters)
+
+        metrics.count('complexes')
+        metrics.count('apt_articles', len(complex_articles))
+        metrics.count('duplicates', complex_articles.dropped)
+        metrics.count('filtered_articles', complex_articles.filtered)
+        return complex_articles
+
+    # 요청 제한은 단지 하나의 실패가 아니므로 읍면동 전체를 실패로 기록하도록 그대로 올린다
+    except ThrottledError:
+        raise
+    # 페이지 구조가 바뀐 단지는 이 단지만 실패로 알리고, 같은 읍면동의 다른 단지는 계속 수집
+    except ComplexInfoParseError as e:
+        metrics.count('complex_info_errors')
+        sink.error(f"단지 정보 페이지를 해석하지 못했습니다 ({apt_code}): {e}")
+        return None
+    except Exception as e:
+        sink.error(f"Error fetching details for {apt_code}: {e}")
+        return None
+
+
+# 단지별 상세 정보를 병렬로 수집 (결과는 단지 목록 순서대로 반환, 실패한 단지는 None)
+def collect_apt_details_parallel(apt_codes, sink=default_sink, max_workers=4, dedup=None, filters=None):
+    apt_infos = [(apt_info['complexNo'], apt_info['complexName']) for _, apt_info in apt_codes.iterrows()]
+    results = [None] * len(apt_infos)
+
+    def fetch(apt_code):
+        sink.bind_thread()
+        return get_apt_details(apt_code, sink=sink, dedup=dedup, filters=filters)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {submit_in_context(executor, fetch, apt_code): idx for idx, (apt_code, _) in enumerate(apt_infos)}
+        done = 0
+        for future in as_completed(futures):
+            idx = futures[future]
+            results[idx] = future.result()
+            done += 1
+            apt_code, apt_name = apt_infos[idx]
+            sink.status(f"{apt_name} ({apt_code}) - 수집완료 ({done}/{len(apt_infos)})")
+
+    return results
+
+
+# VL 상세 API 를 asyncio 로 동시에 조회 (요청은 공용 client 를 스레드에서 사용하므로 rate limiter/캐시/재시도가 그대로 적용)
+async def fetch_vl_details_async(vl_codes, sink=default_sink, max_concurrency=4):
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    def fetch(vl_code):
+        sink.bind_thread()
+        return get_vl_details(vl_code, sink=sink)
+
+    async def fetch_one(vl_code):
+        async with semaphore:
+            return await asyncio.to_thread(fetch, vl_code)
+
+    return await asyncio.gather(*(fetch_one(vl_code) for vl_code in vl_codes))
+
+
+# 입력 순서대로 VL 상세 결과 목록 반환 (실패한 매물은 [])
+def collect_vl_details(vl_codes, sink=default_sink, max_concurrency=4):
+    if not vl_codes:
+        return []
+    return asyncio.run(fetch_vl_details_async(vl_codes, sink=sink, max_concurrency=max_concurrency))
+
+
+# 빌라 매물의 (건물, 동, 층, 면적, 가격) 중복 판단 키 (건물을 알 수 없으면 None: 매물 번호로만 판단)
+# 빌라는 매물명이 '빌라' 처럼 일반적인 경우가 많아 건물명이 없으면 좌표로 건물을 구분한다.
+def vl_property_key(vl_info, dong_code):
+    building = vl_info.get('buildingName')
+    if not isinstance(building, str) or not building:
+        latitude, longitude = vl_info.get('latitude'), vl_info.get('longitude')
+        if pd.isna(latitude) or pd.isna(longitude):
+            return None
+        building = f'{latitude},{longitude}'
+    return building, dong_code, vl_info.get('floorInfo'), vl_info.get('area1'), vl_info.get('dealOrWarrantPrc')
+
+
+# 빌라 매물 한 묶음을 목록 값 + (선택) 상세 API 값으로 변환
+#
+# 읍면동 단위 수집이면 매물에 dong_code/dong_name 을 붙인다 (상세 없이 목록만 수집해도 이력의 시군구/읍면동이 비지 않도록).
+# 타일 수집처럼 dong_code 가 읍면동 코드가 아니면 in_dong=False 로 넘겨 상세의 cortarNo/sectionName 을 쓴다.
+def collect_vl_batch(vl_articles, scope, article_status, dong_code, dong_name, sink=default_sink, max_workers=4, incremental=False,
+                     vl_details=True, dedup=None, in_dong=True):
+    if dedup is not None:
+        # 이미 나온 매물은 상세 조회 전에 제외 (증분 수집이면 다음 실행에서 신규로 보이지 않도록 목록 값만 기록)
+        unique = []
+        for vl_info in vl_articles:
+            if dedup.first_listing(vl_info['articleNo'], vl_property_key(vl_info, dong_code)):
+                unique.append(vl_info)
+            elif incremental:
+                article_index.update(scope, vl_info)
+        metrics.count('duplicates', len(vl_articles) - len(unique))
+        vl_articles = unique
+
+    if vl_details and vl_articles:
+        sink.status(f'{dong_name} ({dong_code}) - 빌라 매물 {len(vl_articles)}건 상세 수집중입니다.')
+        details = collect_vl_details([vl_info['articleNo'] for vl_info in vl_articles], sink=sink, max_concurrency=max_workers)
+    else:
+        details = [None] * len(vl_articles)
+
+    listings = []
+    for vl_info, detail in zip(vl_articles, details):
+        # 상세 조회에 실패한 매물은 제외
+        if vl_details and not detail:
+            continue
+        listing = vl_listing_from_list(vl_info)
+        if detail:
+            listing.update(detail)
+        if in_dong:
+            listing['dong_code'] = dong_code
+            listing['dong_name'] = dong_name
+        metrics.count('vl_articles')
+        if incremental:
+            article_index.update(scope, vl_info, detail)
+            listing['changeType'] = article_status[article_key(vl_info)]
+        listings.append(listing)
+    return listings
+
+
+# 읍면동 하나의 매물 수집 (APT: 단지별 매물 목록, VL: 매물 상세)
+#
+# VL 은 목록 API 값으로 기본 항목을 채우고, vl_details=True 이면 나머지 항목을 상세 API 로 동시에 조회한다.
+# dedup 은 True (이 읍면동 안에서 중복 제거), False (끄기) 또는 여러 읍면동이 공유하는 ListingDeduplicator.
+# filters(FilterSpec) 에 맞지 않는 단지/매물은 목록 단계에서 걸러 상세 조회를 하지 않는다.
+# 목록을 끝까지 받지 못하면 (IncompleteListError) 일부만 모은 결과를 돌려주지 않고 그대로 올린다
+# (배치 수집은 해당 읍면동을 실패로 기록하고, 다시 실행하면 이어서 수집).
+def collect_dong_listings(dong_code, dong_name, property_type, sink=default_sink, max_workers=4, incremental=False, vl_details=True,
+                          dedup=True, filters=None):
+    listings = []
+    delisted_articles = []
+    if dedup is True:
+        dedup = ListingDeduplicator()
+    dedup = dedup or None
+    if filters is not None and filters.is_default:
+        filters = None
+
+    sink.status(f"{dong_name} ({dong_code}) - 수집중입니다.")
+    metrics.count('dongs')
+    if property_type == 'APT':
+        # row 는 저장할 때 만든다 (ComplexListings)
+        listings = ComplexListings()
+        found = False
+        # 단지 목록 다음 페이지를 받는 동안 현재 페이지 단지들의 상세 정보를 수집
+        for apt_codes in iter_apt_list(dong_code, sink=sink, filters=filters):
+            found = found or not apt_codes.empty
+            if dedup is not None:
+                # 인접 읍면동 목록에 함께 나온 단지는 한 번만 수집 (상세 정보를 받지 못한 단지는 다른 읍면동에서 다시 시도)
+                apt_codes = apt_codes[apt_codes['complexNo'].map(dedup.first_complex).astype(bool)]
+            results = collect_apt_details_parallel(apt_codes, sink=sink, max_workers=max_workers, dedup=dedup, filters=filters)
+            for apt_code, complex_articles in zip(apt_codes['complexNo'], results):
+                if complex_articles is None and dedup is not None:
+                    dedup.release_complex(apt_code)
+                listings.add(complex_articles, dong_code=dong_code, dong_name=dong_name)
+        if not found:
+            sink.warning(f"No apartment codes found for {dong_code}" + (" matching filters" if filters is not None else ""))
+    else:
+        scope = f'VL:{dong_code}'
+        article_status = {}
+        if incremental:
+            previously_active = article_index.active_keys(scope)
+
+        for vl_codes in iter_vl_list(dong_code, sink=sink, filters=filters):
+            vl_articles = [vl_info.to_dict() for _, vl_info in vl_codes.iterrows()]
+            if incremental:
+                batch_status, _ = article_index.diff(scope, vl_articles)
+                article_status.update(batch_status)
+
+                # 이전 수집 이후 변동이 없는 매물은 상세 조회를 건너뜀
+                for vl_info in vl_articles:
+                    if batch_status[article_key(vl_info)] == UNCHANGED:
+                        article_index.update(scope, vl_info)
+                vl_articles = [vl_info for vl_info in vl_articles if batch_status[article_key(vl_info)] != UNCHANGED]
+
+            listings.extend(collect_vl_batch(vl_articles, scope, article_status, dong_code, dong_name, sink,
+                                             max_workers, incremental, vl_details, dedup))
+
+        # 여기까지 오면 목록 전체를 받은 것이므로 이번에 보이지 않은 매물을 삭제로 처리 (빈 목록은 조회 실패일 수 있어 제외)
+        # 조건을 걸고 수집하면 조건 밖의 매물이 목록에 없으므로 삭제 처리하지 않는다
+        if incremental and article_status and filters is None:
+            delisted_articles = [key for key in previously_active if key not in article_status]
+            article_index.mark_delisted(delisted_articles)
+
+    return listings, delisted_articles
+
+
+naver_district_url = 'https://new.land.naver.com/api/regions/list?cortarNo={}'
+
+
+# 네이버 지역 목록 조회 ({cortarName: cortarNo}, 실패 시 None)
+def get_region_list(cortar_no):
+    try:
+        response = client.get(naver_district_url.format(cortar_no))
+    except ThrottledError:
+        return None
+    if response.status_code == 200:
+        data = response.json().get('regionList', [])
+        return {item['cortarName']: item['cortarNo'] for item in data}
+    return None
+
+
+# 네이버 지역 목록 API 로 시/도 또는 군/구 하위 읍면동 목록 조회
+def naver_dong_targets(region_cortar_no):
+    region_cortar_no = str(region_cortar_no)
+    if region_cortar_no[2:].strip('0'):
+        sigungu_codes = [region_cortar_no]
+    else:
+        sigungu_codes = list((get_region_list(region_cortar_no) or {}).values())
+
+    return [
+        {'code': dong_code, 'name': dong_name}
+        for sigungu_code in sigungu_codes
+        for dong_name, dong_code in (get_region_list(sigungu_code) or {}).items()
+    ]
+
+
+
+# 시/도 또는 군/구 전체 읍면동을 작업 큐로 수집 (중단 시 체크포인트부터 이어서 수집)
+#
+# 수집 결과는 읍면동별로 체크포인트 디렉토리에 저장되고, (dongs, checkpoint) 를 반환한다.
+# 결과 row 는 checkpoint.iter_results(dongs) 로 한 읍면동씩 읽는다.
+# collect_dong 을 넘기지 않으면 현재 프로세스의 스레드에서 collect_dong_listings 를 실행한다.
+def collect_region(region_cortar_no, property_type, checkpoint_dir=os.path.join('.cache', 'batch'), max_workers=4,
+                   max_concurrency=2, resume=True, incremental=False, sink=default_sink, worker_sink=None, collect_dong=None,
+                   vl_details=True, dedup=True, filters=None):
+    dongs = dong_targets(region_cortar_no)
+    if not dongs:
+        # district.json 에 없는 코드(행정구역 개편 등)는 네이버 지역 목록으로 대체
+        dongs = naver_dong_targets(region_cortar_no)
+    if not dongs:
+        sink.warning(f"No dong codes found for {region_cortar_no}")
+        return [], None
+
+    # 조건이 다른 수집은 체크포인트를 따로 둔다
+    suffix = f'_{filters.key()}' if filters is not None and filters.key() else ''
+    checkpoint = BatchCheckpoint(os.path.join(checkpoint_dir, f'{property_type}_{region_cortar_no}{suffix}'))
+    if not resume:
+        checkpoint.reset()
+
+    if collect_dong is None:
+        worker_sink = worker_sink or sink
+        # 읍면동 전체가 하나의 seen-set 을 공유 (이어서 수집할 때 이전 실행에서 저장한 매물은 포함되지 않음)
+        if dedup is True:
+            dedup = ListingDeduplicator.for_dongs(len(dongs))
+
+        def collect_dong(dong):
+            worker_sink.bind_thread()
+            listings, _ = collect_dong_listings(dong['code'], dong['name'], property_type, sink=worker_sink,
+                                                max_workers=max_workers, incremental=incremental, vl_details=vl_details,
+                                                dedup=dedup, filters=filters)
+            return listings
+
+    def on_progress(dong, dong_status, finished, total):
+        sink.progress(finished, total)
+        sink.status(f"{dong['name']} ({dong['code']}) - {dong_status} ({finished}/{total})")
+
+    collector = BatchCollector(collect_dong, checkpoint, max_concurrency=max_concurrency, on_progress=on_progress)
+    collector.run(dongs)
+
+    failed = checkpoint.state['failed']
+    if failed:
+        sink.warning(f"수집에 실패한 읍/면/동 {len(failed)}곳: {', '.join(failed)} (다시 실행하면 실패한 곳만 이어서 수집합니다)")
+
+    return dongs, checkpoint
+
+
+# 지도 타일 기본 zoom (약 1.2km x 1km) 과 한 번에 수집할 수 있는 타일 수
+TILE_ZOOM = 15
+MAX_TILES = 2000
+
+
+# 지도 타일 하나의 빌라 매물 수집 (bounds 밖 좌표의 매물은 제외해 이웃 타일과 겹치지 않게 한다)
+def collect_tile_listings(tile, bounds, sink=default_sink, max_workers=4, vl_details=True, dedup=None, filters=None):
+    south, west, north, east = bounds
+    code = tile_code(tile)
+    listings = []
+    metrics.count('tiles')
+    # 목록을 끝까지 받지 못하면 IncompleteListError 로 실패 처리 (다시 실행하면 이 타일만 이어서 수집)
+    for vl_codes in iter_vl_tile(tile, sink=sink, filters=filters):
+        latitudes = pd.to_numeric(vl_codes['latitude'], errors='coerce')
+        longitudes = pd.to_numeric(vl_codes['longitude'], errors='coerce')
+        # 좌표가 없는 매물은 남기고 중복 제거에 맡긴다
+        outside = latitudes.lt(south) | latitudes.ge(north) | longitudes.lt(west) | longitudes.ge(east)
+        vl_articles = [vl_info.to_dict() for _, vl_info in vl_codes[~outside].iterrows()]
+        listings.extend(collect_vl_batch(vl_articles, f'VL:{code}', {}, code, f'타일 {code}', sink, max_workers,
+                                         vl_details=vl_details, dedup=dedup, in_dong=False))
+    return listings
+
+
+# (남, 서, 북, 동) 영역을 덮는 지도 타일만 작업 큐로 수집 (VL, 읍면동 전체 대신 필요한 영역만 조회)
+#
+# collect_region 과 같이 타일별로 체크포인트에 저장하고 (tiles, checkpoint) 를 반환한다.
+# 지도 목록 API 의 영역 조회는 증분 수집(읍면동 단위 이전 목록 비교)을 지원하지 않는다.
+def collect_area(bbox, zoom=TILE_ZOOM, checkpoint_dir=os.path.join('.cache', 'batch'), max_workers=4, max_concurrency=2,
+                 resume=True, sink=default_sink, worker_sink=None, vl_details=True, dedup=True, filters=None):
+    south, west, north, east = bbox
+    if south >= north or west >= east:
+        raise ValueError(f'잘못된 영역입니다: {bbox}')
+    tiles = tiles_for_bbox(south, west, north, east, zoom)
+    if len(tiles) > MAX_TILES:
+        raise ValueError(f'타일 {len(tiles)}개는 너무 많습니다 (최대 {MAX_TILES}개). 영역을 줄이거나 zoom 을 낮추세요.')
+    targets = [{'code': tile_code(tile), 'name': f'타일 {tile_code(tile)}', 'tile': tile} for tile in tiles]
+
+    suffix = f'_{filters.key()}' if filters is not None and filters.key() else ''
+    checkpoint = BatchCheckpoint(os.path.join(checkpoint_dir, f"VL_bbox_{'_'.join(str(value) for value in bbox)}_{zoom}{suffix}"))
+    if not resume:
+        checkpoint.reset()
+
+    worker_sink = worker_sink or sink
+    if dedup is True:
+        dedup = ListingDeduplicator.for_dongs(len(tiles))
+    dedup = dedup or None
+    if filters is not None and filters.is_default:
+        filters = None
+
+    def collect_tile(target):
+        worker_sink.bind_thread()
+        tile_south, tile_west, tile_north, tile_east = tile_bounds(*target['tile'])
+        bounds = (max(south, tile_south), max(west, tile_west), min(north, tile_north), min(east, tile_east))
+        return collect_tile_listings(target['tile'], bounds, sink=worker_sink, max_workers=max_workers, vl_details=vl_details,
+                                     dedup=dedup, filters=filters)
+
+    def on_progress(target, tile_status, finished, total):
+        sink.progress(finished, total)
+        sink.status(f"{target['name']} - {tile_status} ({finished}/{total})")
+
+    BatchCollector(collect_tile, checkpoint, max_concurrency=max_concurrency, on_progress=on_progress).run(targets)
+
+    failed = checkpoint.state['failed']
+    if failed:
+        sink.warning(f"수집에 실패한 타일 {len(failed)}곳: {', '.join(failed)} (다시 실행하면 실패한 곳만 이어서 수집합니다)")
+
+    return targets, checkpoint
+
+
+# 원 단위 숫자 매매가 컬럼 (APT/VL 공통)
+PRICE_COLUMN = '매매가(원)'
+
+# 한글 컬럼명 딕셔너리 매핑
+VL_COLUMN_NAME_MAPPING = {
+    'articleNo': '매물번호',
+    'articleName': '매물명',
+    'cortarNo': '코드',
+    'totalDongCount': '건물 동 수',
+    'buildingTypeName': '건물 유형',
+    'realestateTypeName': '매물 유형',
+    'tradeTypeName': '거래 유형',
+    'cityName': '시/도',
+    'divisionName': '시/군/구',
+    'sectionName': '읍면동',
+    'walkingTimeToNearSubway': '지하철 도보시간',
+    'grandPlanList': '대지 계획',
+    'detailAddress': '상세 주소',
+    'exposureAddress': '노출 주소',
+    'latitude': '위도',
+    'longitude': '경도',
+    'roomCount': '방 개수',
+    'bathroomCount': '욕실 개수',
+    'moveInTypeName': '입주 형태',
+    'moveInDiscussionPossibleYN': '입주 협의 가능여부',
+    'articleFeatureDescription': '특징 설명',
+    'detailDescription': '상세 설명',
+    'parkingCount': '주차 가능 대수',
+    'parkingPerHouseholdCount': '가구당 주차 대수',
+    'parkingPossibleYN': '주차 가능 여부',
+    'floorLayerName': '층 정보',
+    'lawUsage': '법적 용도',
+    'tagList': '태그',
+    'link': '매물 링크',
+    'dealOrWarrantPrc': '매매가',
+    'dealPrice': PRICE_COLUMN,
+    'changeType': '변동 구분',
+}
+
+VL_REQUIRED_COLUMNS = ['articleNo', 'articleName', 'dealOrWarrantPrc', 'cortarNo', 'totalDongCount', 'buildingTypeName', 'realestateTypeName', 'tradeTypeName', 'cityName', 'divisionName',
+                       'sectionName', 'walkingTimeToNearSubway', 'grandPlanList', 'detailAddress', 'exposureAddress', 'latitude', 'longitude', 'roomCount', 'bathroomCount', 'moveInTypeName', 'moveInDiscussionPossibleYN',
+                       'articleFeatureDescription', 'detailDescription', 'parkingCount', 'parkingPerHouseholdCount', 'parkingPossibleYN', 'floorLayerName', 'lawUsage', 'tagList', 'link']
+
+# 아파트 결과 컬럼 순서 (매물 정보 → 단지 정보 → 지역)
+APT_EXPORT_COLUMNS = (['complexNo', '매물link', '매매가', PRICE_COLUMN, '매물명', '중개업체'] + APT_DETAIL_TERMS
+                      + ['거래방식', '층수', '면적', '코멘트', '방향', '이미지', 'dong_code', 'dong_name', 'si_do_name', 'sigungu_name'])
+
+
+def vl_source_columns(incremental=False):
+    # link 를 두 번째 컬럼으로, 숫자 매매가는 매매가 다음 컬럼으로
+    columns = ['articleNo', 'link']
+    for column in VL_REQUIRED_COLUMNS[1:]:
+        if column != 'link':
+            columns.append(column)
+        if column == 'dealOrWarrantPrc':
+            columns.append('dealPrice')
+    if incremental:
+        columns.append('changeType')
+    return columns
+
+
+# 출력 컬럼명 목록
+def export_columns(property_type, incremental=False):
+    if property_type == 'APT':
+        return list(APT_EXPORT_COLUMNS)
+    return [VL_COLUMN_NAME_MAPPING.get(column, column) for column in vl_source_columns(incremental)]
+
+
+def _column(df, name):
+    return df[name] if name in df.columns else pd.Series(None, index=df.index, dtype=object)
+
+
+# 수집한 매물 목록을 출력 컬럼 기준 DataFrame 으로 변환
+#
+# 매매가는 원 단위 숫자 컬럼(PRICE_COLUMN)으로 두고 (정렬/필터/집계용), APT 의 표시용 '매매가' 문자열은 여기서 한 번에 만든다.
+# VL 은 목록/상세의 가격 문자열을 그대로 표시하고, 금액 하나로 된 문자열만 숫자로 바꾼다 (월세 '1,000/50' 등은 빈 값).
+def result_frame(property_type, listings, city_name, sigungu_name, dong_name=None, incremental=False):
+    df = pd.DataFrame(listings if isinstance(listings, list) else list(listings))
+    if property_type == 'APT':
+        df['si_do_name'] = city_name
+        df['sigungu_name'] = sigungu_name
+        # 배치 수집(dong_name 없음)은 매물별 dong_name 을 그대로 사용
+        if dong_name:
+            df['dong_name'] = dong_name
+        df[PRICE_COLUMN] = parse_prices(_column(df, 'dealPrice'), default_unit=1)
+        df['매매가'] = format_prices(df[PRICE_COLUMN])
+        return df.reindex(columns=export_columns(property_type, incremental))
+
+    df['dealPrice'] = parse_prices(_column(df, 'dealOrWarrantPrc'))
+    return df.reindex(columns=vl_source_columns(incremental)).rename(columns=VL_COLUMN_NAME_MAPPING)
+
+
+# 수집 결과를 출력용 DataFrame 으로 변환 (화면 표시용)
+@metrics.timed('dataframe')
+def build_result_dataframe(property_type, listings, city_name, sigungu_name, dong_name=None, incremental=False):
+    if not listings:
+        return None
+    return result_frame(property_type, listings, city_name, sigungu_name, dong_name, incremental)
+
+
+# 수집 결과를 CSV/XLSX/Parquet 파일로 스트리밍 저장하고 exporter 를 반환 (exporter.paths, exporter.row_count)
+# 매물은 batch_size 건씩 DataFrame 으로 묶어 가격 변환/포맷을 한 번에 처리한다.
+@metrics.timed('export')
+def export_listings(listings, property_type, path_prefix, city_name, sigungu_name, dong_name=None, incremental=False,
+                    formats=('csv', 'xlsx'), batch_size=5000):
+    with StreamingExporter(path_prefix, export_columns(property_type, incremental), formats=formats) as exporter:
+        batch = []
+        for listing in listings:
+            batch.append(listing)
+            if len(batch) >= batch_size:
+                exporter.write_frame(result_frame(property_type, batch, city_name, sigungu_name, dong_name, incremental))
+                batch = []
+        if batch:
+            exporter.write_frame(result_frame(property_type, batch, city_name, sigungu_name, dong_name, incremental))
+    return exporter
+
+
+# 수집 결과를 날짜/지역 파티션 Parquet 이력에 누적 저장 (저장 실패가 수집 결과에 영향을 주지 않도록 오류만 표시)
+@metrics.timed('history')
+def record_history(property_type, listings, city_name, sigungu_name, sink=default_sink):
+    try:
+        return history_store.append(property_type, listings, city_name, sigungu_name)
+    except Exception as e:
+        sink.error(f"Error saving listing history: {e}")
+        return 0
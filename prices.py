@@ -0,0 +1,151 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# pyarrow 가 있으면 문자열 파싱/포맷을 Arrow compute 로 처리 (없으면 한 건씩 처리)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+# 한글 금액 단위 (VL 목록의 '3억 5,000' 은 만원 단위)
+PRICE_UNITS = {'조': 1_0000_0000_0000, '억': 1_0000_0000, '만': 1_0000, '천': 1000}
+_PRICE_TOKEN = re.compile(r'([\d,.]+)\s*(조|억|만|천)?')
+# 금액 하나로만 이루어진 문자열 ('1,000/50' 같은 월세 보증금/월세 등은 제외)
+_SINGLE_PRICE = re.compile(r'\s*(?:[\d,.]+\s*[조억만천]+\s*)*(?:[\d,.]+\s*)?원?\s*')
+
+
+# '3억 5,000' → 350000000 (단위가 없는 마지막 숫자는 만원 단위, 금액 하나가 아닌 문자열은 None)
+def parse_price(value, default_unit=1_0000):
+    if value is None or isinstance(value, (int, float)):
+        return None if value is None or value != value else int(value)
+    text = str(value)
+    if not _SINGLE_PRICE.fullmatch(text):
+        return None
+    tokens = _PRICE_TOKEN.findall(text)
+    if not tokens:
+        return None
+    total = 0
+    for number, unit in tokens:
+        try:
+            number = float(number.replace(',', ''))
+        except ValueError:
+            continue
+        total += int(number * (PRICE_UNITS[unit] if unit else default_unit))
+    return total
+
+
+def format_amount(amount):
+    if amount >= 1_0000_0000:  # 억 단위 이상
+        billions = amount // 1_0000_0000  # 억 단위
+        remainder = amount % 1_0000_0000  # 나머지 금액
+        if remainder > 0:
+            remainder_million = remainder // 10_000  # 만 단위 추출
+            return f"{billions}억 {remainder_million:,}만"
+        else:
+            return f"{billions}억"
+    elif amount >= 10_000:  # 만 단위 이상
+        return f"{amount // 10_000}만"
+    else:  # 만 단위 미만
+        return f"{amount:,}원"
+
+
+# 가장 흔한 금액 문자열 형식 ('1조 2억 3천 4,500만', '3억 5,000', '5,000') - 이 형식이 아닌 값은 parse_price 로 하나씩 처리
+_PRICE_PATTERN = (r'^\s*(?:(?P<jo>\d[\d,]*(?:\.\d+)?)\s*조)?\s*(?:(?P<eok>\d[\d,]*(?:\.\d+)?)\s*억)?'
+                  r'\s*(?:(?P<cheon>\d[\d,]*(?:\.\d+)?)\s*천)?\s*(?:(?P<rest>\d[\d,]*(?:\.\d+)?)\s*(?P<man>만)?)?\s*$')
+
+
+def _field_amount(matches, name, unit):
+    text = pc.replace_substring(matches.field(name), ',', '')
+    number = pc.cast(pc.if_else(pc.equal(text, ''), None, text), pa.float64()).to_numpy(zero_copy_only=False)
+    return np.trunc(number * unit)
+
+
+# 금액 문자열 목록을 원 단위 float 배열로 변환 (형식이 맞지 않는 값은 NaN, 숫자가 하나도 없으면 NaN)
+def _parse_texts(texts, default_unit):
+    matches = pc.extract_regex(pa.array(texts, pa.string()), _PRICE_PATTERN)
+    matched = matches.is_valid().to_numpy(zero_copy_only=False)
+    matches = matches.fill_null({'jo': '', 'eok': '', 'cheon': '', 'rest': '', 'man': ''})
+
+    rest_unit = np.where(pc.equal(matches.field('man'), '만').to_numpy(zero_copy_only=False), PRICE_UNITS['만'], default_unit)
+    parts = np.vstack([
+        _field_amount(matches, 'jo', PRICE_UNITS['조']),
+        _field_amount(matches, 'eok', PRICE_UNITS['억']),
+        _field_amount(matches, 'cheon', PRICE_UNITS['천']),
+        _field_amount(matches, 'rest', 1) * rest_unit,
+    ])
+    totals = np.where(np.isnan(parts).all(axis=0), np.nan, np.nansum(parts, axis=0))
+    return totals, matched
+
+
+# 금액 목록(숫자 또는 '3억 5,000' 같은 문자열)을 원 단위 Int64 Series 로 변환 (parse_price 의 벡터 버전)
+#
+# 숫자는 원 단위로 그대로 두고, 문자열은 (숫자 × 단위) 의 합으로 바꾼다. 단위가 없는 숫자는 default_unit 단위.
+# 금액 하나가 아닌 문자열 (월세 '1,000/50' 등) 은 NA.
+# pyarrow 가 있으면 정규식/변환을 Arrow compute 로 한 번에 처리한다.
+def parse_prices(values, default_unit=1_0000):
+    series = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+    result = pd.Series(pd.NA, index=series.index, dtype='Int64')
+    if series.empty:
+        return result
+
+    if series.dtype == object:
+        is_text = series.map(type).eq(str)
+    elif pd.api.types.is_string_dtype(series.dtype):
+        is_text = series.notna()
+    else:
+        is_text = pd.Series(False, index=series.index)
+
+    numbers = pd.to_numeric(series[~is_text], errors='coerce')
+    result[~is_text] = np.trunc(numbers).astype('Int64')
+
+    texts = series[is_text]
+    if texts.empty:
+        return result
+    if pc is None:
+        result[is_text] = pd.array(texts.map(lambda text: parse_price(text, default_unit)).tolist(), dtype='Int64')
+        return result
+
+    totals, matched = _parse_texts(texts.tolist(), default_unit)
+    if not matched.all():
+        totals[~matched] = [np.nan if value is None else value
+                            for value in texts[~matched].map(lambda text: parse_price(text, default_unit))]
+    result[is_text] = pd.array(np.round(totals), dtype='Int64')
+    return result
+
+
+def _strings(values):
+    return pc.cast(pa.array(values), pa.string())
+
+
+# 0 ~ 9999 → '1,234'
+def _group_thousands(values):
+    return pc.if_else(pa.array(values < 1000), _strings(values),
+                      pc.binary_join_element_wise(_strings(values // 1000), pc.utf8_lpad(_strings(values % 1000), 3, '0'), ','))
+
+
+# 원 단위 금액 목록을 '3억 5,000만' 형식 문자열 Series 로 변환 (format_amount 의 벡터 버전, 값이 없으면 None)
+def format_prices(amounts):
+    amounts = amounts if isinstance(amounts, pd.Series) else pd.Series(list(amounts), dtype=object)
+    numbers = pd.to_numeric(amounts, errors='coerce')
+    valid = numbers.notna().to_numpy()
+    if pc is None or not valid.any():
+        return pd.Series([format_amount(int(value)) if ok else None for value, ok in zip(numbers, valid)], index=amounts.index, dtype=object)
+
+    amount = numbers.fillna(0).to_numpy(dtype='int64')
+    billions = amount // 1_0000_0000
+    remainder_million = amount % 1_0000_0000 // 1_0000
+    formatted = pc.if_else(
+        pa.array(amount >= 1_0000_0000),
+        pc.if_else(pa.array(remainder_million > 0),
+                   pc.binary_join_element_wise(_strings(billions), '억 ', _group_thousands(remainder_million), '만', ''),
+                   pc.binary_join_element_wise(_strings(billions), '억', '')),
+        pc.if_else(pa.array(amount >= 1_0000),
+                   pc.binary_join_element_wise(_strings(amount // 1_0000), '만', ''),
+                   pc.binary_join_element_wise(_group_thousands(np.clip(amount, 0, 9999)), '원', '')),
+    )
+    formatted = pc.if_else(pa.array(valid), formatted, pa.scalar(None, pa.string()))
+    return formatted.to_pandas().set_axis(amounts.index)
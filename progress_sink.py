@@ -0,0 +1,40 @@
+import logging
+
+logger = logging.getLogger('naver_land')
+
+
+# 수집 진행 상황/경고/오류를 받는 sink (기본: logging 으로 출력)
+#
+# Streamlit 등 UI 는 이 클래스를 상속해 status/warning/error 를 화면에 표시한다.
+# bind_thread() 는 worker 스레드가 시작될 때 호출되므로, 스레드별 준비가 필요한 sink 가 사용한다.
+class ProgressSink:
+    def status(self, message):
+        logger.info(message)
+
+    def warning(self, message):
+        logger.warning(message)
+
+    def error(self, message):
+        logger.error(message)
+
+    def progress(self, finished, total):
+        pass
+
+    def clear(self):
+        pass
+
+    def bind_thread(self):
+        pass
+
+    # 같은 곳으로 경고/오류만 보내는 sink (여러 읍면동을 동시에 수집하는 worker 용)
+    def without_status(self):
+        return QuietSink()
+
+
+# 진행 메시지는 버리고 경고/오류만 logging 으로 남기는 sink (배치 worker 용)
+class QuietSink(ProgressSink):
+    def status(self, message):
+        pass
+
+
+default_sink = ProgressSink()
@@ -1,59 +1,115 @@
-import PublicDataReader as pdr
-import pandas as pd
 import json
 
+from region_index import RegionIndex
+from region_snapshot import write_region_snapshot
+
 # 공공데이터 API 설정
 service_key = 'WTYVEWrqH1fJhKBvkhv23qngA0cPgTV6vM4JijusQLrDNgBVdtyg3GJyxDtu085xaAliU0/jui5z2VFRU+2zXQ=='  # 여기에 API 키를 입력하세요.
-api = pdr.TransactionPrice(service_key)
 
-# 시도, 시군구, 읍면동 코드 가져오기
-df = pdr.code_bdong()
+SIDO_KEYS = ['시도코드', '시도명']
+SIGUNGU_KEYS = ['시군구코드', '시군구명']
 
-# 데이터 확인
-print(df.head())
 
-# JSON 구조로 변환
-def build_region_hierarchy(df):
-    result = []
+# 그룹 경계 위치 계산 (정렬된 df 에서 키 값이 바뀌는 행)
+def _group_starts(df, keys):
+    changed = (df[keys] != df[keys].shift()).any(axis=1).to_numpy()
+    return changed.nonzero()[0].tolist() + [len(df)]
 
-    # 시도 기준 그룹화
-    sido_grouped = df.groupby(['시도코드', '시도명'])
-    for (sido_code, sido_name), sido_df in sido_grouped:
-        sigungu_list = []
 
-        # 시군구 기준 그룹화
-        sigungu_grouped = sido_df.groupby(['시군구코드', '시군구명'])
-        for (sigungu_code, sigungu_name), sigungu_df in sigungu_grouped:
-            eup_myeon_dong_list = []
+# JSON 구조로 변환 (정렬 + 그룹 경계 계산으로 한 번에 처리)
+def build_region_hierarchy(df):
+    # groupby 와 동일하게 키에 NaN 이 있는 행은 제외하고, 키 순서로 안정 정렬 (그룹 내 원래 순서 유지)
+    df = df.dropna(subset=SIDO_KEYS + SIGUNGU_KEYS)
+    df = df.sort_values(SIDO_KEYS + SIGUNGU_KEYS, kind='stable')
+    if df.empty:
+        return []
+
+    dongs = [{"code": code, "name": name} for code, name in zip(df['법정동코드'].tolist(), df['읍면동명'].tolist())]
+    sido_codes, sido_names = df['시도코드'].tolist(), df['시도명'].tolist()
+    sigungu_codes, sigungu_names = df['시군구코드'].tolist(), df['시군구명'].tolist()
 
-            # 읍면동 추가
-            for _, row in sigungu_df.iterrows():
-                eup_myeon_dong_list.append({
-                    "code": row['법정동코드'],
-                    "name": row['읍면동명']
-                })
+    sido_starts = _group_starts(df, SIDO_KEYS)
+    sigungu_starts = _group_starts(df, SIDO_KEYS + SIGUNGU_KEYS)
 
+    result = []
+    sigungu_pos = 0
+    for sido_start, sido_end in zip(sido_starts, sido_starts[1:]):
+        sigungu_list = []
+        while sigungu_starts[sigungu_pos] < sido_end:
+            start, end = sigungu_starts[sigungu_pos], sigungu_starts[sigungu_pos + 1]
             sigungu_list.append({
-                "sigungu_code": sigungu_code,
-                "sigungu_name": sigungu_name,
-                "eup_myeon_dong": eup_myeon_dong_list
+                "sigungu_code": sigungu_codes[start],
+                "sigungu_name": sigungu_names[start],
+                "eup_myeon_dong": dongs[start:end]
             })
+            sigungu_pos += 1
 
         result.append({
-            "si_do_code": sido_code,
-            "si_do_name": sido_name,
+            "si_do_code": sido_codes[sido_start],
+            "si_do_name": sido_names[sido_start],
             "sigungu": sigungu_list
         })
 
     return result
 
-# JSON 생성
-region_json = build_region_hierarchy(df)
 
-# JSON 파일로 저장
-with open('korea_region_data.json', 'w', encoding='utf-8') as json_file:
-    json.dump(region_json, json_file, ensure_ascii=False, indent=4)
+# 일부 법정동 코드만 바뀐 경우, 해당 코드가 속한 시군구만 다시 만들어 기존 계층에 반영
+def update_region_hierarchy(hierarchy, df, changed_codes):
+    changed_codes = {str(code) for code in changed_codes}
+
+    affected = set(df.loc[df['법정동코드'].astype(str).isin(changed_codes), '시군구코드'].astype(str))
+    # 폐지된 코드는 df 에 없으므로 기존 계층에서 소속 시군구를 찾는다
+    for si_do in hierarchy:
+        for sigungu in si_do['sigungu']:
+            if any(str(dong['code']) in changed_codes for dong in sigungu['eup_myeon_dong']):
+                affected.add(str(sigungu['sigungu_code']))
+
+    rebuilt = build_region_hierarchy(df[df['시군구코드'].astype(str).isin(affected)])
+    rebuilt_sigungu = {
+        (si_do['si_do_code'], si_do['si_do_name']): si_do['sigungu'] for si_do in rebuilt
+    }
+
+    result = []
+    sido_keys = [(si_do['si_do_code'], si_do['si_do_name']) for si_do in hierarchy]
+    for sido_key in sorted(set(sido_keys) | set(rebuilt_sigungu)):
+        existing = next((si_do['sigungu'] for si_do in hierarchy if (si_do['si_do_code'], si_do['si_do_name']) == sido_key), [])
+        sigungu_list = [sigungu for sigungu in existing if str(sigungu['sigungu_code']) not in affected]
+        sigungu_list += rebuilt_sigungu.get(sido_key, [])
+        if not sigungu_list:
+            continue
+
+        sigungu_list.sort(key=lambda sigungu: (sigungu['sigungu_code'], sigungu['sigungu_name']))
+        result.append({
+            "si_do_code": sido_key[0],
+            "si_do_name": sido_key[1],
+            "sigungu": sigungu_list
+        })
+
+    return result
+
+
+def save_region_hierarchy(region_json, json_path='korea_region_data.json'):
+    # JSON 파일로 저장
+    with open(json_path, 'w', encoding='utf-8') as json_file:
+        json.dump(region_json, json_file, ensure_ascii=False, indent=4)
+
+    # 빠른 로딩을 위한 바이너리 스냅샷 저장
+    write_region_snapshot(RegionIndex.from_hierarchy(region_json), json_path.rsplit('.', 1)[0] + '.rgn')
+
+
+if __name__ == '__main__':
+    import PublicDataReader as pdr
+
+    api = pdr.TransactionPrice(service_key)
+
+    # 시도, 시군구, 읍면동 코드 가져오기
+    df = pdr.code_bdong()
 
-print("JSON 파일이 생성되었습니다.")
+    # 데이터 확인
+    print(df.head())
 
+    # JSON 생성
+    region_json = build_region_hierarchy(df)
+    save_region_hierarchy(region_json)
 
+    print("JSON 파일이 생성되었습니다.")
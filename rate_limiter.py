@@ -0,0 +1,178 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+# 요청 제한(차단)으로 보는 응답 코드
+THROTTLE_STATUS = (429, 403)
+
+
+def _host(url):
+    return urlparse(url).netloc or url
+
+
+# 호스트별 최소 요청 간격을 지키는 rate limiter
+class HostRateLimiter:
+    def __init__(self, requests_per_second=5.0):
+        self.requests_per_second = requests_per_second
+        self._lock = threading.Lock()
+        self._next_slot = {}
+        self._scoped = contextvars.ContextVar(f'rate_limiter_scope_{id(self)}', default=None)
+
+    # with 블록 안의 요청은 (그 컨텍스트를 이어받은 worker 스레드 포함) scoped limiter 로 속도를 조절한다 (작업별 요청 속도)
+    @contextmanager
+    def scoped(self, scoped):
+        token = self._scoped.set(scoped)
+        try:
+            yield scoped
+        finally:
+            self._scoped.reset(token)
+
+    # 현재 컨텍스트에서 사용할 limiter (작업별 limiter 가 없으면 자신)
+    def current(self):
+        return self._scoped.get() or self
+
+    def acquire(self, url):
+        if not self.requests_per_second or self.requests_per_second <= 0:
+            return
+
+        host = _host(url)
+        interval = 1.0 / self.requests_per_second
+
+        # 다음 슬롯을 lock 안에서 예약하고, 대기는 lock 밖에서 한다
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    # 요청 결과 통보 (고정 속도 limiter 는 사용하지 않음)
+    def record(self, url, status=None, error=None, elapsed=None, retry_after=None):
+        pass
+
+    def stats(self):
+        return {}
+
+
+class HostStats:
+    __slots__ = ('rate', 'requests', 'throttled', 'errors', 'timeouts', 'latency_total', 'increases', 'decreases',
+                 'healthy_streak', 'last_decrease', 'paused_until')
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.latency_total = 0.0
+        self.increases = 0
+        self.decreases = 0
+        self.healthy_streak = 0
+        self.last_decrease = 0.0
+        self.paused_until = 0.0
+
+    def as_dict(self):
+        return {
+            'rate': round(self.rate, 2),
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'timeouts': self.timeouts,
+            'errors': self.errors,
+            'avg_latency_ms': round(self.latency_total / self.requests * 1000, 1) if self.requests else None,
+            'increases': self.increases,
+            'decreases': self.decreases,
+        }
+
+
+# 호스트별로 속도를 스스로 조절하는 AIMD rate limiter
+#
+# 정상 응답이 increase_every 번 이어질 때마다 초당 요청 수를 increase_step 만큼 올리고 (max_rate 까지),
+# 429/403/타임아웃이 오면 decrease_factor 배로 줄인 뒤 Retry-After (없으면 1/rate 초) 동안 해당 호스트를 멈춘다.
+# 동시에 진행 중이던 요청들의 실패로 여러 번 줄어들지 않도록 cooldown 초 안의 감소는 한 번만 반영한다.
+# requests_per_second 는 각 호스트의 시작 속도이며, 다른 값으로 바꾸면 모든 호스트의 속도를 그 값으로 다시 맞춘다.
+class AdaptiveRateLimiter(HostRateLimiter):
+    def __init__(self, requests_per_second=5.0, min_rate=0.5, max_rate=20.0, increase_step=0.5, increase_every=20,
+                 decrease_factor=0.5, cooldown=2.0):
+        self._hosts = {}
+        super().__init__(requests_per_second)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.increase_every = increase_every
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+
+    @property
+    def requests_per_second(self):
+        return self._start_rate
+
+    @requests_per_second.setter
+    def requests_per_second(self, value):
+        if value == getattr(self, '_start_rate', None):
+            return
+        self._start_rate = value
+        for host_stats in self._hosts.values():
+            host_stats.rate = value
+
+    def _host_stats(self, host):
+        host_stats = self._hosts.get(host)
+        if host_stats is None:
+            host_stats = self._hosts[host] = HostStats(self._start_rate)
+        return host_stats
+
+    def acquire(self, url):
+        host = _host(url)
+        with self._lock:
+            host_stats = self._host_stats(host)
+            if not host_stats.rate or host_stats.rate <= 0:
+                return
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now), host_stats.paused_until)
+            self._next_slot[host] = slot + 1.0 / host_stats.rate
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def record(self, url, status=None, error=None, elapsed=None, retry_after=None):
+        with self._lock:
+            host_stats = self._host_stats(_host(url))
+            host_stats.requests += 1
+            if elapsed is not None:
+                host_stats.latency_total += elapsed
+
+            if status in THROTTLE_STATUS or error == 'timeout':
+                if status in THROTTLE_STATUS:
+                    host_stats.throttled += 1
+                else:
+                    host_stats.timeouts += 1
+                self._decrease(host_stats, retry_after)
+            elif error is not None or (status is not None and status >= 500):
+                # 서버 오류는 속도를 바꾸지 않고 연속 정상 응답만 끊는다
+                host_stats.errors += 1
+                host_stats.healthy_streak = 0
+            else:
+                host_stats.healthy_streak += 1
+                if host_stats.healthy_streak >= self.increase_every and host_stats.rate < self.max_rate:
+                    host_stats.rate = min(self.max_rate, host_stats.rate + self.increase_step)
+                    host_stats.increases += 1
+                    host_stats.healthy_streak = 0
+
+    def _decrease(self, host_stats, retry_after):
+        now = time.monotonic()
+        host_stats.healthy_streak = 0
+        if now - host_stats.last_decrease >= self.cooldown:
+            host_stats.rate = max(self.min_rate, host_stats.rate * self.decrease_factor)
+            host_stats.decreases += 1
+            host_stats.last_decrease = now
+        pause = retry_after if retry_after is not None else 1.0 / host_stats.rate
+        host_stats.paused_until = max(host_stats.paused_until, now + pause)
+
+    # 호스트별 현재 속도와 누적 통계 ({host: {...}})
+    def stats(self):
+        with self._lock:
+            return {host: host_stats.as_dict() for host, host_stats in self._hosts.items()}
@@ -0,0 +1,236 @@
+import json
+import os
+from bisect import bisect_left
+from functools import lru_cache
+
+SIDO = 'sido'
+SIGUNGU = 'sigungu'
+DONG = 'dong'
+
+LEVELS = (SIDO, SIGUNGU, DONG)
+# level 별 코드 자릿수 (시도 2, 시군구 5, 읍면동 10)
+CODE_WIDTHS = (2, 5, 10)
+
+
+class Region:
+    __slots__ = ('level', 'code', 'name', 'parent_code')
+
+    def __init__(self, level, code, name, parent_code=None):
+        self.level = level
+        self.code = code
+        self.name = name
+        self.parent_code = parent_code
+
+    def __repr__(self):
+        return f'Region({self.level}, {self.code}, {self.name})'
+
+
+# 시도 > 시군구 > 읍면동 계층을 배열 형태로 들고, 코드/이름으로 바로 찾을 수 있게 만든 인덱스
+#
+# 지역은 level 순서, 같은 level 안에서는 코드 순서로 배치되어 있어
+# 코드 조회는 이분 탐색, 자식 목록은 다음 level 의 연속 구간(first_child, child_count)이 된다.
+# 배열은 list 또는 스냅샷(mmap) 의 memoryview 둘 다 될 수 있다.
+class RegionIndex:
+    def __init__(self, codes, parents, first_child, child_count, name_ids, names, name_order, level_counts):
+        self.codes = codes
+        self.parents = parents
+        self.first_child = first_child
+        self.child_count = child_count
+        self.name_ids = name_ids
+        self.names = names
+        # level 별로 이름 순 정렬된 위치 목록 (이름 검색용)
+        self.name_order = name_order
+        self.level_counts = tuple(level_counts)
+
+        self._level_ranges = []
+        start = 0
+        for count in self.level_counts:
+            self._level_ranges.append((start, start + count))
+            start += count
+
+    @classmethod
+    def from_hierarchy(cls, districts):
+        rows = [{} for _ in LEVELS]
+        for level, code, name, parent_code in iter_hierarchy(districts):
+            level_no = LEVELS.index(level)
+            # 원본 데이터에 다른 시도 아래 잘못 묶인 중복 항목이 있어, 코드 접두어가 부모와 맞는 항목만 사용
+            if code in rows[level_no]:
+                continue
+            if parent_code is not None and (parent_code not in rows[level_no - 1] or not code.startswith(parent_code)):
+                continue
+            rows[level_no][code] = (name, parent_code)
+
+        codes, parents, first_child, child_count, name_ids = [], [], [], [], []
+        names, name_lookup, positions = [], {}, {}
+        for level_rows in rows:
+            for code in sorted(level_rows, key=int):
+                name, parent_code = level_rows[code]
+                position = len(codes)
+                positions[code] = position
+                codes.append(int(code))
+                first_child.append(-1)
+                child_count.append(0)
+                if name not in name_lookup:
+                    name_lookup[name] = len(names)
+                    names.append(name)
+                name_ids.append(name_lookup[name])
+
+                if parent_code is None:
+                    parents.append(-1)
+                else:
+                    parent = positions[parent_code]
+                    parents.append(parent)
+                    if first_child[parent] < 0:
+                        first_child[parent] = position
+                    child_count[parent] += 1
+
+        name_order = []
+        start = 0
+        for level_rows in rows:
+            end = start + len(level_rows)
+            name_order.extend(sorted(range(start, end), key=lambda position: (names[name_ids[position]], position)))
+            start = end
+
+        return cls(codes, parents, first_child, child_count, name_ids, names, name_order, [len(level_rows) for level_rows in rows])
+
+    def __len__(self):
+        return len(self.codes)
+
+    def _level_of(self, position):
+        for level_no, (start, end) in enumerate(self._level_ranges):
+            if start <= position < end:
+                return level_no
+
+    def _code(self, position, level_no=None):
+        if level_no is None:
+            level_no = self._level_of(position)
+        return str(self.codes[position]).zfill(CODE_WIDTHS[level_no])
+
+    def _name(self, position):
+        return self.names[self.name_ids[position]]
+
+    def _region(self, position):
+        level_no = self._level_of(position)
+        parent = self.parents[position]
+        return Region(
+            LEVELS[level_no],
+            self._code(position, level_no),
+            self._name(position),
+            self._code(parent, level_no - 1) if parent >= 0 else None,
+        )
+
+    def _position(self, code):
+        code = str(code)
+        if len(code) not in CODE_WIDTHS:
+            return None
+        start, end = self._level_ranges[CODE_WIDTHS.index(len(code))]
+        value = int(code)
+        position = bisect_left(self.codes, value, start, end)
+        if position < end and self.codes[position] == value:
+            return position
+        return None
+
+    def _name_positions(self, name, level, prefix=False):
+        start, end = self._level_ranges[LEVELS.index(level)]
+        order = self.name_order
+        position = bisect_left(order, name, start, end, key=self._name)
+        while position < end:
+            candidate = self._name(order[position])
+            if candidate != name and not (prefix and candidate.startswith(name)):
+                break
+            yield order[position]
+            position += 1
+
+    def get(self, code):
+        position = self._position(code)
+        return self._region(position) if position is not None else None
+
+    def find(self, name, level=SIDO):
+        return [self._region(position) for position in self._name_positions(name, level)]
+
+    def find_one(self, name, level=SIDO):
+        positions = list(self._name_positions(name, level))
+        return self._region(min(positions)) if positions else None
+
+    def child(self, parent_code, name):
+        for region in self.children(parent_code):
+            if region.name == name:
+                return region
+        return None
+
+    def children(self, code):
+        if code is None:
+            start, end = self._level_ranges[0]
+            return [self._region(position) for position in range(start, end)]
+
+        position = self._position(code)
+        if position is None or self.first_child[position] < 0:
+            return []
+        first = self.first_child[position]
+        return [self._region(child) for child in range(first, first + self.child_count[position])]
+
+    def parent(self, code):
+        position = self._position(code)
+        if position is None or self.parents[position] < 0:
+            return None
+        return self._region(self.parents[position])
+
+    def ancestors(self, code):
+        result = []
+        region = self.parent(code)
+        while region:
+            result.append(region)
+            region = self.parent(region.code)
+        return result[::-1]
+
+    def descendants(self, code, level=DONG):
+        result = []
+        for child in self.children(code):
+            if child.level == level:
+                result.append(child)
+            else:
+                result.extend(self.descendants(child.code, level))
+        return result
+
+    def sido_list(self):
+        return self.children(None)
+
+    def search(self, query, level=SIDO, prefix=False):
+        if prefix:
+            positions = self._name_positions(query, level, prefix=True)
+        else:
+            start, end = self._level_ranges[LEVELS.index(level)]
+            positions = (position for position in range(start, end) if query in self._name(position))
+
+        # 코드 순서(원본 파일 순서)로 정렬해서 반환
+        return [self._region(position) for position in sorted(positions)]
+
+
+# district.json 형태의 계층 데이터를 (level, code, name, parent_code) 로 펼침
+def iter_hierarchy(districts):
+    for si_do in districts:
+        sido_code = str(si_do['si_do_code'])
+        yield SIDO, sido_code, si_do['si_do_name'], None
+        for sigungu in si_do['sigungu']:
+            sigungu_code = str(sigungu['sigungu_code'])
+            yield SIGUNGU, sigungu_code, sigungu['sigungu_name'], sido_code
+            for dong in sigungu['eup_myeon_dong']:
+                yield DONG, str(dong['code']), str(dong['name']), sigungu_code
+
+
+def snapshot_path_for(json_path):
+    return os.path.splitext(json_path)[0] + '.rgn'
+
+
+# json 과 같은 이름의 .rgn 스냅샷이 더 최신이면 스냅샷에서 바로 읽는다
+@lru_cache(maxsize=None)
+def load_region_index(json_path='district.json'):
+    snapshot_path = snapshot_path_for(json_path)
+    if os.path.exists(snapshot_path) and (
+        not os.path.exists(json_path) or os.path.getmtime(snapshot_path) >= os.path.getmtime(json_path)
+    ):
+        from region_snapshot import load_region_snapshot
+        return load_region_snapshot(snapshot_path)
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return RegionIndex.from_hierarchy(json.load(f))
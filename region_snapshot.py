@@ -0,0 +1,94 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from region_index import RegionIndex, LEVELS
+
+# 지역 계층 바이너리 스냅샷 (RegionIndex 배열을 그대로 덤프)
+#
+# header : magic(4s) version(I) 시도/시군구/읍면동 수(3I) 이름 수(I) 이름 blob 크기(I) padding(I)
+# body   : code(int64[n]) parent(int32[n]) first_child(int32[n]) child_count(int32[n])
+#          name_id(uint32[n]) name_order(int32[n]) name_offset(uint32[이름 수 + 1]) 이름 blob(utf-8)
+#
+# 같은 이름은 한 번만 저장(intern)하고, 읽을 때는 mmap 한 파일을 memoryview 로 그대로 사용한다.
+# 여러 프로세스가 같은 파일을 열면 OS 페이지 캐시를 공유한다.
+MAGIC = b'RGNS'
+VERSION = 1
+HEADER = struct.Struct('<4sIIIIIII')
+
+
+def write_region_snapshot(region_index, path):
+    blob = bytearray()
+    name_offsets = array('I', [0])
+    for name in region_index.names:
+        blob += name.encode('utf-8')
+        name_offsets.append(len(blob))
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, *region_index.level_counts, len(region_index.names), len(blob), 0))
+        f.write(array('q', region_index.codes).tobytes())
+        f.write(array('i', region_index.parents).tobytes())
+        f.write(array('i', region_index.first_child).tobytes())
+        f.write(array('i', region_index.child_count).tobytes())
+        f.write(array('I', region_index.name_ids).tobytes())
+        f.write(array('i', region_index.name_order).tobytes())
+        f.write(name_offsets.tobytes())
+        f.write(bytes(blob))
+
+
+# 이름 blob 에서 필요한 이름만 디코딩하고 결과를 id 별로 캐시
+class InternedNames:
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+        self._names = [None] * (len(offsets) - 1)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, name_id):
+        name = self._names[name_id]
+        if name is None:
+            name = bytes(self._blob[self._offsets[name_id]:self._offsets[name_id + 1]]).decode('utf-8')
+            self._names[name_id] = name
+        return name
+
+    def __iter__(self):
+        return (self[name_id] for name_id in range(len(self)))
+
+
+def load_region_snapshot(path):
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, *counts = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f'Unsupported region snapshot: {path}')
+    level_counts = counts[:len(LEVELS)]
+    name_count, blob_size = counts[len(LEVELS):len(LEVELS) + 2]
+    count = sum(level_counts)
+
+    view = memoryview(buffer)
+    offset = HEADER.size
+    columns = []
+    for item_size, type_code in ((8, 'q'), (4, 'i'), (4, 'i'), (4, 'i'), (4, 'I'), (4, 'i')):
+        columns.append(view[offset:offset + item_size * count].cast(type_code))
+        offset += item_size * count
+    codes, parents, first_child, child_count, name_ids, name_order = columns
+
+    name_offsets = view[offset:offset + 4 * (name_count + 1)].cast('I')
+    offset += 4 * (name_count + 1)
+    names = InternedNames(name_offsets, view[offset:offset + blob_size])
+
+    return RegionIndex(codes, parents, first_child, child_count, name_ids, names, name_order, level_counts)
+
+
+if __name__ == '__main__':
+    # 사용법: python region_snapshot.py district.json [district.rgn]
+    json_path = sys.argv[1] if len(sys.argv) > 1 else 'district.json'
+    snapshot_path = sys.argv[2] if len(sys.argv) > 2 else json_path.rsplit('.', 1)[0] + '.rgn'
+    with open(json_path, 'r', encoding='utf-8') as f:
+        write_region_snapshot(RegionIndex.from_hierarchy(json.load(f)), snapshot_path)
+    print(f"{snapshot_path} 파일이 생성되었습니다.")
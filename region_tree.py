@@ -0,0 +1,161 @@
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from batch_collector import is_dong_code
+from progress_sink import default_sink
+from region_index import load_region_index
+
+# 네이버 지역 목록 최상위 (시/도 목록) cortarNo
+ROOT = '0000000000'
+# 네이버 지역 목록 API 는 시/도 > 군/구 > 읍/면/동 3단계
+DEPTH = 3
+
+
+# district.json 코드(시도 2자리, 시군구 5자리)를 네이버 cortarNo(10자리)로 변환
+def cortar_no(code):
+    return str(code).ljust(10, '0')
+
+
+# district.json 계층을 {상위 cortarNo: {이름: cortarNo}} 형태로 변환 (읍면동 목록에서 시군구 자체/리/이름 없는 항목 제외)
+def district_tree(region_index):
+    children = {ROOT: {}}
+    for si_do in region_index.children(None):
+        children[ROOT][si_do.name] = cortar_no(si_do.code)
+        sigungu_children = children[cortar_no(si_do.code)] = {}
+        for sigungu in region_index.children(si_do.code):
+            sigungu_children[sigungu.name] = cortar_no(sigungu.code)
+            children[cortar_no(sigungu.code)] = {
+                dong.name: dong.code for dong in region_index.children(sigungu.code)
+                if is_dong_code(dong.code) and dong.name != 'nan'
+            }
+    return children
+
+
+def _codes(children):
+    return {code for entries in children.values() for code in entries.values()}
+
+
+# 시/도 > 군/구 > 읍/면/동 선택 목록을 메모리에서 바로 돌려주는 지역 트리
+#
+# 네이버 지역 목록 API 전체를 한 번 수집해 path 에 저장해 두고, 화면에서는 저장된 트리만 읽는다 (요청 없음).
+# 저장된 트리가 없으면 district.json 으로 시작하고, max_age 초보다 오래되었으면 백그라운드에서 다시 수집해 교체한다.
+# 수집 중 조회에 실패한 지역은 이전 트리, 없으면 district.json 의 하위 목록으로 채운다.
+class NaverRegionTree:
+    def __init__(self, path=os.path.join('.cache', 'regions.json'), json_path='district.json', fetch=None, max_age=7 * 24 * 3600,
+                 max_workers=8):
+        if fetch is None:
+            from naver_land import get_region_list as fetch
+        self.path = path
+        self.json_path = json_path
+        self.fetch = fetch
+        self.max_age = max_age
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+
+        self.children_by_code, self.crawled_at, self.reconciliation = self._load()
+
+    def _load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                return data['children'], data['crawled_at'], data.get('reconciliation', {})
+            except (OSError, ValueError, KeyError):
+                pass
+        return district_tree(load_region_index(self.json_path)), None, {}
+
+    @property
+    def is_stale(self):
+        return self.crawled_at is None or time.time() - self.crawled_at >= self.max_age
+
+    # {이름: cortarNo} (code 가 None 이면 시/도 목록)
+    def children(self, code=None):
+        return dict(self.children_by_code.get(ROOT if code is None else str(code), {}))
+
+    # 네이버 지역 목록 전체를 단계별로 병렬 수집하고 district.json 과 맞춰 본 트리를 반환
+    def crawl(self, sink=default_sink):
+        fallback = district_tree(load_region_index(self.json_path))
+        previous = self.children_by_code
+        children = {}
+        failed = []
+
+        def fetch(code):
+            try:
+                return self.fetch(code)
+            except Exception as e:
+                sink.warning(f"지역 목록 조회 실패 ({code}): {e}")
+                return None
+
+        parents = [ROOT]
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='region-tree') as executor:
+            for depth in range(DEPTH):
+                for parent, entries in zip(parents, executor.map(fetch, parents)):
+                    if entries is None:
+                        failed.append(parent)
+                        entries = previous.get(parent) or fallback.get(parent) or {}
+                    children[parent] = entries
+                if depth < DEPTH - 1:
+                    parents = [code for parent in parents for code in children[parent].values()]
+                sink.status(f"지역 목록 수집중입니다. ({len(children)}곳)")
+
+        if ROOT in failed:
+            raise RuntimeError('시/도 목록을 가져오지 못했습니다.')
+        if failed:
+            sink.warning(f"지역 목록 조회에 실패한 {len(failed)}곳은 이전 목록/district.json 으로 채웠습니다: {', '.join(failed[:20])}")
+
+        naver_codes, district_codes = _codes(children), _codes(fallback)
+        reconciliation = {
+            'failed': failed,
+            # 행정구역 개편 등으로 한쪽에만 있는 코드 (네이버 목록 기준으로 사용)
+            'naver_only': sorted(naver_codes - district_codes),
+            'district_only': sorted(district_codes - naver_codes),
+        }
+        return children, reconciliation
+
+    # 수집한 트리로 교체하고 저장 (쓰는 도중 중단되어도 이전 파일이 깨지지 않도록 임시 파일 후 교체)
+    def refresh(self, sink=default_sink):
+        children, reconciliation = self.crawl(sink=sink)
+        crawled_at = time.time()
+        with self._lock:
+            self.children_by_code, self.crawled_at, self.reconciliation = children, crawled_at, reconciliation
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'crawled_at': crawled_at, 'children': children, 'reconciliation': reconciliation}, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+        return self
+
+    # 오래된 트리이면 백그라운드에서 다시 수집 (이미 수집 중이면 그대로 둔다)
+    def refresh_in_background(self, sink=default_sink):
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return self._refresh_thread
+            self._refresh_thread = threading.Thread(target=self._refresh_quietly, args=(sink,), name='region-tree-refresh',
+                                                    daemon=True)
+            self._refresh_thread.start()
+            return self._refresh_thread
+
+    def _refresh_quietly(self, sink):
+        try:
+            self.refresh(sink=sink)
+        except Exception as e:
+            sink.error(f"지역 목록 갱신 실패: {e}")
+
+    def ensure_fresh(self, sink=default_sink):
+        if self.is_stale:
+            self.refresh_in_background(sink=sink)
+        return self
+
+
+if __name__ == '__main__':
+    # 사용법: python region_tree.py [저장 경로] - 배포 전에 실행해 두면 첫 화면부터 요청 없이 목록을 표시
+    tree = NaverRegionTree(*sys.argv[1:2]).refresh()
+    print(f"{tree.path} 파일이 생성되었습니다. (지역 {len(_codes(tree.children_by_code))}곳, "
+          f"조회 실패 {len(tree.reconciliation['failed'])}곳, 네이버에만 있는 코드 {len(tree.reconciliation['naver_only'])}곳, "
+          f"district.json 에만 있는 코드 {len(tree.reconciliation['district_only'])}곳)")
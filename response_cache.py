@@ -0,0 +1,128 @@
+import json
+import re
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from sqlite_db import LazyConnection
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# 엔드포인트별 TTL (초). 위에서부터 처음 매칭되는 규칙을 사용, 매칭 없으면 캐시하지 않음
+DEFAULT_TTL_RULES = [
+    (r'new\.land\.naver\.com/api/regions/list', 7 * DAY),
+    (r'fin\.land\.naver\.com/complexes/\d+\?.*tab=complex-info', DAY),
+    (r'new\.land\.naver\.com/api/regions/complexes', 6 * HOUR),
+    (r'fin\.land\.naver\.com/front-api/v1/complex/article/list', 10 * 60),
+    (r'new\.land\.naver\.com/api/articles/\d+', HOUR),
+    (r'new\.land\.naver\.com/api/articles\?', 10 * 60),
+]
+
+# 캐시에 저장할 응답 헤더
+STORED_HEADERS = ('content-type', 'etag', 'last-modified')
+
+# 응답 테이블 (last_access 순으로 오래된 항목부터 제거)
+RESPONSES_SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS responses ('
+    ' key TEXT PRIMARY KEY,'
+    ' status INTEGER,'
+    ' headers TEXT,'
+    ' body BLOB,'
+    ' etag TEXT,'
+    ' last_modified TEXT,'
+    ' expires_at REAL,'
+    ' last_access REAL,'
+    ' size INTEGER)',
+    'CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)',
+]
+
+
+# SQLite 기반 영구 HTTP 응답 캐시 (TTL, 용량 기반 LRU 제거, ETag/Last-Modified 재검증)
+class ResponseCache:
+    def __init__(self, path='.cache/naver_http.sqlite', max_bytes=512 * 1024 * 1024, ttl_rules=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_rules = [(re.compile(pattern), ttl) for pattern, ttl in (ttl_rules or DEFAULT_TTL_RULES)]
+        self._lock = threading.Lock()
+        self._db = LazyConnection(path, RESPONSES_SCHEMA)
+
+    def ttl_for(self, url):
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(url):
+                return ttl
+        return None
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.conn.execute(
+                'SELECT status, headers, body, etag, last_modified, expires_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.conn.execute('UPDATE responses SET last_access = ? WHERE key = ?', (time.time(), key))
+
+        status, headers, body, etag, last_modified, expires_at = row
+        return {
+            'status': status,
+            'headers': json.loads(headers),
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': expires_at > time.time(),
+        }
+
+    def put(self, key, response, ttl):
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        body = response.content
+        now = time.time()
+        with self._lock:
+            self._db.conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, response.status_code, json.dumps(headers), body, headers.get('etag'),
+                 headers.get('last-modified'), now + ttl, now, len(body)),
+            )
+            self._evict()
+
+    def refresh(self, key, ttl):
+        # 304 Not Modified 응답을 받은 경우 만료 시간만 연장
+        now = time.time()
+        with self._lock:
+            self._db.conn.execute(
+                'UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?', (now + ttl, now, key)
+            )
+
+    def _evict(self):
+        total = self._db.conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # 가장 오래 사용되지 않은 항목부터 용량 한도 아래로 내려갈 때까지 삭제
+        evict_keys = []
+        for key, size in self._db.conn.execute('SELECT key, size FROM responses ORDER BY last_access'):
+            evict_keys.append((key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self._db.conn.executemany('DELETE FROM responses WHERE key = ?', evict_keys)
+
+    def clear(self):
+        with self._lock:
+            self._db.conn.execute('DELETE FROM responses')
+
+    def close(self):
+        self._db.close()
+
+
+# 캐시 항목을 requests.Response 객체로 복원
+def build_cached_response(url, entry):
+    response = requests.Response()
+    response.status_code = entry['status']
+    response.headers = CaseInsensitiveDict(entry['headers'])
+    response._content = entry['body']
+    response.url = url
+    response.encoding = 'utf-8-sig'
+    response.from_cache = True
+    return response
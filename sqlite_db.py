@@ -0,0 +1,39 @@
+import os
+import sqlite3
+import threading
+
+
+# 처음 사용할 때 여는 SQLite 연결 (모듈 import 만으로 .cache 에 파일을 만들지 않도록)
+#
+# schema 는 연결할 때 한 번 실행할 CREATE 문 목록. 연결은 여러 스레드가 함께 쓰므로 쿼리는 사용하는 쪽의 lock 으로 감싼다.
+class LazyConnection:
+    def __init__(self, path, schema):
+        self.path = path
+        self.schema = schema
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            with self._lock:
+                if self._conn is None:
+                    self._conn = self._open()
+        return self._conn
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        for statement in self.schema:
+            conn.execute(statement)
+        return conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,48 @@
+import os
+import shutil
+
+import pytest
+
+import naver_land
+from benchmarks.fixtures import REGION_LIST_URL, FixtureSet, add_synthetic_dong
+from benchmarks.stub_server import StubServer
+from progress_sink import QuietSink
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# district.json 에 없는 시군구 (읍면동 목록은 stub 서버의 지역 목록 API 로 조회)
+SIGUNGU_CODE = '9999900000'
+DONGS = [('9999910100', '스텁1동'), ('9999910200', '스텁2동')]
+
+
+# 읍면동 두 곳 (단지 3개 x 매물 10건, 빌라 45건 = 목록 3페이지)
+@pytest.fixture
+def fixtures():
+    fixtures = FixtureSet()
+    for dong_code, dong_name in DONGS:
+        add_synthetic_dong(fixtures, dong_code, dong_name, complexes=3, articles=10, vl_articles=45, padding=0)
+    fixtures.add(REGION_LIST_URL.format(SIGUNGU_CODE),
+                 {'regionList': [{'cortarNo': dong_code, 'cortarName': dong_name} for dong_code, dong_name in DONGS]})
+    return fixtures
+
+
+# 작업 디렉토리를 임시 디렉토리로 바꾸고, 캐시 없이 stub 서버로 요청하는 수집 환경
+@pytest.fixture
+def stub(fixtures, tmp_path, monkeypatch):
+    shutil.copy(os.path.join(ROOT, 'district.json'), tmp_path)
+    monkeypatch.chdir(tmp_path)
+    with StubServer(fixtures) as server:
+        monkeypatch.setattr(naver_land.client, 'cache', None)
+        monkeypatch.setattr(naver_land.client, 'host_overrides', server.host_overrides())
+        monkeypatch.setattr(naver_land.rate_limiter, 'max_rate', 1000.0)
+        monkeypatch.setattr(naver_land.rate_limiter, 'requests_per_second', 1000.0)
+        yield server
+
+
+# collect_region(property_type, ...) -> (dongs, checkpoint, 체크포인트에 저장된 row 목록)
+@pytest.fixture
+def collect_region(stub):
+    def collect(property_type, **kwargs):
+        dongs, checkpoint = naver_land.collect_region(SIGUNGU_CODE, property_type, sink=QuietSink(), **kwargs)
+        return dongs, checkpoint, list(checkpoint.iter_results(dongs))
+    return collect
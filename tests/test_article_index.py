@@ -0,0 +1,58 @@
+import pytest
+
+from article_index import CHANGED, NEW, UNCHANGED, ArticleIndex
+
+
+def article(article_no, price='1억'):
+    return {'articleNo': article_no, 'articleConfirmYmd': '20250101', 'dealOrWarrantPrc': price}
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ArticleIndex(str(tmp_path / 'article_index.sqlite'))
+    yield index
+    index.close()
+
+
+def test_diff_classifies_new_changed_unchanged_and_delisted(index):
+    for article_no in ('1', '2', '3'):
+        index.update('VL:A', article(article_no), detail={'articleNo': article_no})
+
+    status, delisted = index.diff('VL:A', [article('1'), article('2', price='2억'), article('4')])
+    assert status == {'1': UNCHANGED, '2': CHANGED, '4': NEW}
+    assert delisted == ['3']
+    assert index.get_detail('1') == {'articleNo': '1'}
+
+
+def test_article_seen_in_another_scope_is_not_new(index):
+    index.update('VL:A', article('1'))
+    status, _ = index.diff('VL:B', [article('1'), article('2')])
+    assert status == {'1': UNCHANGED, '2': NEW}
+
+
+def test_skipped_detail_keeps_previous_detail(index):
+    index.update('VL:A', article('1'), detail={'roomCount': '2'})
+    index.update('VL:A', article('1'))
+    assert index.get_detail('1') == {'roomCount': '2'}
+
+
+def test_relisted_article_is_new_and_active_again(index):
+    index.update('VL:A', article('1'))
+    index.mark_delisted(['1'])
+    assert index.active_keys('VL:A') == set()
+
+    # 같은 내용으로 다시 올라와도 상세를 다시 받도록 NEW
+    status, _ = index.diff('VL:A', [article('1')])
+    assert status == {'1': NEW}
+    index.update('VL:A', article('1'), detail={'articleNo': '1'})
+    assert index.active_keys('VL:A') == {'1'}
+    assert index.diff('VL:A', [article('1')])[0] == {'1': UNCHANGED}
+
+
+def test_index_file_is_created_on_first_use(tmp_path):
+    path = tmp_path / 'cache' / 'article_index.sqlite'
+    index = ArticleIndex(str(path))
+    assert not path.exists()
+    index.active_keys('VL:A')
+    assert path.exists()
+    index.close()
@@ -0,0 +1,22 @@
+import pytest
+
+from tests.conftest import DONGS
+
+
+@pytest.mark.parametrize('property_type', ['APT', 'VL'])
+def test_checkpoint_saves_rows_and_resume_skips_done_dongs(stub, collect_region, property_type):
+    _, checkpoint, rows = collect_region(property_type)
+    assert sorted(checkpoint.state['done']) == [dong_code for dong_code, _ in DONGS]
+    assert sum(checkpoint.state['done'].values()) == len(rows) > 0
+    for row in rows:
+        assert (row['dong_code'], row['dong_name']) in DONGS
+
+    requests = stub.stats['requests']
+    _, _, resumed = collect_region(property_type)
+    # 지역 목록 조회 한 번만 (읍면동은 모두 체크포인트에서 읽음)
+    assert stub.stats['requests'] - requests == 1
+    assert resumed == rows
+
+    _, _, collected_again = collect_region(property_type, resume=False)
+    assert stub.stats['requests'] - requests > 1
+    assert len(collected_again) == len(rows)
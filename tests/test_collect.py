@@ -0,0 +1,150 @@
+import json
+import threading
+
+import pytest
+
+import naver_land
+from benchmarks.fixtures import COMPLEX_INFO_URL, COMPLEX_LIST_URL, FRONT_API_URL, VL_LIST_URL, fixture_key
+from dedup import ListingDeduplicator
+from progress_sink import QuietSink
+from tests.conftest import DONGS
+
+DONG_CODE, DONG_NAME = DONGS[0]
+
+
+# 목록을 중간에 끊는다 (APT 는 단지 목록을 2페이지로 나누고, 2페이지 응답을 빼서 404). 뺀 (url, 응답) 을 반환
+def truncate(fixtures, property_type, dong_code):
+    if property_type == 'APT':
+        complex_list = json.loads(fixtures.lookup(COMPLEX_LIST_URL.format(dong_code, 1))[2])['complexList']
+        fixtures.add(COMPLEX_LIST_URL.format(dong_code, 1), {'complexList': complex_list[:1], 'isMoreData': True})
+        body = json.dumps({'complexList': complex_list[1:], 'isMoreData': False}, ensure_ascii=False).encode('utf-8')
+        return COMPLEX_LIST_URL.format(dong_code, 2), (200, 'application/json; charset=utf-8', body)
+    url = VL_LIST_URL.format(dong_code, 2)
+    return url, fixtures.responses.pop(fixture_key(url))
+
+
+def complex_list(fixtures, dong_code):
+    return json.loads(fixtures.lookup(COMPLEX_LIST_URL.format(dong_code, 1))[2])['complexList']
+
+
+# 두 번째 읍면동 단지 목록에 첫 번째 읍면동 단지를 함께 넣는다 (인접 읍면동 목록에 같은 단지가 나오는 경우)
+def share_complexes(fixtures):
+    shared = complex_list(fixtures, DONGS[0][0])
+    fixtures.add(COMPLEX_LIST_URL.format(DONGS[1][0], 1),
+                 {'complexList': complex_list(fixtures, DONGS[1][0]) + shared, 'isMoreData': False})
+    return shared
+
+
+def test_apt_listings_are_built_lazily(stub):
+    listings, _ = naver_land.collect_dong_listings(DONG_CODE, DONG_NAME, 'APT', sink=QuietSink())
+    assert not isinstance(listings, list)
+    rows = list(listings)
+    assert len(rows) == len(listings) > 0
+    assert rows == list(listings)
+    assert {row['dong_code'] for row in rows} == {DONG_CODE}
+
+
+def test_failed_complex_returns_none_and_is_skipped(stub, fixtures):
+    complexes = complex_list(fixtures, DONG_CODE)
+    failed = complexes[0]['complexNo']
+    fixtures.responses.pop(fixture_key(FRONT_API_URL.format(failed, 0)))
+
+    assert naver_land.get_apt_details(failed, sink=QuietSink()) is None
+    listings, _ = naver_land.collect_dong_listings(DONG_CODE, DONG_NAME, 'APT', sink=QuietSink())
+    assert {row['complexNo'] for row in listings} == {apt_info['complexNo'] for apt_info in complexes[1:]}
+
+
+def test_duplicate_brokers_are_collected_once(stub):
+    deduped, _ = naver_land.collect_dong_listings(DONG_CODE, DONG_NAME, 'APT', sink=QuietSink())
+    everything, _ = naver_land.collect_dong_listings(DONG_CODE, DONG_NAME, 'APT', sink=QuietSink(), dedup=False)
+    assert len(everything) > len(deduped)
+    assert len({row['articleNumber'] for row in deduped}) == len(deduped)
+    keys = {(row['complexNo'], row['매물명'], row['floorInfo'], row['exclusiveSpace'], row['dealPrice']) for row in deduped}
+    assert len(keys) == len(deduped)
+
+
+def test_complex_shared_by_dongs_is_collected_once(fixtures, collect_region):
+    shared = share_complexes(fixtures)
+    _, _, rows = collect_region('APT')
+    by_complex = {}
+    for row in rows:
+        by_complex.setdefault(row['complexNo'], set()).add(row['dong_code'])
+    assert len(by_complex) == 6
+    assert all(len(dong_codes) == 1 for dong_codes in by_complex.values())
+
+    _, _, everything = collect_region('APT', resume=False, dedup=False)
+    assert {row['dong_code'] for row in everything if row['complexNo'] == shared[0]['complexNo']} == {dong_code for dong_code, _ in DONGS}
+
+
+def test_failed_complex_is_retried_by_neighbouring_dong(stub, fixtures):
+    shared = share_complexes(fixtures)
+    failed = shared[0]['complexNo']
+    response = fixtures.responses.pop(fixture_key(COMPLEX_INFO_URL.format(failed)))
+    dedup = ListingDeduplicator()
+    first, _ = naver_land.collect_dong_listings(DONG_CODE, DONG_NAME, 'APT', sink=QuietSink(), dedup=dedup)
+    assert failed not in {row['complexNo'] for row in first}
+
+    fixtures.responses[fixture_key(COMPLEX_INFO_URL.format(failed))] = response
+    second, _ = naver_land.collect_dong_listings(*DONGS[1], 'APT', sink=QuietSink(), dedup=dedup)
+    complexes = {row['complexNo'] for row in second}
+    assert failed in complexes
+    assert not complexes & {apt_info['complexNo'] for apt_info in shared[1:]}
+
+
+@pytest.mark.parametrize('property_type', ['APT', 'VL'])
+def test_truncated_list_raises(stub, fixtures, property_type):
+    truncate(fixtures, property_type, DONG_CODE)
+    with pytest.raises(naver_land.IncompleteListError):
+        naver_land.collect_dong_listings(DONG_CODE, DONG_NAME, property_type, sink=QuietSink())
+
+
+@pytest.mark.parametrize('property_type', ['APT', 'VL'])
+def test_truncated_dong_is_failed_and_retried_on_resume(fixtures, collect_region, property_type):
+    url, response = truncate(fixtures, property_type, DONG_CODE)
+    _, checkpoint, _ = collect_region(property_type)
+    assert list(checkpoint.state['failed']) == [DONG_CODE]
+    assert list(checkpoint.state['done']) == [DONGS[1][0]]
+
+    fixtures.responses[fixture_key(url)] = response
+    _, checkpoint, rows = collect_region(property_type)
+    assert checkpoint.state['failed'] == {}
+    assert sorted(checkpoint.state['done']) == [dong_code for dong_code, _ in DONGS]
+    assert {row['dong_code'] for row in rows} == {dong_code for dong_code, _ in DONGS}
+
+
+@pytest.mark.parametrize('property_type', ['APT', 'VL'])
+def test_full_list_raises_on_truncation(stub, fixtures, property_type):
+    get_list = naver_land.get_apt_list if property_type == 'APT' else naver_land.get_vl_list
+    complete = get_list(DONG_CODE, sink=QuietSink())
+    assert len(complete) > 0
+
+    truncate(fixtures, property_type, DONG_CODE)
+    with pytest.raises(naver_land.IncompleteListError):
+        get_list(DONG_CODE, sink=QuietSink())
+
+
+def test_collect_scopes_keep_stats_and_rate_per_job(stub):
+    scopes = {}
+
+    def collect(dong_code, dong_name, requests_per_second):
+        with naver_land.collect_scope(requests_per_second) as scope:
+            naver_land.collect_dong_listings(dong_code, dong_name, 'APT', sink=QuietSink())
+        scopes[dong_code] = scope
+
+    threads = [threading.Thread(target=collect, args=(dong_code, dong_name, 500.0 + index))
+               for index, (dong_code, dong_name) in enumerate(DONGS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert naver_land.rate_limiter.requests_per_second == 1000.0
+    for index, (dong_code, _) in enumerate(DONGS):
+        summary = scopes[dong_code].metrics.summary()
+        assert summary['counters']['dongs'] == 1
+        assert summary['counters']['complexes'] == 3
+        # 단지 목록 1 + 단지별 정보/매물 페이지 2 x 3
+        assert sum(endpoint['requests'] for endpoint in summary['endpoints'].values()) == 7
+        rate_stats = scopes[dong_code].rate_limiter.stats()
+        assert sum(host_stats['requests'] for host_stats in rate_stats.values()) == 7
+        assert rate_stats['fin.land.naver.com']['rate'] >= 500.0 + index
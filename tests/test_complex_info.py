@@ -0,0 +1,46 @@
+import pytest
+
+import naver_land
+from benchmarks.fixtures import COMPLEX_INFO_URL, HTML_TYPE, _complex_info_html
+from complex_info import ComplexInfoParseError, parse_complex_info, parse_complex_info_bs4
+from progress_sink import QuietSink
+from tests.conftest import DONGS
+
+PAGE = _complex_info_html('1001', '샘플단지', padding=0)
+TERMS = ['전용면적', '세대수', '없는 항목']
+
+
+class RecordingSink(QuietSink):
+    def __init__(self):
+        self.errors = []
+
+    def error(self, message):
+        self.errors.append(message)
+
+
+@pytest.mark.parametrize('parse', [parse_complex_info, parse_complex_info_bs4])
+def test_parses_name_and_requested_terms(parse):
+    assert parse(PAGE.encode('utf-8'), TERMS) == ('샘플단지', {'전용면적': '84.97㎡', '세대수': '1,200세대'})
+
+
+@pytest.mark.parametrize('parse', [parse_complex_info, parse_complex_info_bs4])
+@pytest.mark.parametrize('old, new', [
+    ('ComplexSummary_name__', 'ComplexSummary_title__'),
+    ('DataList_item__', 'DataList_row__'),
+    ('DataList_term__', 'DataList_label__'),
+])
+def test_changed_markup_fails_loudly(parse, old, new):
+    with pytest.raises(ComplexInfoParseError):
+        parse(PAGE.replace(old, new), TERMS, source='test')
+
+
+def test_unparsable_complex_fails_only_that_complex(stub, fixtures):
+    dong_code, dong_name = DONGS[0]
+    broken = str(int(dong_code[-5:]) * 1000)
+    fixtures.add(COMPLEX_INFO_URL.format(broken), PAGE.replace('DataList_term__', 'DataList_label__'), content_type=HTML_TYPE)
+
+    sink = RecordingSink()
+    listings, _ = naver_land.collect_dong_listings(dong_code, dong_name, 'APT', sink=sink)
+    complexes = {row['complexNo'] for row in listings}
+    assert broken not in complexes and len(complexes) == 2
+    assert len(sink.errors) == 1 and broken in sink.errors[0]
@@ -0,0 +1,52 @@
+import csv
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from export_writer import StreamingExporter
+
+COLUMNS = ['name', 'price', 'tags']
+
+
+def read_csv(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+def test_writes_rows_and_frames_to_every_format(tmp_path):
+    with StreamingExporter(str(tmp_path / 'out' / 'listings'), COLUMNS, batch_size=2) as exporter:
+        exporter.write_row({'name': '역삼 래미안', 'price': 1_2000_0000, 'tags': ['역세권', '신축'], 'ignored': 1})
+        exporter.write_rows([{'name': 'a'}, {'name': 'b', 'price': float('nan')}])
+        exporter.write_frame(pd.DataFrame({'price': [3, None], 'name': ['c', 'd'], 'extra': [0, 0]}))
+    assert exporter.row_count == 5
+
+    rows = read_csv(exporter.paths['csv'])
+    assert rows[0] == COLUMNS
+    assert rows[1] == ['역삼 래미안', '120000000', '["역세권", "신축"]']
+    # 없는 컬럼/NaN 은 빈 값
+    assert rows[2:] == [['a', '', ''], ['b', '', ''], ['c', '3.0', ''], ['d', '', '']]
+
+    table = pq.read_table(exporter.paths['parquet']).to_pydict()
+    assert table['name'] == ['역삼 래미안', 'a', 'b', 'c', 'd']
+    assert table['price'] == ['120000000', None, None, '3.0', None]
+
+
+def test_xlsx_rows(tmp_path):
+    openpyxl = pytest.importorskip('openpyxl')
+    with StreamingExporter(str(tmp_path / 'listings'), COLUMNS, formats=('xlsx',)) as exporter:
+        exporter.write_row({'name': '역삼 래미안', 'price': 1_2000_0000, 'tags': ['역세권']})
+        exporter.write_row({'name': '=1+1'})
+
+    sheet = openpyxl.load_workbook(exporter.paths['xlsx'], read_only=True).active
+    values = [list(row) for row in sheet.iter_rows(values_only=True)]
+    # 수식처럼 보이는 값도 문자열 그대로
+    assert values == [COLUMNS, ['역삼 래미안', 120000000, '["역세권"]'], ['=1+1', None, None]]
+
+
+def test_selected_formats_only(tmp_path):
+    with StreamingExporter(str(tmp_path / 'listings'), COLUMNS, formats=('csv',)) as exporter:
+        exporter.write_row({'name': '=1+1'})
+    assert set(exporter.paths) == {'csv'}
+    assert not (tmp_path / 'listings.xlsx').exists()
+    assert read_csv(exporter.paths['csv'])[1] == ['=1+1', '', '']
@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+
+from filters import FilterSpec
+
+
+def test_only_sale_listings_can_be_collected():
+    assert FilterSpec().trade_types == ('A1',)
+    for trade_types in (['B1'], ['A1', 'B2'], []):
+        with pytest.raises(ValueError):
+            FilterSpec(trade_types=trade_types)
+
+
+def test_default_spec_and_key():
+    assert FilterSpec().is_default
+    assert FilterSpec().key() == ''
+    spec = FilterSpec(price_min=3_0000_0000)
+    assert not spec.is_default
+    assert spec.key() == FilterSpec(price_min=3_0000_0000).key() != FilterSpec(price_min=4_0000_0000).key()
+    assert spec == FilterSpec(price_min=3_0000_0000)
+    assert hash(spec) == hash(FilterSpec(price_min=3_0000_0000))
+
+
+def test_vl_query_rounds_prices_to_man_won_and_sends_area_lower_bound():
+    query = FilterSpec(price_min=1_2345_6789, area_min=59.9, area_max=85).vl_query()
+    assert query == {'tradeType': 'A1', 'priceMin': 12345, 'priceMax': 900000000, 'areaMin': 59}
+    assert FilterSpec().vl_query() == {'tradeType': 'A1'}
+
+
+def test_complex_mask_drops_unknown_values_only_when_limited():
+    complexes = pd.DataFrame({'buildYear': [1990, 2010, None], 'totalHouseholdCount': [500, 100, 300]})
+    assert FilterSpec(build_year_min=2000).complex_mask(complexes).tolist() == [False, True, False]
+    assert FilterSpec(households_min=200).complex_mask(complexes).tolist() == [True, False, True]
+    assert FilterSpec().complex_mask(complexes).all()
+
+
+def test_vl_mask_checks_trade_type_price_and_area():
+    articles = pd.DataFrame({
+        'tradeTypeCode': ['A1', 'A1', 'B2', 'A1'],
+        'dealOrWarrantPrc': ['3억 5,000', '5억', '1,000/50', '2억'],
+        'area2': [45.2, 45.2, 45.2, 30.0],
+    })
+    spec = FilterSpec(price_max=4_0000_0000, area_min=40)
+    assert spec.vl_mask(articles).tolist() == [True, False, False, False]
+
+
+def test_accepts_article():
+    spec = FilterSpec(price_min=3_0000_0000, area_max=85)
+    assert spec.accepts_article('A1', 3_5000_0000, 84.97)
+    assert not spec.accepts_article('B1', 3_5000_0000, 84.97)
+    assert not spec.accepts_article('A1', 2_0000_0000, 84.97)
+    assert not spec.accepts_article('A1', None, 84.97)
+    assert FilterSpec().accepts_article('A1', None, None)
@@ -0,0 +1,48 @@
+from front_api import ComplexArticles, ComplexListings
+
+COMPLEX_INFO = {'complexNo': '100', 'complexName': '샘플아파트'}
+
+
+def front_item(article_number, floor_info='3/15', trade_type='A1', deal_price=1_2300_0000):
+    return {
+        'representativeArticleInfo': {
+            'articleNumber': article_number, 'complexName': '샘플아파트', 'dongName': '101동', 'tradeType': trade_type,
+            'spaceInfo': {'exclusiveSpace': 84.97, 'supplySpace': 112.4, 'nameType': 'A'},
+            'articleDetail': {'floorInfo': floor_info, 'articleFeatureDescription': '남향', 'direction': 'SS'},
+            'priceInfo': {'dealPrice': deal_price}, 'brokerageName': '샘플부동산',
+            'articleMediaDto': {'imageUrl': 'https://img/sample.jpg'},
+        },
+        'duplicatedArticlesInfo': None,
+    }
+
+
+def test_rows_merge_complex_info_and_extra():
+    complex_articles = ComplexArticles(COMPLEX_INFO)
+    complex_articles.add_page([front_item('1'), front_item('2', trade_type='B1')])
+    rows = list(complex_articles.iter_rows(dong_code='1168010100'))
+    assert len(rows) == 1
+    assert rows[0]['complexNo'] == '100'
+    assert rows[0]['층수'] == '3/15층'
+    assert rows[0]['dealPrice'] == 1_2300_0000
+    assert rows[0]['dong_code'] == '1168010100'
+
+
+def test_missing_floor_info_is_exported_as_none():
+    complex_articles = ComplexArticles(COMPLEX_INFO)
+    complex_articles.add_page([front_item('1', floor_info=None)])
+    rows = list(complex_articles.iter_rows())
+    assert rows[0]['층수'] is None
+    assert rows[0]['floorInfo'] is None
+
+
+def test_listings_skip_empty_complexes():
+    listings = ComplexListings()
+    listings.add(None)
+    listings.add(ComplexArticles(COMPLEX_INFO))
+    assert not listings and len(listings) == 0
+
+    complex_articles = ComplexArticles(COMPLEX_INFO)
+    complex_articles.add_page([front_item('1'), front_item('2')])
+    listings.add(complex_articles, dong_name='스텁동')
+    assert len(listings) == 2
+    assert [row['dong_name'] for row in listings] == ['스텁동', '스텁동']
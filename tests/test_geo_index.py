@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from geo_index import GeoIndex, haversine_m, tile_bounds, tiles_for_bbox
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(0)
+    latitudes = rng.uniform(37.45, 37.65, 5_000)
+    longitudes = rng.uniform(126.85, 127.10, 5_000)
+    # 좌표가 없는 행은 인덱스에서 빠진다
+    latitudes[:10] = np.nan
+    return latitudes, longitudes
+
+
+def test_haversine_known_distance():
+    # 위도 1도 ≈ 111.2km
+    assert haversine_m(37.0, 127.0, np.array([38.0]), np.array([127.0]))[0] == pytest.approx(111_195, rel=1e-3)
+    assert haversine_m(37.5, 127.0, np.array([37.5]), np.array([127.0]))[0] == 0
+
+
+@pytest.mark.parametrize('radius_m', [100, 500, 3_000])
+def test_within_matches_full_scan(points, radius_m):
+    latitudes, longitudes = points
+    index = GeoIndex(latitudes, longitudes, cell_m=250)
+    assert len(index) == 4_990
+    for latitude, longitude in [(37.55, 126.98), (37.451, 126.851), (37.70, 127.20)]:
+        positions, distances = index.within(latitude, longitude, radius_m, with_distance=True)
+        expected = np.flatnonzero(haversine_m(latitude, longitude, latitudes, longitudes) <= radius_m)
+        assert set(positions) == set(expected)
+        assert np.all(np.diff(distances) >= 0)
+
+
+def test_in_bbox_matches_full_scan(points):
+    latitudes, longitudes = points
+    index = GeoIndex(latitudes, longitudes)
+    south, west, north, east = 37.50, 126.90, 37.52, 126.95
+    expected = np.flatnonzero((latitudes >= south) & (latitudes <= north) & (longitudes >= west) & (longitudes <= east))
+    assert np.array_equal(index.in_bbox(south, west, north, east), expected)
+    assert len(index.in_bbox(10.0, 10.0, 10.1, 10.1)) == 0
+
+
+def test_frame_queries_return_rows():
+    frame = pd.DataFrame({'article_no': ['a', 'b', 'c', 'd'], 'latitude': [37.5, 37.501, 37.6, None],
+                          'longitude': [127.0, 127.0, 127.0, 127.0]})
+    index = GeoIndex.from_frame(frame)
+    nearby = index.frame_within(37.5, 127.0, 500)
+    assert nearby['article_no'].tolist() == ['a', 'b']
+    assert nearby['distance_m'].iloc[1] == pytest.approx(111.2, rel=1e-2)
+    assert index.frame_in_bbox(37.55, 126.9, 37.65, 127.1)['article_no'].tolist() == ['c']
+
+
+def test_empty_index():
+    index = GeoIndex([], [])
+    assert len(index) == 0
+    assert len(index.within(37.5, 127.0, 1_000)) == 0
+
+
+def test_tiles_cover_bbox():
+    south, west, north, east = 37.49, 126.98, 37.52, 127.03
+    tiles = tiles_for_bbox(south, west, north, east, 15)
+    bounds = [tile_bounds(*tile) for tile in tiles]
+    assert min(b[0] for b in bounds) <= south and max(b[2] for b in bounds) >= north
+    assert min(b[1] for b in bounds) <= west and max(b[3] for b in bounds) >= east
+    tile_south, tile_west, tile_north, tile_east = tile_bounds(*tiles[0])
+    assert tile_south < tile_north and tile_west < tile_east
+    assert tiles_for_bbox(*tile_bounds(15, 27948, 12701), 15)[0] == (15, 27948, 12701)
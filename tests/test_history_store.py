@@ -0,0 +1,60 @@
+import os
+from datetime import datetime
+
+import pyarrow.dataset as ds
+
+from history_store import ListingHistoryStore, parse_floor
+
+APT_LISTING = {'articleNumber': 101, 'complexNo': '1001', '매물명': '래미안 101동', '거래방식': '매매', 'dealPrice': 1_2000_0000,
+               'exclusiveSpace': '84.9', 'supplySpace': '112.4', 'floorInfo': '5/15', '방향': '남향', '중개업체': '샘플',
+               'dong_code': '1168010100', 'dong_name': '역삼동'}
+VL_LISTING = {'articleNo': '201', 'articleName': '빌라', 'tradeTypeName': '매매', 'dealOrWarrantPrc': '3억 5,000', 'area1': '59.5',
+              'area2': '45.2', 'floorInfo': 'B1/4', 'realtorName': '샘플', 'dong_code': '1168010100', 'dong_name': '역삼동',
+              'latitude': '37.5', 'longitude': '127.03'}
+
+
+def test_parse_floor():
+    assert parse_floor('5/15') == (5, 15)
+    assert parse_floor('고/20') == (None, 20)
+    assert parse_floor('B1/4층') == (-1, 4)
+    assert parse_floor(None) == (None, None)
+
+
+def test_append_writes_partitioned_numeric_rows(tmp_path):
+    store = ListingHistoryStore(str(tmp_path / 'history'), batch_size=1)
+    collected_at = datetime(2025, 1, 2, 3, 4, 5, 678)
+    assert store.append('APT', iter([APT_LISTING]), '서울특별시', '강남구', collected_at=collected_at) == 1
+    assert store.append('VL', [VL_LISTING, dict(VL_LISTING, articleNo='202', dong_code=None)], '서울특별시', '강남구',
+                        collected_at=collected_at) == 2
+    assert os.path.isdir(tmp_path / 'history' / 'property_type=APT' / 'collected_date=2025-01-02' / 'sigungu_code=11680')
+
+    df = store.read().sort_values('article_no').reset_index(drop=True)
+    assert df['article_no'].tolist() == ['101', '201', '202']
+    assert df['deal_price'].tolist() == [1_2000_0000, 3_5000_0000, 3_5000_0000]
+    assert df['exclusive_area'].tolist() == [84.9, 45.2, 45.2]
+    assert df.loc[1, ['floor', 'total_floor', 'floor_label']].tolist() == [-1, 4, 'B1/4']
+    assert df.loc[0, 'collected_at'] == datetime(2025, 1, 2, 3, 4, 5)
+    # dong_code 가 없으면 시군구 파티션은 빈 값
+    assert df['sigungu_code'].tolist() == ['11680', '11680', '']
+
+    apt = store.read(filters=ds.field('property_type') == 'APT')
+    assert apt['complex_no'].tolist() == ['1001']
+
+
+def test_read_without_history_is_empty(tmp_path):
+    df = ListingHistoryStore(str(tmp_path / 'missing')).read()
+    assert df.empty and 'deal_price' in df.columns
+
+
+def test_price_trend_and_geo_index(tmp_path):
+    store = ListingHistoryStore(str(tmp_path / 'history'))
+    store.append('APT', [APT_LISTING, dict(APT_LISTING, articleNumber=102, dealPrice=1_4000_0000)], '서울', '강남구',
+                 collected_at=datetime(2025, 1, 2))
+    store.append('APT', [APT_LISTING], '서울', '강남구', collected_at=datetime(2025, 2, 2))
+    trend = store.price_trend(by='complex_no')
+    assert trend['deal_price'].tolist() == [1_3000_0000, 1_2000_0000]
+    assert trend['listings'].tolist() == [2, 1]
+
+    store.append('VL', [VL_LISTING], '서울', '강남구', collected_at=datetime(2025, 1, 2))
+    index = store.geo_index(filters=ds.field('property_type') == 'VL', columns=['article_no'])
+    assert index.frame_within(37.5, 127.03, 100)['article_no'].tolist() == ['201']
@@ -0,0 +1,82 @@
+import threading
+import time
+
+import pytest
+
+from job_runner import DONE, FAILED, QUEUED, JobConflictError, JobRegistry
+
+TIMEOUT = 5
+
+
+# release 가 set 될 때까지 끝나지 않는 작업 (started 로 시작 여부 확인)
+class BlockingTask:
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, sink, value=None):
+        sink.status(f'{value} 수집중')
+        self.started.set()
+        assert self.release.wait(TIMEOUT)
+        return value
+
+
+def wait_done(job):
+    for _ in range(TIMEOUT * 100):
+        if not job.active:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f'{job.key} did not finish')
+
+
+def test_jobs_run_in_parallel_and_queue_beyond_max_workers():
+    registry = JobRegistry(max_workers=2)
+    tasks = [BlockingTask() for _ in range(3)]
+    jobs = [registry.submit(('1168010100', index), task, {'value': index}) for index, task in enumerate(tasks)]
+    assert tasks[0].started.wait(TIMEOUT) and tasks[1].started.wait(TIMEOUT)
+    assert jobs[2].state == QUEUED
+    assert registry.queue_position(jobs[2]) == 1
+    assert registry.queue_position(jobs[0]) is None
+
+    tasks[0].release.set()
+    assert tasks[2].started.wait(TIMEOUT)
+    for task in tasks:
+        task.release.set()
+    assert [wait_done(job).result for job in jobs] == [0, 1, 2]
+    assert all(job.state == DONE for job in jobs)
+
+
+def test_same_options_attach_and_different_options_are_rejected():
+    registry = JobRegistry()
+    task = BlockingTask()
+    key = ('1168010100', 'APT')
+    job = registry.submit(key, task, {'value': 1})
+    assert registry.submit(key, task, {'value': 1}) is job
+    assert job.requests == 2
+    with pytest.raises(JobConflictError) as conflict:
+        registry.submit(key, task, {'value': 2})
+    assert conflict.value.job is job
+
+    task.release.set()
+    wait_done(job)
+    assert job.options == {'value': 1}
+    # 끝난 작업은 같은 옵션이면 재사용, 다른 옵션이나 force 는 새로 실행
+    assert registry.submit(key, task, {'value': 1}) is job
+    rerun = registry.submit(key, task, {'value': 2})
+    assert rerun is not job
+    assert wait_done(rerun).result == 2
+    assert wait_done(registry.submit(key, task, {'value': 2}, force=True)) is not rerun
+
+
+def test_failed_job_keeps_error_and_messages():
+    def fail(sink):
+        sink.warning('일부 단지를 건너뜁니다.')
+        raise RuntimeError('boom')
+
+    registry = JobRegistry()
+    job = wait_done(registry.submit('key', fail))
+    snapshot = job.snapshot()
+    assert job.state == FAILED
+    assert str(job.error) == 'boom'
+    assert snapshot['messages'] == [('warning', '일부 단지를 건너뜁니다.')]
+    assert registry.submit('key', fail) is not job
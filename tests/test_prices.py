@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+
+import naver_land
+import prices
+from prices import format_amount, format_prices, parse_price, parse_prices
+
+TEXTS = ['3억 5,000', '1.5억', '5,000', '12억', '3억 5,000만원', '1,000/50', '2억/100', '협의', '']
+EXPECTED = [350000000, 150000000, 50000000, 1200000000, 350000000, None, None, None, None]
+
+
+@pytest.mark.parametrize('text, expected', list(zip(TEXTS, EXPECTED)))
+def test_parse_price(text, expected):
+    assert parse_price(text) == expected
+
+
+def test_parse_price_numbers_are_won():
+    assert parse_price(123_000_000) == 123_000_000
+    assert parse_price(float('nan')) is None
+    assert parse_price(None) is None
+
+
+@pytest.mark.parametrize('vectorized', [True, False])
+def test_parse_prices_matches_parse_price(monkeypatch, vectorized):
+    if not vectorized:
+        monkeypatch.setattr(prices, 'pc', None)
+    elif prices.pc is None:
+        pytest.skip('pyarrow is not installed')
+    values = TEXTS + [120_000_000, None]
+    parsed = parse_prices(values)
+    assert str(parsed.dtype) == 'Int64'
+    assert [None if pd.isna(value) else value for value in parsed] == EXPECTED + [120_000_000, None]
+
+
+@pytest.mark.parametrize('amount, text', [(350_000_000, '3억 5,000만'), (1_200_000_000, '12억'), (50_000_000, '5000만'),
+                                          (35_000, '3만'), (1_234, '1,234원')])
+def test_format_amount(amount, text):
+    assert format_amount(amount) == text
+    assert format_prices([amount]).tolist() == [text]
+
+
+def test_format_prices_keeps_missing_values():
+    formatted = format_prices(pd.Series([350_000_000, None, pd.NA], dtype=object))
+    assert formatted.iloc[0] == '3억 5,000만'
+    assert formatted.iloc[1:].isna().all()
+
+
+def test_vl_frame_keeps_price_text_and_leaves_rent_unparsed():
+    listings = [{'articleNo': '1', 'dealOrWarrantPrc': '3억 5,000'}, {'articleNo': '2', 'dealOrWarrantPrc': '1,000/50'}]
+    df = naver_land.result_frame('VL', listings, '서울시', '강남구', '역삼동')
+    assert df['매매가'].tolist() == ['3억 5,000', '1,000/50']
+    assert df[naver_land.PRICE_COLUMN].iloc[0] == 350_000_000
+    assert pd.isna(df[naver_land.PRICE_COLUMN].iloc[1])
@@ -0,0 +1,39 @@
+import pandas as pd
+
+from benchmarks.region_hierarchy import build_region_hierarchy_legacy
+from public_reader import build_region_hierarchy, update_region_hierarchy
+
+COLUMNS = ['시도코드', '시도명', '시군구코드', '시군구명', '법정동코드', '읍면동명']
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+ROWS = [
+    ('26', '부산광역시', '26110', '중구', '2611010100', '영주동'),
+    ('11', '서울특별시', '11680', '강남구', '1168010300', '개포동'),
+    ('11', '서울특별시', '11110', '종로구', '1111010100', '청운동'),
+    ('11', '서울특별시', '11680', '강남구', '1168010100', '역삼동'),
+    ('11', '서울특별시', None, None, '1100000000', '서울'),
+]
+
+
+def test_build_region_hierarchy_groups_rows_like_groupby():
+    hierarchy = build_region_hierarchy(frame(ROWS))
+    assert hierarchy == build_region_hierarchy_legacy(frame(ROWS))
+    assert [si_do['si_do_name'] for si_do in hierarchy] == ['서울특별시', '부산광역시']
+    seoul = hierarchy[0]['sigungu']
+    assert [sigungu['sigungu_code'] for sigungu in seoul] == ['11110', '11680']
+    # 같은 시군구 안에서는 원래 행 순서 유지
+    assert seoul[1]['eup_myeon_dong'] == [{'code': '1168010300', 'name': '개포동'}, {'code': '1168010100', 'name': '역삼동'}]
+    assert build_region_hierarchy(frame([])) == []
+
+
+def test_update_region_hierarchy_rebuilds_only_changed_sigungu():
+    hierarchy = build_region_hierarchy(frame(ROWS))
+    # 역삼동 폐지, 강남구에 삼성동 추가
+    rows = [row for row in ROWS if row[4] != '1168010100'] + [('11', '서울특별시', '11680', '강남구', '1168010500', '삼성동')]
+    updated = update_region_hierarchy(hierarchy, frame(rows), ['1168010100', '1168010500'])
+    assert updated == build_region_hierarchy(frame(rows))
+    assert updated[0]['sigungu'][0] is hierarchy[0]['sigungu'][0]
@@ -0,0 +1,92 @@
+import pytest
+
+import rate_limiter
+from rate_limiter import AdaptiveRateLimiter, HostRateLimiter
+
+URL = 'https://fin.land.naver.com/front-api/v1/complex/article/list'
+OTHER_URL = 'https://new.land.naver.com/api/regions/list'
+HOST, OTHER_HOST = 'fin.land.naver.com', 'new.land.naver.com'
+
+
+# time.monotonic / time.sleep 을 가짜 시계로 바꾼다 (sleep 은 시계를 앞으로 돌린다)
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, 'time', fake)
+    return fake
+
+
+def test_host_limiter_spaces_requests_per_host(clock):
+    limiter = HostRateLimiter(requests_per_second=4)
+    for _ in range(3):
+        limiter.acquire(URL)
+    limiter.acquire(OTHER_URL)
+    assert clock.sleeps == [0.25, 0.25]
+
+
+def test_host_limiter_disabled_without_rate(clock):
+    limiter = HostRateLimiter(requests_per_second=0)
+    for _ in range(3):
+        limiter.acquire(URL)
+    assert clock.sleeps == []
+
+
+def test_adaptive_limiter_increases_after_healthy_streak(clock):
+    limiter = AdaptiveRateLimiter(requests_per_second=2, max_rate=3, increase_step=0.5, increase_every=3)
+    for _ in range(9):
+        limiter.record(URL, status=200, elapsed=0.1)
+    stats = limiter.stats()[HOST]
+    assert stats['rate'] == 3
+    assert stats['increases'] == 2
+    assert stats['requests'] == 9
+    assert stats['avg_latency_ms'] == 100.0
+
+
+def test_adaptive_limiter_halves_and_pauses_on_throttle(clock):
+    limiter = AdaptiveRateLimiter(requests_per_second=4, min_rate=1, cooldown=2.0)
+    limiter.record(URL, status=429, retry_after=5)
+    # cooldown 안의 두 번째 차단은 속도를 다시 줄이지 않는다
+    limiter.record(URL, error='timeout')
+    stats = limiter.stats()[HOST]
+    assert stats['rate'] == 2
+    assert stats['decreases'] == 1
+    assert (stats['throttled'], stats['timeouts']) == (1, 1)
+
+    limiter.acquire(URL)
+    assert clock.sleeps == [5.0]
+
+    clock.now += 2.0
+    limiter.record(URL, status=403)
+    limiter.record(URL, status=403)
+    assert limiter.stats()[HOST]['rate'] == 1
+
+
+def test_adaptive_limiter_server_errors_keep_rate(clock):
+    limiter = AdaptiveRateLimiter(requests_per_second=2, increase_every=2)
+    limiter.record(URL, status=200)
+    limiter.record(URL, status=500)
+    limiter.record(URL, status=200)
+    stats = limiter.stats()[HOST]
+    assert (stats['rate'], stats['errors'], stats['increases']) == (2, 1, 0)
+
+
+def test_adaptive_limiter_start_rate_resets_hosts(clock):
+    limiter = AdaptiveRateLimiter(requests_per_second=2)
+    limiter.record(URL, status=429)
+    limiter.requests_per_second = 8
+    assert limiter.stats()[HOST]['rate'] == 8
+    limiter.acquire(OTHER_URL)
+    assert limiter.stats()[OTHER_HOST]['rate'] == 8
@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from district_converter import DistrictConverter
+from region_index import DONG, SIDO, SIGUNGU, RegionIndex
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DISTRICTS = [
+    {'si_do_code': '11', 'si_do_name': '서울특별시', 'sigungu': [
+        {'sigungu_code': '11680', 'sigungu_name': '강남구', 'eup_myeon_dong': [
+            {'code': '1168010100', 'name': '역삼동'}, {'code': '1168010300', 'name': '개포동'}]},
+        {'sigungu_code': '11110', 'sigungu_name': '종로구', 'eup_myeon_dong': [{'code': '1111010100', 'name': '청운동'}]},
+    ]},
+    {'si_do_code': '26', 'si_do_name': '부산광역시', 'sigungu': [
+        {'sigungu_code': '26110', 'sigungu_name': '중구', 'eup_myeon_dong': [{'code': '2611010100', 'name': '영주동'}]},
+        # 다른 시도 아래 잘못 묶인 중복 항목은 버린다
+        {'sigungu_code': '11680', 'sigungu_name': '강남구', 'eup_myeon_dong': []},
+    ]},
+]
+
+
+@pytest.fixture
+def index():
+    return RegionIndex.from_hierarchy(DISTRICTS)
+
+
+def test_lookup_by_code_and_name(index):
+    assert len(index) == 9
+    assert index.get('1168010100').name == '역삼동'
+    assert index.get('11680').level == SIGUNGU
+    assert index.get('9999') is None
+    assert [region.code for region in index.find('중구', level=SIGUNGU)] == ['26110']
+    assert index.find_one('부산광역시').code == '26'
+    assert index.child('11', '종로구').code == '11110'
+
+
+def test_navigation_keeps_code_order_and_drops_misfiled_entries(index):
+    assert [region.name for region in index.sido_list()] == ['서울특별시', '부산광역시']
+    assert [region.code for region in index.children('11')] == ['11110', '11680']
+    assert [region.code for region in index.children('26')] == ['26110']
+    assert [region.code for region in index.descendants('11', level=DONG)] == ['1111010100', '1168010100', '1168010300']
+    assert index.parent('1168010100').code == '11680'
+    assert [region.code for region in index.ancestors('1168010100')] == ['11', '11680']
+
+
+def test_search_substring_and_prefix(index):
+    assert [region.name for region in index.search('광역', level=SIDO)] == ['부산광역시']
+    assert [region.code for region in index.search('역', level=DONG)] == ['1168010100']
+    assert [region.name for region in index.search('개', level=DONG, prefix=True)] == ['개포동']
+
+
+def test_district_converter_keeps_sigungu_list_and_adds_code_lookup(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    converter = DistrictConverter()
+    assert converter.get_si_do_name('서울') == '서울특별시'
+    assert converter.find_si_do_code('서울') == '11'
+    sigungu = converter.get_si_do_code('서울')
+    assert {'sigungu_code': '11680', 'sigungu_name': '강남구'}.items() <= next(
+        item for item in sigungu if item['sigungu_code'] == '11680').items()
+    assert [item['sigungu_name'] for item in converter.get_sigungu_list('11', '강남')] == ['강남구']
+    assert converter.get_si_do_code('없는도') is None
@@ -0,0 +1,49 @@
+import json
+import os
+
+import pytest
+
+from region_index import DONG, RegionIndex, load_region_index
+from region_snapshot import load_region_snapshot, write_region_snapshot
+from tests.test_region_index import DISTRICTS
+
+
+def regions(index, code=None):
+    return [(region.level, region.code, region.name) for region in index.children(code)]
+
+
+def test_snapshot_round_trip(tmp_path):
+    index = RegionIndex.from_hierarchy(DISTRICTS)
+    path = str(tmp_path / 'district.rgn')
+    write_region_snapshot(index, path)
+    snapshot = load_region_snapshot(path)
+
+    assert len(snapshot) == len(index)
+    assert regions(snapshot) == regions(index)
+    for region in index.descendants(None, level=DONG) + index.sido_list():
+        assert regions(snapshot, region.code) == regions(index, region.code)
+        assert snapshot.get(region.code).name == region.name
+    assert [region.code for region in snapshot.find('중구', level='sigungu')] == ['26110']
+    assert [region.name for region in snapshot.search('개', level=DONG, prefix=True)] == ['개포동']
+
+
+def test_load_region_index_prefers_newer_snapshot(tmp_path):
+    json_path = tmp_path / 'district.json'
+    json_path.write_text(json.dumps(DISTRICTS, ensure_ascii=False), encoding='utf-8')
+    assert isinstance(load_region_index(str(json_path)).codes, list)
+
+    # 새 경로로 lru_cache 를 피한다
+    other_json = tmp_path / 'other.json'
+    other_json.write_text(json.dumps(DISTRICTS, ensure_ascii=False), encoding='utf-8')
+    write_region_snapshot(RegionIndex.from_hierarchy(DISTRICTS), str(tmp_path / 'other.rgn'))
+    os.utime(other_json, (0, 0))
+    index = load_region_index(str(other_json))
+    assert isinstance(index.codes, memoryview)
+    assert index.get('1168010100').name == '역삼동'
+
+
+def test_rejects_unknown_snapshot(tmp_path):
+    path = tmp_path / 'bad.rgn'
+    path.write_bytes(b'XXXX' + bytes(28))
+    with pytest.raises(ValueError):
+        load_region_snapshot(str(path))
@@ -0,0 +1,93 @@
+import json
+import time
+
+import pytest
+
+from progress_sink import QuietSink
+from region_tree import ROOT, NaverRegionTree, cortar_no
+from tests.test_region_index import DISTRICTS
+
+# 네이버 지역 목록 (강남구에 district.json 에 없는 동이 생기고 개포동이 빠진 경우)
+NAVER = {
+    ROOT: {'서울특별시': '1100000000', '부산광역시': '2600000000'},
+    '1100000000': {'강남구': '1168000000', '종로구': '1111000000'},
+    '2600000000': {'중구': '2611000000'},
+    '1168000000': {'역삼동': '1168010100', '신설동': '1168099900'},
+    '1111000000': {'청운동': '1111010100'},
+    '2611000000': {'영주동': '2611010100'},
+}
+
+
+@pytest.fixture
+def district_json(tmp_path):
+    path = tmp_path / 'district.json'
+    districts = json.loads(json.dumps(DISTRICTS))
+    # 시군구 자체 코드와 이름 없는 항목은 선택 목록에서 제외
+    districts[0]['sigungu'][0]['eup_myeon_dong'] += [{'code': '1168000000', 'name': '강남구'}, {'code': '1168010500', 'name': 'nan'}]
+    path.write_text(json.dumps(districts, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+def make_tree(tmp_path, district_json, fetch=None, **kwargs):
+    return NaverRegionTree(path=str(tmp_path / 'regions.json'), json_path=district_json, fetch=fetch or NAVER.__getitem__, **kwargs)
+
+
+def test_cortar_no_pads_district_codes():
+    assert cortar_no('11') == '1100000000'
+    assert cortar_no(11680) == '1168000000'
+
+
+def test_starts_from_district_json(tmp_path, district_json):
+    tree = make_tree(tmp_path, district_json)
+    assert tree.is_stale
+    assert tree.children() == {'서울특별시': '1100000000', '부산광역시': '2600000000'}
+    assert tree.children('1100000000') == {'강남구': '1168000000', '종로구': '1111000000'}
+    assert tree.children('1168000000') == {'역삼동': '1168010100', '개포동': '1168010300'}
+    assert tree.children('9999') == {}
+
+
+def test_refresh_saves_naver_tree_and_reconciles(tmp_path, district_json):
+    tree = make_tree(tmp_path, district_json).refresh(sink=QuietSink())
+    assert not tree.is_stale
+    assert tree.children('1168000000') == NAVER['1168000000']
+    assert tree.reconciliation == {'failed': [], 'naver_only': ['1168099900'], 'district_only': ['1168010300']}
+
+    reloaded = make_tree(tmp_path, district_json, fetch=lambda code: pytest.fail('saved tree should not fetch'))
+    assert reloaded.children_by_code == tree.children_by_code
+    assert reloaded.crawled_at == tree.crawled_at
+
+
+def test_failed_regions_fall_back_to_previous_tree_then_district_json(tmp_path, district_json):
+    def flaky(code):
+        if code in ('1168000000', '2611000000'):
+            raise ConnectionError('timeout')
+        return NAVER[code]
+
+    tree = make_tree(tmp_path, district_json, fetch=flaky)
+    tree.children_by_code['2611000000'] = {'영주동(이전)': '2611010100'}
+    tree.refresh(sink=QuietSink())
+    assert sorted(tree.reconciliation['failed']) == ['1168000000', '2611000000']
+    assert tree.children('1168000000') == {'역삼동': '1168010100', '개포동': '1168010300'}
+    assert tree.children('2611000000') == {'영주동(이전)': '2611010100'}
+
+    def root_down(code):
+        raise ConnectionError('down')
+
+    with pytest.raises(RuntimeError):
+        make_tree(tmp_path, district_json, fetch=root_down).crawl(sink=QuietSink())
+
+
+def test_ensure_fresh_refreshes_stale_tree_in_background(tmp_path, district_json):
+    tree = make_tree(tmp_path, district_json, max_age=60)
+    assert tree.ensure_fresh(sink=QuietSink()) is tree
+    tree._refresh_thread.join(5)
+    assert tree.children('1168000000') == NAVER['1168000000']
+
+    thread = tree._refresh_thread
+    tree.ensure_fresh(sink=QuietSink())
+    assert tree._refresh_thread is thread
+
+    tree.crawled_at = time.time() - 120
+    tree.ensure_fresh(sink=QuietSink())
+    assert tree._refresh_thread is not thread
+    tree._refresh_thread.join(5)
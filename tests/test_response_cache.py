@@ -0,0 +1,75 @@
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from naver_client import NaverClient
+from response_cache import ResponseCache
+
+ARTICLE_URL = 'https://new.land.naver.com/api/articles/123'
+
+
+def make_response(body=b'{"a": 1}', status=200, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers or {'content-type': 'application/json'})
+    response._content = body
+    return response
+
+
+def test_ttl_rules_match_endpoints(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'))
+    assert cache.ttl_for(ARTICLE_URL) == 3600
+    assert cache.ttl_for('https://new.land.naver.com/api/regions/list?cortarNo=1100000000') == 7 * 24 * 3600
+    assert cache.ttl_for('https://example.com/') is None
+    # 규칙을 확인하는 것만으로는 파일을 만들지 않는다
+    assert not (tmp_path / 'cache.sqlite').exists()
+
+
+def test_put_get_refresh(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'))
+    cache.put(ARTICLE_URL, make_response(headers={'content-type': 'application/json', 'etag': '"v1"', 'x-other': '1'}), ttl=60)
+    entry = cache.get(ARTICLE_URL)
+    assert entry['fresh'] and entry['body'] == b'{"a": 1}' and entry['etag'] == '"v1"'
+    assert entry['headers'] == {'content-type': 'application/json', 'etag': '"v1"'}
+
+    cache.put(ARTICLE_URL, make_response(), ttl=-1)
+    assert not cache.get(ARTICLE_URL)['fresh']
+    cache.refresh(ARTICLE_URL, ttl=60)
+    assert cache.get(ARTICLE_URL)['fresh']
+    assert cache.get('missing') is None
+    cache.close()
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'), max_bytes=25)
+    cache.put('a', make_response(b'x' * 10), ttl=60)
+    cache.put('b', make_response(b'x' * 10), ttl=60)
+    cache.get('a')
+    cache.put('c', make_response(b'x' * 10), ttl=60)
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.get('b') is None
+    cache.close()
+
+
+def test_client_serves_fresh_entries_and_revalidates_stale(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path / 'cache.sqlite'))
+    client = NaverClient(cache=cache)
+    sent = []
+
+    def fetch(url, params, referer, headers, timeout):
+        sent.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(client, '_fetch', fetch)
+    responses = [make_response(headers={'content-type': 'application/json', 'etag': '"v1"'})]
+    assert client.get(ARTICLE_URL).json() == {'a': 1}
+    assert client.get(ARTICLE_URL).from_cache
+    assert len(sent) == 1
+
+    # 만료된 항목은 ETag 로 재검증하고 304 이면 저장된 본문을 돌려준다
+    cache.put(ARTICLE_URL, make_response(headers={'content-type': 'application/json', 'etag': '"v1"'}), ttl=-1)
+    responses = [make_response(b'', status=304)]
+    assert client.get(ARTICLE_URL).json() == {'a': 1}
+    assert sent[-1]['if-none-match'] == '"v1"'
+    assert cache.get(ARTICLE_URL)['fresh']
+    client.close()
+    cache.close()
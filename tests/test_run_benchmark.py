@@ -0,0 +1,23 @@
+from benchmarks.run_benchmark import compare_baseline
+
+
+def result(scenario, collect_s, requests=10, listings=100):
+    return {'scenario': scenario, 'collect_s': collect_s, 'requests': requests, 'listings': listings}
+
+
+BASELINE = {'results': [result('small-APT', 1.0), result('small-APT', 0.8), result('small-VL', 2.0)]}
+
+
+def test_counts_are_gated_but_timings_only_reported_by_default():
+    assert compare_baseline([result('small-APT', 5.0), result('small-VL', 2.0)], BASELINE) == []
+    regressions = compare_baseline([result('small-APT', 0.8, requests=11), result('small-VL', 2.0, listings=99)], BASELINE)
+    assert len(regressions) == 2
+    assert regressions[0].startswith('small-APT: 요청 11건')
+    assert regressions[1].startswith('small-VL: 결과 99건')
+
+
+def test_timings_are_gated_with_tolerance():
+    assert compare_baseline([result('small-APT', 0.95)], BASELINE, tolerance=0.25) == []
+    regressions = compare_baseline([result('small-APT', 1.1), result('new-scenario', 9.0)], BASELINE, tolerance=0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith('small-APT: 수집 1.100s > 기준 0.800s')